@@ -0,0 +1,16 @@
+"""
+Бенчмарки сервисного слоя без интерфейса (PyQt не требуется)
+
+Генератор datagen создает базы со схемой приложения (миграции) на 1k/100k/1M задач,
+scenarios описывает замеры по методам сервисов, runner выполняет их и
+сохраняет результаты в JSON, который можно сравнивать между коммитами.
+"""
+from benchmarks.datagen import SIZES, generate_database, database_fingerprint
+from benchmarks.scenarios import SCENARIOS, Scenario, select_scenarios
+from benchmarks.runner import run_benchmarks, compare_results, load_results, save_results
+
+__all__ = [
+    'SIZES', 'generate_database', 'database_fingerprint',
+    'SCENARIOS', 'Scenario', 'select_scenarios',
+    'run_benchmarks', 'compare_results', 'load_results', 'save_results'
+]
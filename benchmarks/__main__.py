@@ -0,0 +1,129 @@
+"""
+Командная строка бенчмарков
+
+    python -m benchmarks generate --size 100k
+    python -m benchmarks run --size 100k --output results.json
+    python -m benchmarks compare base.json results.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+from benchmarks.datagen import DEFAULT_SEED, SIZES, generate_database
+from benchmarks.runner import (DEFAULT_ROUNDS, DEFAULT_THRESHOLD, DEFAULT_WARMUP, compare_results,
+                               load_results, run_benchmarks, save_results)
+from benchmarks.scenarios import select_scenarios
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def default_db_path(size, seed):
+    return os.path.join(DATA_DIR, f"kaban-{size}-{seed}.db")
+
+
+def _meta_path(db_path):
+    return db_path + '.json'
+
+
+def _generate(db_path, size, seed, anchor_date):
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    print(f"Генерация {size} ({SIZES[size]} задач, seed={seed}) в {db_path}...", flush=True)
+    dataset = generate_database(db_path, tasks=SIZES[size], seed=seed, anchor_date=anchor_date)
+    dataset['size'] = size
+    with open(_meta_path(db_path), 'w', encoding='utf-8') as f:
+        json.dump(dataset, f, ensure_ascii=False, indent=2)
+    print(f"Готово за {dataset['seconds']} с: {dataset['projects']} проектов, "
+          f"{dataset['developers']} разработчиков")
+    return dataset
+
+
+def _load_dataset(db_path):
+    if os.path.exists(_meta_path(db_path)):
+        with open(_meta_path(db_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'path': db_path}
+
+
+def cmd_generate(args):
+    _generate(args.db or default_db_path(args.size, args.seed), args.size, args.seed, args.anchor_date)
+    return 0
+
+
+def cmd_run(args):
+    db_path = args.db or default_db_path(args.size, args.seed)
+    if args.regenerate or not os.path.exists(db_path):
+        dataset = _generate(db_path, args.size, args.seed, args.anchor_date)
+    else:
+        dataset = _load_dataset(db_path)
+
+    scenarios = select_scenarios(args.only)
+    if not scenarios:
+        print("Нет сценариев, подходящих под фильтр", file=sys.stderr)
+        return 2
+
+    def progress(scenario, stats):
+        print(f"{scenario.name:<45} median {stats['median'] * 1000:10.2f} мс  "
+              f"min {stats['min'] * 1000:10.2f} мс  ({stats['rounds']} замеров)", flush=True)
+
+    results = run_benchmarks(db_path, scenarios, dataset=dataset, rounds=args.rounds,
+                             warmup=args.warmup, progress=progress)
+    if args.output:
+        save_results(results, args.output)
+        print(f"Результаты сохранены в {args.output}")
+    return 0
+
+
+def cmd_compare(args):
+    rows = compare_results(load_results(args.baseline), load_results(args.current),
+                           threshold=args.threshold, stat=args.stat)
+    for row in rows:
+        mark = '  РЕГРЕССИЯ' if row['regression'] else ''
+        print(f"{row['name']:<45} {row['baseline'] * 1000:10.2f} -> {row['current'] * 1000:10.2f} мс "
+              f"{row['change'] * 100:+7.1f}%{mark}")
+    regressions = [row for row in rows if row['regression']]
+    if regressions:
+        print(f"Регрессий: {len(regressions)} (порог {args.threshold * 100:.0f}%)")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Бенчмарки сервисов KABAN')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def dataset_args(p):
+        p.add_argument('--size', choices=sorted(SIZES), default='1k', help='Размер набора данных')
+        p.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Зерно генератора')
+        p.add_argument('--db', help='Путь к базе (по умолчанию benchmarks/data/kaban-<size>-<seed>.db)')
+        p.add_argument('--anchor-date', type=date.fromisoformat, default=None,
+                       help='Опорная дата данных YYYY-MM-DD (по умолчанию сегодня)')
+
+    gen = sub.add_parser('generate', help='Сгенерировать базу данных')
+    dataset_args(gen)
+    gen.set_defaults(func=cmd_generate)
+
+    run = sub.add_parser('run', help='Запустить сценарии')
+    dataset_args(run)
+    run.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    run.add_argument('--warmup', type=int, default=DEFAULT_WARMUP)
+    run.add_argument('-k', '--only', action='append', help='Подстрока имени сценария (можно повторять)')
+    run.add_argument('--regenerate', action='store_true', help='Пересоздать базу перед запуском')
+    run.add_argument('--output', help='Файл JSON для результатов')
+    run.set_defaults(func=cmd_run)
+
+    cmp = sub.add_parser('compare', help='Сравнить два файла результатов')
+    cmp.add_argument('baseline')
+    cmp.add_argument('current')
+    cmp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                     help='Допустимое замедление (0.1 — 10%%)')
+    cmp.add_argument('--stat', default='median', choices=['min', 'mean', 'median'])
+    cmp.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
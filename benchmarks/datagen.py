@@ -0,0 +1,278 @@
+"""Детерминированный генератор баз данных для бенчмарков."""
+import os
+import random
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+
+from database.migrations import MIGRATIONS, migrate
+
+# Стандартные размеры наборов данных (количество задач)
+SIZES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+DEFAULT_SEED = 42
+
+# Сколько задач приходится на одного разработчика и на один проект
+TASKS_PER_DEVELOPER = 200
+TASKS_PER_PROJECT = 100
+
+INSERT_BATCH = 10_000
+
+POSITIONS = (('backend', 0.45, 2200), ('frontend', 0.35, 1900), ('QA', 0.20, 1400))
+STATUSES = (('новая', 0.25), ('в работе', 0.35), ('на проверке', 0.15), ('завершено', 0.25))
+
+FIRST_NAMES = (
+    'Александр', 'Алексей', 'Анна', 'Артём', 'Дарья', 'Дмитрий', 'Екатерина', 'Елена',
+    'Иван', 'Илья', 'Кирилл', 'Мария', 'Максим', 'Никита', 'Ольга', 'Павел',
+    'Пётр', 'Полина', 'Сергей', 'Софья', 'Татьяна', 'Юлия', 'Яков', 'Ярослав',
+)
+LAST_NAMES = (
+    'Иванов', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Петров', 'Соколов', 'Михайлов',
+    'Новиков', 'Фёдоров', 'Морозов', 'Волков', 'Алексеев', 'Лебедев', 'Семёнов', 'Егоров',
+    'Павлов', 'Козлов', 'Степанов', 'Николаев', 'Орлов', 'Андреев', 'Макаров', 'Никитин',
+)
+CLIENTS = (
+    'ООО Ромашка', 'АО Северсталь', 'ПАО Банк Восток', 'ООО Логистика Плюс', 'ИП Смирнова',
+    'ООО Медиагрупп', 'АО ТрансТех', 'ООО Агроном', 'ООО СтройИнвест', 'ООО Фудмаркет',
+    'АО Энергосбыт', 'ООО Клиника Здоровье', 'ООО Образование Онлайн', 'ООО ТурЭксперт',
+    'АО Почта Сервис', 'ООО Финтех Лаб', 'ООО Ритейл Групп', 'ООО Автодилер',
+)
+PROJECT_KINDS = (
+    'Интернет-магазин', 'Мобильное приложение', 'CRM-система', 'Личный кабинет',
+    'Платежный шлюз', 'Портал', 'Чат-бот', 'Аналитическая панель', 'ERP-модуль', 'Лендинг',
+)
+TASK_VERBS = (
+    'Исправить', 'Добавить', 'Реализовать', 'Протестировать', 'Оптимизировать',
+    'Переделать', 'Задокументировать', 'Настроить', 'Проверить', 'Обновить',
+)
+TASK_OBJECTS = (
+    'форму входа', 'экспорт отчета', 'поиск по каталогу', 'корзину', 'уведомления',
+    'API заказов', 'профиль пользователя', 'фильтры списка', 'импорт данных', 'оплату картой',
+    'кэширование', 'миграцию базы', 'страницу настроек', 'авторизацию через токены',
+    'загрузку файлов', 'рассылку писем', 'журнал действий', 'права доступа',
+)
+
+
+def _weighted(rng, items, weights, k):
+    return rng.choices(items, weights=weights, k=k)
+
+
+def _remove_database(path):
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def generate_database(path, tasks=1_000, seed=DEFAULT_SEED, anchor_date=None):
+    """
+    Создает базу данных со схемой приложения и синтетическими данными
+
+    Схема строится теми же миграциями, что и при запуске приложения:
+    основная схема — до загрузки данных, остальные шаги (сводные таблицы,
+    полнотекстовый индекс, индексы) — после, одним проходом по данным.
+
+    Одинаковые tasks, seed и anchor_date всегда дают одинаковые данные.
+    Количество проектов заказчиков распределено неравномерно (немногие
+    крупные проекты и много мелких), часть задач не назначена, у части
+    проектов трудозатраты близки к бюджету.
+
+    Args:
+        path: Путь к файлу базы данных (существующий файл перезаписывается)
+        tasks: Количество задач или имя размера из SIZES
+        seed: Зерно генератора случайных чисел
+        anchor_date: Дата, относительно которой строятся сроки и история (по умолчанию сегодня)
+
+    Returns:
+        dict: Описание набора данных (размеры, seed, anchor_date, время генерации)
+    """
+    if isinstance(tasks, str):
+        tasks = SIZES[tasks]
+    anchor_date = anchor_date or date.today()
+    anchor = datetime.combine(anchor_date, datetime.min.time()) + timedelta(hours=18)
+    rng = random.Random(seed)
+    started = time.perf_counter()
+
+    developer_count = max(5, tasks // TASKS_PER_DEVELOPER)
+    project_count = max(3, tasks // TASKS_PER_PROJECT)
+
+    _remove_database(path)
+    conn = sqlite3.connect(path)
+    try:
+        # База собирается с нуля: при сбое файл все равно удаляется,
+        # поэтому синхронизация с диском не нужна
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        migrate(conn, MIGRATIONS[:1])
+
+        # Демонстрационные данные kaban.sql заменяются сгенерированными
+        conn.execute("DELETE FROM tasks")
+        conn.execute("DELETE FROM projects")
+        conn.execute("DELETE FROM developers")
+        conn.execute("DELETE FROM notifications")
+        conn.execute("DELETE FROM sqlite_sequence WHERE name IN ('tasks', 'projects', 'developers', 'notifications')")
+
+        # Триггеры на время загрузки снимаются и затем восстанавливаются из схемы
+        triggers = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        for name, _ in triggers:
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.commit()
+
+        # Разработчики
+        positions = _weighted(rng, POSITIONS, [p[1] for p in POSITIONS], developer_count)
+        developers = []
+        for i, (position, _, base_rate) in enumerate(positions, start=1):
+            rate = max(500, round(rng.gauss(base_rate, base_rate * 0.25) / 50) * 50)
+            name = f"{rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)} #{i}"
+            developers.append((i, name, position, rate))
+        conn.executemany(
+            "INSERT INTO developers (id, full_name, position, hourly_rate) VALUES (?, ?, ?, ?)",
+            developers
+        )
+        rates = {d[0]: d[3] for d in developers}
+        # Загрузка разработчиков неравномерна
+        developer_ids = [d[0] for d in developers]
+        developer_weights = [rng.lognormvariate(0, 0.6) for _ in developers]
+
+        # Проекты: размеры по закону Ципфа, клиенты тоже неравномерно
+        project_ids = list(range(1, project_count + 1))
+        project_weights = [1 / (rank ** 0.8) for rank in range(1, project_count + 1)]
+        rng.shuffle(project_weights)
+        client_weights = [1 / (rank ** 1.1) for rank in range(1, len(CLIENTS) + 1)]
+        project_clients = _weighted(rng, CLIENTS, client_weights, project_count)
+        project_deadlines = [
+            (anchor_date + timedelta(days=rng.randint(-90, 365))).isoformat()
+            for _ in project_ids
+        ]
+        project_created = [
+            (anchor - timedelta(days=rng.randint(30, 760))).strftime('%Y-%m-%d %H:%M:%S')
+            for _ in project_ids
+        ]
+
+        # Бюджеты проставляются после генерации задач
+        projects = []
+        for i, project_id in enumerate(project_ids):
+            status = 'завершено' if rng.random() < 0.15 else 'в работе'
+            name = f"{rng.choice(PROJECT_KINDS)} {project_clients[i]} #{project_id}"
+            projects.append((
+                project_id, name, project_clients[i], project_deadlines[i], 0, status,
+                project_created[i]
+            ))
+        conn.executemany(
+            "INSERT INTO projects (id, name, client, deadline, budget, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            projects
+        )
+
+        # Задачи
+        status_names = [s[0] for s in STATUSES]
+        status_weights = [s[1] for s in STATUSES]
+        task_projects = _weighted(rng, project_ids, project_weights, tasks)
+        task_statuses = _weighted(rng, status_names, status_weights, tasks)
+        task_developers = _weighted(rng, developer_ids, developer_weights, tasks)
+        labor_costs = [0.0] * (project_count + 1)
+        history = 730 * 24 * 3600
+
+        batch = []
+        for number in range(1, tasks + 1):
+            project_id = task_projects[number - 1]
+            status = task_statuses[number - 1]
+            # Около 5% задач не назначено
+            developer_id = task_developers[number - 1] if rng.random() >= 0.05 else None
+
+            if status == 'новая':
+                hours = 0.0 if rng.random() < 0.7 else round(rng.uniform(0.5, 4), 1)
+            elif status == 'завершено':
+                hours = round(min(rng.lognormvariate(2.3, 0.6), 200), 1)
+            else:
+                hours = round(min(rng.lognormvariate(1.8, 0.7), 120), 1)
+            if developer_id is not None:
+                labor_costs[project_id] += hours * rates[developer_id]
+
+            created = anchor - timedelta(seconds=rng.randint(0, history))
+            age = (anchor - created).total_seconds()
+            updated = created + timedelta(seconds=rng.randint(0, int(min(age, 60 * 24 * 3600))))
+            description = (
+                f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)} "
+                f"({rng.choice(PROJECT_KINDS).lower()}) #{number}"
+            )
+            batch.append((
+                number, project_id, developer_id, description, status, hours,
+                created.strftime('%Y-%m-%d %H:%M:%S'), updated.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            if len(batch) >= INSERT_BATCH:
+                conn.executemany(
+                    "INSERT INTO tasks (id, project_id, developer_id, description, status, hours_worked, "
+                    "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    batch
+                )
+                batch = []
+        if batch:
+            conn.executemany(
+                "INSERT INTO tasks (id, project_id, developer_id, description, status, hours_worked, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                batch
+            )
+
+        # Бюджет не ниже трудозатрат (как требует check_project_budget);
+        # примерно у 15% проектов трудозатраты приближаются к бюджету
+        budgets = []
+        for project_id in project_ids:
+            cost = labor_costs[project_id]
+            if cost == 0:
+                budget = float(rng.randrange(100_000, 5_000_000, 10_000))
+            elif rng.random() < 0.15:
+                budget = round(cost / rng.uniform(0.8, 0.99), 2)
+            else:
+                budget = round(cost * rng.uniform(1.1, 2.5), 2)
+            budgets.append((budget, project_id))
+        conn.executemany("UPDATE projects SET budget = ? WHERE id = ?", budgets)
+        conn.commit()
+
+        for _, sql in triggers:
+            conn.execute(sql)
+        conn.commit()
+
+        # Остальные шаги схемы повторяемы: сводные таблицы и полнотекстовый
+        # индекс заполняются по уже загруженным данным
+        migrate(conn)
+        conn.execute("ANALYZE")
+        conn.commit()
+    except Exception:
+        # Недостроенная база не должна приниматься за готовый набор данных
+        conn.close()
+        _remove_database(path)
+        raise
+    conn.close()
+
+    return {
+        'path': path,
+        'tasks': tasks,
+        'projects': project_count,
+        'developers': developer_count,
+        'seed': seed,
+        'anchor_date': anchor_date.isoformat(),
+        'seconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def database_fingerprint(path):
+    """
+    Контрольная сумма содержимого основных таблиц
+
+    Позволяет убедиться, что два набора данных совпадают.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    conn = sqlite3.connect(path)
+    try:
+        for table in ('developers', 'projects', 'tasks'):
+            for row in conn.execute(f"SELECT * FROM {table} ORDER BY id"):
+                digest.update(repr(tuple(row)).encode('utf-8'))
+    finally:
+        conn.close()
+    return digest.hexdigest()
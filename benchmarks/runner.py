@@ -0,0 +1,175 @@
+"""Запуск сценариев и формат результатов."""
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+from paths import ROOT_DIR
+
+# Версия формата файла результатов
+RESULTS_VERSION = 1
+
+DEFAULT_ROUNDS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+def compute_stats(durations):
+    """
+    Статистика замеров в формате pytest-benchmark (секунды)
+    """
+    mean = statistics.mean(durations)
+    return {
+        'min': min(durations),
+        'max': max(durations),
+        'mean': mean,
+        'median': statistics.median(durations),
+        'stddev': statistics.stdev(durations) if len(durations) > 1 else 0.0,
+        'rounds': len(durations),
+        'iterations': 1,
+        'ops': 1 / mean if mean else 0.0,
+    }
+
+
+def measure(scenario, ctx, rounds=DEFAULT_ROUNDS, warmup=DEFAULT_WARMUP):
+    """
+    Выполняет сценарий warmup + rounds раз и возвращает длительности замеров
+    """
+    durations = []
+    for i in range(warmup + rounds):
+        if scenario.setup:
+            scenario.setup(ctx)
+        started = time.perf_counter()
+        scenario.run(ctx)
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            durations.append(elapsed)
+    return durations
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ['git', *args], cwd=ROOT_DIR, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def commit_info():
+    return {
+        'id': _git('rev-parse', 'HEAD'),
+        'branch': _git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def machine_info():
+    return {
+        'node': platform.node(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+        'sqlite_version': sqlite3.sqlite_version,
+    }
+
+
+def run_benchmarks(db_path, scenarios, dataset=None, rounds=DEFAULT_ROUNDS, warmup=DEFAULT_WARMUP,
+                   progress=None):
+    """
+    Выполняет сценарии на базе db_path
+
+    DBManager — одиночка, поэтому бенчмарки запускаются в отдельном процессе
+    и база должна быть первой, которую он открыл.
+
+    Args:
+        db_path: Путь к сгенерированной базе данных
+        scenarios: Список Scenario
+        dataset: Описание набора данных (из generate_database или метаданных)
+        rounds: Количество замеров
+        warmup: Количество прогревочных запусков
+        progress: Функция progress(scenario, stats), вызываемая после каждого сценария
+
+    Returns:
+        dict: Результаты в формате, совместимом с pytest-benchmark --benchmark-json
+    """
+    from models import DBManager
+    from benchmarks.scenarios import BenchmarkContext
+
+    db_manager = DBManager(db_path)
+    if os.path.abspath(db_manager.db_path) != os.path.abspath(db_path):
+        raise RuntimeError(f"DBManager уже открыт для {db_manager.db_path}")
+
+    ctx = BenchmarkContext(db_manager, seed=(dataset or {}).get('seed', 42))
+    benchmarks = []
+    try:
+        for scenario in scenarios:
+            stats = compute_stats(measure(scenario, ctx, rounds=rounds, warmup=warmup))
+            benchmarks.append({
+                'name': scenario.name,
+                'group': scenario.group,
+                'params': scenario.params,
+                'stats': stats,
+            })
+            if progress:
+                progress(scenario, stats)
+    finally:
+        db_manager.close()
+
+    return {
+        'version': RESULTS_VERSION,
+        'datetime': datetime.now().isoformat(timespec='seconds'),
+        'machine_info': machine_info(),
+        'commit_info': commit_info(),
+        'dataset': dataset or {},
+        'benchmarks': benchmarks,
+    }
+
+
+def save_results(results, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD, stat='median'):
+    """
+    Сравнивает два файла результатов по одноименным бенчмаркам
+
+    Args:
+        baseline: Результаты базового коммита
+        current: Результаты текущего коммита
+        threshold: Относительное замедление, считающееся регрессией (0.1 — 10%)
+        stat: Сравниваемая статистика
+
+    Returns:
+        list: Словари name, baseline, current, change, regression
+    """
+    base = {b['name']: b['stats'][stat] for b in baseline['benchmarks']}
+    rows = []
+    for bench in current['benchmarks']:
+        name = bench['name']
+        if name not in base:
+            continue
+        old, new = base[name], bench['stats'][stat]
+        change = (new - old) / old if old else 0.0
+        rows.append({
+            'name': name,
+            'baseline': old,
+            'current': new,
+            'change': change,
+            'regression': change > threshold,
+        })
+    return rows
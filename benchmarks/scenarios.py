@@ -0,0 +1,139 @@
+"""Сценарии бенчмарков: по одному на метод сервиса."""
+import random
+from datetime import date, timedelta
+
+from services import DeveloperService, NotificationService, ProjectService, ReportService, TaskService
+
+
+class Scenario:
+    """
+    Описание одного бенчмарка
+
+    Attributes:
+        name: Уникальное имя (группа.метод[.вариант])
+        group: Группа для сравнения результатов (имя сервиса)
+        run: Функция, принимающая контекст; ее время и измеряется
+        setup: Функция подготовки, вызываемая перед каждым замером (не измеряется)
+        params: Параметры сценария для отчета
+    """
+
+    def __init__(self, name, group, run, setup=None, params=None):
+        self.name = name
+        self.group = group
+        self.run = run
+        self.setup = setup
+        self.params = params or {}
+
+
+class BenchmarkContext:
+    """
+    Сервисы и детерминированно выбранные входные данные для сценариев
+    """
+
+    def __init__(self, db_manager, seed=42):
+        self.db_manager = db_manager
+        self.rng = random.Random(seed)
+        self.tasks = TaskService(db_manager)
+        self.projects = ProjectService(db_manager)
+        self.developers = DeveloperService(db_manager)
+        self.reports = ReportService(db_manager)
+        self.notifications = NotificationService(db_manager)
+
+        max_task = db_manager.query_one("SELECT MAX(id) AS id FROM tasks")['id'] or 0
+        self.task_ids = sorted(self.rng.sample(range(1, max_task + 1), min(500, max_task)))
+        # Самый крупный проект и самый загруженный разработчик — худший случай для фильтров
+        self.project_id = db_manager.query_one(
+            "SELECT project_id AS id FROM tasks GROUP BY project_id ORDER BY COUNT(*) DESC LIMIT 1"
+        )['id']
+        self.developer_id = db_manager.query_one(
+            "SELECT developer_id AS id FROM tasks WHERE developer_id IS NOT NULL "
+            "GROUP BY developer_id ORDER BY COUNT(*) DESC LIMIT 1"
+        )['id']
+        today = date.today()
+        self.month_start = today.replace(day=1)
+        self.quarter_start = today - timedelta(days=90)
+        self.today = today
+
+
+def _clear_notifications(ctx):
+    # Каждый прогон проверок начинается с пустой таблицы уведомлений
+    ctx.db_manager.execute("DELETE FROM notifications")
+    ctx.db_manager.commit()
+
+
+def _clear_report_cache(ctx):
+    # Отчеты замеряются без кэша: иначе измерялось бы только чтение готового результата
+    ctx.db_manager.report_cache.clear()
+    if ctx.db_manager.table_exists('report_cache'):
+        ctx.db_manager.execute("DELETE FROM report_cache")
+        ctx.db_manager.commit()
+
+
+def _scenarios():
+    return [
+        # ReportService
+        Scenario('report.overdue_tasks', 'ReportService',
+                 lambda ctx: ctx.reports.get_overdue_tasks_report(),
+                 setup=_clear_report_cache),
+        Scenario('report.developer_workload.month', 'ReportService',
+                 lambda ctx: ctx.reports.get_developer_workload_report(
+                     ctx.month_start.isoformat(), ctx.today.isoformat()),
+                 params={'period': 'month'}, setup=_clear_report_cache),
+        Scenario('report.developer_workload.quarter', 'ReportService',
+                 lambda ctx: ctx.reports.get_developer_workload_report(
+                     ctx.quarter_start.isoformat(), ctx.today.isoformat()),
+                 params={'period': 'quarter'}, setup=_clear_report_cache),
+        Scenario('report.project_status', 'ReportService',
+                 lambda ctx: ctx.reports.get_project_status_report(),
+                 setup=_clear_report_cache),
+        Scenario('report.monthly_revenue', 'ReportService',
+                 lambda ctx: ctx.reports.get_monthly_revenue_report(),
+                 setup=_clear_report_cache),
+
+        # TaskService
+        Scenario('task.get_all_tasks', 'TaskService',
+                 lambda ctx: ctx.tasks.get_all_tasks()),
+        Scenario('task.get_tasks_by_ids', 'TaskService',
+                 lambda ctx: ctx.tasks.get_tasks_by_ids(ctx.task_ids),
+                 params={'ids': 500}),
+        Scenario('task.search_tasks.like', 'TaskService',
+                 lambda ctx: ctx.tasks.search_tasks('экспорт', project_id=ctx.project_id),
+                 params={'term': 'экспорт', 'filter': 'project'}),
+        Scenario('task.search_tasks_page.first', 'TaskService',
+                 lambda ctx: ctx.tasks.search_tasks_page()),
+        Scenario('task.search_tasks_page.developer', 'TaskService',
+                 lambda ctx: ctx.tasks.search_tasks_page(developer_id=ctx.developer_id, status='в работе'),
+                 params={'filter': 'developer+status'}),
+        Scenario('task.search_tasks_page.fts', 'TaskService',
+                 lambda ctx: ctx.tasks.search_tasks_page('экспорт отчета'),
+                 params={'term': 'экспорт отчета'}),
+        Scenario('task.search_tasks_ranked', 'TaskService',
+                 lambda ctx: ctx.tasks.search_tasks_ranked('оптимизировать кэш'),
+                 params={'term': 'оптимизировать кэш'}),
+
+        # ProjectService / DeveloperService
+        Scenario('project.get_all_projects', 'ProjectService',
+                 lambda ctx: ctx.projects.get_all_projects()),
+        Scenario('developer.get_all_developers', 'DeveloperService',
+                 lambda ctx: ctx.developers.get_all_developers()),
+        Scenario('developer.calculate_developer_salary', 'DeveloperService',
+                 lambda ctx: ctx.developers.calculate_developer_salary(
+                     ctx.developer_id, ctx.month_start.isoformat(), ctx.today.isoformat())),
+
+        # NotificationService
+        Scenario('notification.run_all_checks', 'NotificationService',
+                 lambda ctx: ctx.notifications.run_all_checks(),
+                 setup=_clear_notifications),
+    ]
+
+
+SCENARIOS = _scenarios()
+
+
+def select_scenarios(patterns=None):
+    """
+    Отбирает сценарии по подстрокам имени (None — все)
+    """
+    if not patterns:
+        return list(SCENARIOS)
+    return [s for s in SCENARIOS if any(p in s.name for p in patterns)]
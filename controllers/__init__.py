@@ -6,8 +6,10 @@ from controllers.report_controller import ReportController
 from controllers.auth_controller import AuthController
 from controllers.notification_controller import NotificationController
 from controllers.export_controller import ExportController
+from controllers.import_controller import ImportController
 
 __all__ = [
     'BaseController', 'DeveloperController', 'ProjectController', 'TaskController',
-    'ReportController', 'AuthController', 'NotificationController', 'ExportController'
+    'ReportController', 'AuthController', 'NotificationController', 'ExportController',
+    'ImportController'
 ]
@@ -22,13 +22,12 @@ class DeveloperController(BaseController):
             db_manager = DBManager()
             db_manager.connect()
 
-            query = """
+            # Вкладки запрашивают разработчика текущего пользователя при каждом обновлении
+            result = db_manager.query_one_cached('developers:user_id', user_id, """
                 SELECT d.id, d.full_name, d.position, d.hourly_rate
                 FROM developers d
                 WHERE d.user_id = ?
-            """
-            db_manager.execute(query, (user_id,))
-            result = db_manager.fetch_one()
+            """)
 
             if result:
                 developer = Developer(
@@ -97,6 +96,9 @@ class DeveloperController(BaseController):
     def search_developers(self, search_term=None, position=None):
         return self.execute_service_method('search_developers', search_term, position)
 
+    def search_developers_ranked(self, text, limit=50):
+        return self.execute_service_method('search_developers_ranked', text, limit)
+
     def calculate_developer_salary(self, developer_id, start_date=None, end_date=None):
         return self.execute_service_method(
             'calculate_developer_salary', developer_id, start_date, end_date
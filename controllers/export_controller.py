@@ -1,20 +1,34 @@
 from controllers.base_controller import BaseController
-from services.export_service import ExportService
+from services.export_service import ExportService, ExportQuery
 from exceptions import BusinessException
+from export_jobs import ExportJobManager
 import os
 from datetime import datetime
+from paths import REPORTS_DIR
 
 class ExportController(BaseController):
     """
     Контроллер для экспорта данных
     """
-    def __init__(self):
+    def __init__(self, export_service=None, jobs=None):
         """
         Инициализирует контроллер экспорта
+
+        Args:
+            export_service: Сервис экспорта
+            jobs: Очередь фоновых экспортов (по умолчанию — общая очередь приложения)
         """
         super().__init__()
-        self.export_service = ExportService()
-    
+        self.export_service = export_service or ExportService()
+        self._jobs = jobs
+
+    @property
+    def jobs(self):
+        # Пул потоков очереди создается только при первом фоновом экспорте
+        if self._jobs is None:
+            self._jobs = ExportJobManager.shared()
+        return self._jobs
+
     def export_report_to_csv(self, report_data, filename=None):
         """
         Экспортирует отчет в CSV-файл
@@ -31,7 +45,7 @@ class ExportController(BaseController):
             if filename is None:
                 report_type = report_data.get('report_name', 'report').replace(' ', '_').lower()
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = os.path.join('reports', f'{report_type}_{timestamp}.csv')
+                filename = os.path.join(REPORTS_DIR, f'{report_type}_{timestamp}.csv')
             
             # Форматируем данные отчета
             headers, rows = ExportService.format_report_data(report_data)
@@ -66,7 +80,7 @@ class ExportController(BaseController):
             if filename is None:
                 report_type = report_data.get('report_name', 'report').replace(' ', '_').lower()
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = os.path.join('reports', f'{report_type}_{timestamp}.xlsx')
+                filename = os.path.join(REPORTS_DIR, f'{report_type}_{timestamp}.xlsx')
             
             # Форматируем данные отчета
             headers, rows = ExportService.format_report_data(report_data)
@@ -137,3 +151,137 @@ class ExportController(BaseController):
         
         except Exception as e:
             return self.handle_exception(e)
+
+    def export_query_to_csv(self, entity, filters, filename, compress=None, progress=None):
+        """
+        Экспортирует выгрузку из базы в CSV-файл потоком из курсора
+
+        Args:
+            entity: Тип выгрузки (tasks, projects, developers)
+            filters: Фильтры поиска (см. ExportQuery)
+            filename: Имя файла
+            compress: Сжимать файл gzip (по умолчанию — если имя оканчивается на .gz)
+            progress: Функция progress(rows_count)
+
+        Returns:
+            dict: Результат операции
+        """
+        try:
+            query = ExportQuery(entity, **(filters or {}))
+            result = self.export_service.export_query_to_csv(query, filename, compress, progress)
+
+            if not result['success']:
+                raise BusinessException(f"Ошибка при экспорте в CSV: {result.get('error')}")
+
+            return {
+                'success': True,
+                'data': result
+            }
+
+        except Exception as e:
+            return self.handle_exception(e)
+
+    def export_query_to_excel(self, entity, filters, filename, sheet_name=None, progress=None):
+        """
+        Экспортирует выгрузку из базы в Excel-файл потоком из курсора
+
+        Выгружаются все строки, подходящие под фильтры, а не только
+        показанные в таблице; при большом числе строк файл делится на
+        несколько листов.
+
+        Args:
+            entity: Тип выгрузки (tasks, projects, developers)
+            filters: Фильтры поиска (см. ExportQuery)
+            filename: Имя файла
+            sheet_name: Имя листа
+            progress: Функция progress(rows_count)
+
+        Returns:
+            dict: Результат операции
+        """
+        try:
+            query = ExportQuery(entity, **(filters or {}))
+            result = self.export_service.export_query_to_excel(query, filename, sheet_name, progress)
+
+            if not result['success']:
+                raise BusinessException(f"Ошибка при экспорте в Excel: {result.get('error')}")
+
+            return {
+                'success': True,
+                'data': result
+            }
+
+        except Exception as e:
+            return self.handle_exception(e)
+
+    def start_query_export(self, entity, filters, export_format='csv', filename=None):
+        """
+        Запускает выгрузку из базы в фоне
+
+        Args:
+            entity: Тип выгрузки (tasks, projects, developers)
+            filters: Фильтры поиска (см. ExportQuery)
+            export_format: csv или excel
+            filename: Имя файла (если None, файл создается в каталоге reports/)
+
+        Returns:
+            dict: Результат операции; data — задача ExportJob (если такая же
+            выгрузка уже идет, возвращается она)
+        """
+        try:
+            job = self.jobs.submit_query(entity, filters, export_format, filename)
+            return {
+                'success': True,
+                'data': job
+            }
+
+        except Exception as e:
+            return self.handle_exception(e)
+
+    def start_report_export(self, report_data, export_format='csv', filename=None):
+        """
+        Запускает экспорт отчета в фоне
+
+        Returns:
+            dict: Результат операции; data — задача ExportJob
+        """
+        try:
+            job = self.jobs.submit_report(report_data, export_format, filename)
+            return {
+                'success': True,
+                'data': job
+            }
+
+        except Exception as e:
+            return self.handle_exception(e)
+
+    def cancel_export(self, job_id):
+        """
+        Отменяет фоновый экспорт
+        """
+        try:
+            return {
+                'success': True,
+                'data': self.jobs.cancel(job_id)
+            }
+
+        except Exception as e:
+            return self.handle_exception(e)
+
+    def get_export_jobs(self, active_only=False):
+        """
+        Фоновые экспорты текущего сеанса
+        """
+        return {
+            'success': True,
+            'data': self.jobs.jobs(active_only)
+        }
+
+    def get_export_history(self, limit=50):
+        """
+        Журнал завершенных экспортов (каталог reports/)
+        """
+        return {
+            'success': True,
+            'data': self.jobs.history(limit)
+        }
@@ -0,0 +1,39 @@
+from controllers.base_controller import BaseController
+from services import ImportService
+
+class ImportController(BaseController):
+    """
+    Контроллер для импорта данных из CSV
+    """
+    def __init__(self, service=None):
+        """
+        Инициализирует контроллер с сервисом импорта
+        """
+        super().__init__(service or ImportService())
+
+    def import_tasks_from_csv(self, filename, chunk_size=None, dry_run=False, progress_callback=None):
+        """
+        Импортирует задачи из CSV-файла
+        """
+        return self.execute_service_method(
+            'import_csv', filename, 'tasks',
+            chunk_size=chunk_size, dry_run=dry_run, progress_callback=progress_callback
+        )
+
+    def import_projects_from_csv(self, filename, chunk_size=None, dry_run=False, progress_callback=None):
+        """
+        Импортирует проекты из CSV-файла
+        """
+        return self.execute_service_method(
+            'import_csv', filename, 'projects',
+            chunk_size=chunk_size, dry_run=dry_run, progress_callback=progress_callback
+        )
+
+    def import_developers_from_csv(self, filename, chunk_size=None, dry_run=False, progress_callback=None):
+        """
+        Импортирует разработчиков из CSV-файла
+        """
+        return self.execute_service_method(
+            'import_csv', filename, 'developers',
+            chunk_size=chunk_size, dry_run=dry_run, progress_callback=progress_callback
+        )
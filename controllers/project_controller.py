@@ -125,6 +125,12 @@ class ProjectController(BaseController):
         """
         return self.execute_service_method('search_projects', search_term, client, start_date, end_date)
     
+    def search_projects_ranked(self, text, limit=50):
+        """
+        Полнотекстовый поиск проектов с ранжированием по релевантности
+        """
+        return self.execute_service_method('search_projects_ranked', text, limit)
+
     def get_project_progress(self, project_id):
         """
         Получает прогресс проекта
@@ -130,11 +130,61 @@ class TaskController(BaseController):
         """
         return self.execute_service_method('update_task_hours', task_id, hours)
     
+    def bulk_create_tasks(self, items):
+        """
+        Пакетно создает задачи
+        """
+        return self.execute_service_method('bulk_create_tasks', items)
+
+    def bulk_update_status(self, task_ids, status):
+        """
+        Пакетно обновляет статус задач
+        """
+        return self.execute_service_method('bulk_update_status', task_ids, status)
+
+    def bulk_assign(self, task_ids, developer_id):
+        """
+        Пакетно назначает задачи разработчику
+        """
+        return self.execute_service_method('bulk_assign', task_ids, developer_id)
+
+    def bulk_update_hours(self, hours_by_task):
+        """
+        Пакетно обновляет часы задач
+        """
+        return self.execute_service_method('bulk_update_hours', hours_by_task)
+
     def search_tasks(self, search_term=None, project_id=None, developer_id=None, status=None):
         """
         Поиск задач по описанию, проекту, разработчику и/или статусу
         """
         return self.execute_service_method('search_tasks', search_term, project_id, developer_id, status)
+
+    def get_task_rows(self, search_term=None, project_id=None, developer_id=None, status=None):
+        """
+        Список задач в столбцовом хранилище TaskRows (для больших выборок)
+        """
+        return self.execute_service_method('get_task_rows', search_term, project_id, developer_id, status)
+
+    def search_tasks_page(self, search_term=None, project_id=None, developer_id=None, status=None,
+                          limit=None, cursor=None):
+        """
+        Постраничный поиск задач с курсором (updated_at, id)
+
+        Returns:
+            dict: Результат операции; data содержит tasks и next_cursor
+        """
+        return self.execute_service_method(
+            'search_tasks_page', search_term, project_id, developer_id, status, limit, cursor
+        )
+
+    def search_tasks_ranked(self, text, project_id=None, developer_id=None, status=None, limit=50):
+        """
+        Полнотекстовый поиск задач с ранжированием по релевантности
+        """
+        return self.execute_service_method(
+            'search_tasks_ranked', text, project_id, developer_id, status, limit
+        )
     
     def get_task_statuses(self):
         """
@@ -1,18 +1,36 @@
 """Инициализация базы данных при запуске."""
 import os
 
-from paths import DB_PATH, SQL_PATH
+from paths import DB_PATH
 from models import DBManager
+from database.migrations import migrate
 
 
 def ensure_database():
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+
     db_manager = DBManager(DB_PATH)
     db_manager.connect()
 
-    if not os.path.exists(DB_PATH) or os.path.getsize(DB_PATH) == 0:
-        with open(SQL_PATH, 'r', encoding='utf-8') as sql_file:
-            db_manager.conn.executescript(sql_file.read())
-        db_manager.commit()
+    # Новая база создается, старая доводится до текущей версии схемы;
+    # при актуальной схеме читается только PRAGMA user_version
+    migrate(db_manager.conn)
 
     return db_manager
+
+
+def warm_up(db_manager=None):
+    """
+    Прогревает базу до показа первого окна
+
+    Выполняет запросы, с которых начинает работу дашборд. Соединение
+    рабочего потока после release_connection() возвращается в пул и
+    достается потоку интерфейса уже с прочитанными страницами и
+    подготовленными запросами.
+    """
+    from services import DeveloperService, ProjectService, TaskService
+
+    db_manager = db_manager or DBManager()
+    ProjectService(db_manager).get_all_projects()
+    DeveloperService(db_manager).get_all_developers()
+    TaskService(db_manager).search_tasks_page()
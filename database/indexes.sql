@@ -0,0 +1,23 @@
+-- Составные индексы задач для отчетов за период
+-- Отчеты сравнивают created_at/updated_at с границами периода как есть
+-- (полуоткрытый интервал), поэтому выбираются диапазоном по индексу.
+-- Скрипт повторяемый: добавляет индексы в базы, созданные до их появления.
+
+-- Загрузка и зарплата разработчика: поиск по developer_id, диапазон по
+-- created_at, часы читаются из индекса без обращения к таблице
+CREATE INDEX IF NOT EXISTS idx_tasks_developer_period ON tasks (developer_id, created_at, hours_worked);
+
+-- Доходы за месяц: диапазон по created_at, остальные поля отчета в индексе
+CREATE INDEX IF NOT EXISTS idx_tasks_period ON tasks (created_at, project_id, developer_id, hours_worked);
+
+-- Задачи проекта по статусу (триггер update_project_status, сводки по проектам)
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks (project_id, status);
+
+-- Неактивные задачи и постраничный вывод по (updated_at, id)
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at);
+
+-- Одиночные индексы заменены составными с тем же первым столбцом
+DROP INDEX IF EXISTS idx_tasks_developer_id;
+DROP INDEX IF EXISTS idx_tasks_project_id;
+
+ANALYZE tasks;
@@ -2,6 +2,10 @@ import sqlite3
 import os
 import sys
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.migrations import MIGRATIONS, migrate
+
 
 def init_database(db_path='database/kabanmanagement_it-projects.sqlite', sql_path='database/kaban.sql'):
     try:
@@ -18,6 +22,11 @@ def init_database(db_path='database/kabanmanagement_it-projects.sqlite', sql_pat
 
         conn = sqlite3.connect(db_path)
         conn.executescript(sql_script)
+
+        # Основная схема пересоздана заново; остальные шаги (статистика,
+        # поиск, индексы) применяются миграциями
+        conn.execute(f"PRAGMA user_version = {MIGRATIONS[0].version}")
+        migrate(conn)
         conn.close()
 
         print(f"База данных успешно инициализирована: {db_path}")
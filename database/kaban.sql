@@ -90,9 +90,11 @@ CREATE TABLE IF NOT EXISTS notifications (
 -- =============================================
 -- Создание индексов для ускорения запросов
 -- =============================================
-CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_developer_id ON tasks (developer_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks (project_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_developer_period ON tasks (developer_id, created_at, hours_worked);
+CREATE INDEX IF NOT EXISTS idx_tasks_period ON tasks (created_at, project_id, developer_id, hours_worked);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at);
 CREATE INDEX IF NOT EXISTS idx_tasks_created_by ON tasks (created_by);
 
 CREATE INDEX IF NOT EXISTS idx_projects_deadline ON projects (deadline);
@@ -113,6 +115,8 @@ CREATE INDEX IF NOT EXISTS idx_notifications_is_read ON notifications (is_read);
 CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications (created_at);
 CREATE INDEX IF NOT EXISTS idx_notifications_related ON notifications (related_id, related_type);
 CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications (user_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_notifications_unread_related
+ON notifications (related_type, related_id) WHERE is_read = 0;
 
 -- =============================================
 -- Создание представлений (Views) для удобства работы
@@ -259,7 +263,7 @@ BEFORE INSERT ON tasks
 WHEN EXISTS (
     SELECT 1 FROM tasks
     WHERE project_id = NEW.project_id
-    AND developer_id = NEW.developer_id
+    AND developer_id IS NEW.developer_id
     AND description = NEW.description
 )
 BEGIN
@@ -268,7 +272,7 @@ BEGIN
         hours_worked = NEW.hours_worked,
         created_by = COALESCE(NEW.created_by, created_by)
     WHERE project_id = NEW.project_id
-    AND developer_id = NEW.developer_id
+    AND developer_id IS NEW.developer_id
     AND description = NEW.description;
 
     SELECT raise(IGNORE);
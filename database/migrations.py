@@ -0,0 +1,128 @@
+"""Версионные миграции схемы базы данных."""
+import sqlite3
+
+from exceptions import DatabaseException
+from paths import (SQL_PATH, STATS_SQL_PATH, SEARCH_SQL_PATH, NOTIFICATIONS_SQL_PATH,
+                   REPORT_CACHE_SQL_PATH, INDEXES_SQL_PATH, TASK_UPSERT_SQL_PATH)
+
+
+class Migration:
+    """
+    Шаг миграции схемы
+
+    Attributes:
+        version: Номер версии схемы после применения шага
+        description: Описание шага
+        script_path: SQL-скрипт шага
+    """
+    def __init__(self, version, description, script_path):
+        self.version = version
+        self.description = description
+        self.script_path = script_path
+
+    def read_script(self):
+        with open(self.script_path, 'r', encoding='utf-8') as sql_file:
+            return sql_file.read()
+
+    def __repr__(self):
+        return f"Migration({self.version}, {self.description!r})"
+
+
+# Новые шаги добавляются только в конец списка; номер версии не меняется
+# после выпуска. Скрипты после первого повторяемы (IF NOT EXISTS, пересборка
+# сводных данных), поэтому применимы и к базам, созданным до миграций.
+MIGRATIONS = [
+    Migration(1, 'Основная схема и демонстрационные данные', SQL_PATH),
+    Migration(2, 'Сводные таблицы статистики', STATS_SQL_PATH),
+    Migration(3, 'Полнотекстовый поиск (FTS5)', SEARCH_SQL_PATH),
+    Migration(4, 'Уникальные непрочитанные уведомления', NOTIFICATIONS_SQL_PATH),
+    Migration(5, 'Версии таблиц и кэш отчетов', REPORT_CACHE_SQL_PATH),
+    Migration(6, 'Составные индексы для отчетов за период', INDEXES_SQL_PATH),
+    # Повтор stats.sql: новые триггеры удаления разработчика и пересчет
+    # сводных данных, разошедшихся с задачами в старых версиях
+    Migration(7, 'Статистика при удалении разработчика', STATS_SQL_PATH),
+    Migration(8, 'Дубликаты задач без разработчика', TASK_UPSERT_SQL_PATH),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def schema_version(conn):
+    """
+    Версия схемы из заголовка файла базы (PRAGMA user_version)
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _is_legacy(conn):
+    # База, созданная до миграций: основные таблицы есть, версия не записана
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tasks'"
+    ).fetchone() is not None
+
+
+def pending_migrations(conn, migrations=None):
+    """
+    Шаги, которые еще не применены к базе
+
+    Проверка читает только версию из заголовка файла, поэтому при
+    актуальной схеме не стоит ничего, независимо от числа таблиц.
+
+    Raises:
+        DatabaseException: База создана более новой версией приложения
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    latest = migrations[-1].version if migrations else 0
+    version = schema_version(conn)
+    if version == latest:
+        return []
+    if version > latest:
+        raise DatabaseException(
+            f"Версия схемы базы ({version}) новее поддерживаемой приложением ({latest})"
+        )
+    if version == 0 and _is_legacy(conn):
+        version = 1
+    return [migration for migration in migrations if migration.version > version]
+
+
+def _apply(conn, migration):
+    if conn.in_transaction:
+        conn.commit()
+    # Скрипт и новая версия фиксируются одной транзакцией: при ошибке база
+    # остается в прежней версии. В режиме WAL читатели работают со старым
+    # снимком, пока строятся индексы.
+    script = migration.read_script()
+    try:
+        conn.executescript(
+            f"BEGIN IMMEDIATE;\n{script}\n;\nPRAGMA user_version = {int(migration.version)};\nCOMMIT;"
+        )
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
+        raise DatabaseException(
+            f"Ошибка миграции схемы до версии {migration.version} ({migration.description})", e
+        )
+
+
+def migrate(conn, migrations=None):
+    """
+    Доводит схему базы до последней версии
+
+    Шаги применяются по порядку, каждый в своей транзакции. Базе без
+    версии, в которой уже есть основные таблицы, засчитывается первый шаг.
+
+    Args:
+        conn: Соединение sqlite3
+        migrations: Список шагов (по умолчанию MIGRATIONS)
+
+    Returns:
+        list: Номера примененных версий
+    """
+    applied = []
+    for migration in pending_migrations(conn, migrations):
+        _apply(conn, migration)
+        applied.append(migration.version)
+    if applied:
+        # Статистика планировщика для новых индексов
+        conn.execute("PRAGMA optimize")
+    return applied
@@ -14,3 +14,14 @@ CREATE TABLE IF NOT EXISTS notifications (
 CREATE INDEX IF NOT EXISTS idx_notifications_is_read ON notifications (is_read);
 CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications (created_at);
 CREATE INDEX IF NOT EXISTS idx_notifications_related ON notifications (related_id, related_type);
+
+-- Не более одного непрочитанного уведомления на связанный объект
+DELETE FROM notifications
+WHERE is_read = 0 AND related_id IS NOT NULL
+AND id NOT IN (
+    SELECT MIN(id) FROM notifications
+    WHERE is_read = 0 AND related_id IS NOT NULL
+    GROUP BY related_type, related_id
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_notifications_unread_related
+ON notifications (related_type, related_id) WHERE is_read = 0;
@@ -0,0 +1,90 @@
+-- =============================================
+-- Версии данных для кэша отчетов.
+-- table_versions хранит счетчик изменений каждой таблицы, от которой
+-- зависят отчеты; триггеры увеличивают его при любой записи. Отчет,
+-- посчитанный при тех же версиях, можно отдать повторно без запроса.
+-- report_cache хранит отчеты за прошедшие периоды между запусками.
+-- Скрипт идемпотентен и выполняется после kaban.sql.
+-- =============================================
+CREATE TABLE IF NOT EXISTS table_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Существующие счетчики не сбрасываются
+INSERT OR IGNORE INTO table_versions (name) VALUES ('tasks'), ('projects'), ('developers');
+
+CREATE TABLE IF NOT EXISTS report_cache (
+    report_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    versions TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (report_type, params)
+);
+
+-- =============================================
+-- Триггеры счетчиков изменений
+-- =============================================
+DROP TRIGGER IF EXISTS version_tasks_insert;
+CREATE TRIGGER version_tasks_insert
+AFTER INSERT ON tasks
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tasks';
+END;
+
+DROP TRIGGER IF EXISTS version_tasks_update;
+CREATE TRIGGER version_tasks_update
+AFTER UPDATE ON tasks
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tasks';
+END;
+
+DROP TRIGGER IF EXISTS version_tasks_delete;
+CREATE TRIGGER version_tasks_delete
+AFTER DELETE ON tasks
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tasks';
+END;
+
+DROP TRIGGER IF EXISTS version_projects_insert;
+CREATE TRIGGER version_projects_insert
+AFTER INSERT ON projects
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'projects';
+END;
+
+DROP TRIGGER IF EXISTS version_projects_update;
+CREATE TRIGGER version_projects_update
+AFTER UPDATE ON projects
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'projects';
+END;
+
+DROP TRIGGER IF EXISTS version_projects_delete;
+CREATE TRIGGER version_projects_delete
+AFTER DELETE ON projects
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'projects';
+END;
+
+DROP TRIGGER IF EXISTS version_developers_insert;
+CREATE TRIGGER version_developers_insert
+AFTER INSERT ON developers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'developers';
+END;
+
+DROP TRIGGER IF EXISTS version_developers_update;
+CREATE TRIGGER version_developers_update
+AFTER UPDATE ON developers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'developers';
+END;
+
+DROP TRIGGER IF EXISTS version_developers_delete;
+CREATE TRIGGER version_developers_delete
+AFTER DELETE ON developers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'developers';
+END;
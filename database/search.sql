@@ -0,0 +1,148 @@
+-- =============================================
+-- Полнотекстовый поиск (FTS5) по задачам, проектам и разработчикам.
+-- Токенизатор unicode61 приводит кириллицу к нижнему регистру и снимает
+-- диакритику с латиницы; букву ё он не трогает, поэтому в индекс текст
+-- попадает с заменой ё на е (то же делает BaseService.fts_query).
+-- Префиксные индексы ускоряют поиск по началу слова.
+-- Индексы поддерживаются триггерами.
+-- Скрипт идемпотентен и выполняется после kaban.sql.
+-- =============================================
+
+-- Задачи: описание плюс название проекта и имя разработчика (rowid = tasks.id)
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    description,
+    project_name,
+    developer_name,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+-- Проекты и разработчики (rowid = projects.id / developers.id)
+CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+    name,
+    client,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS developers_fts USING fts5(
+    full_name,
+    position,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+-- =============================================
+-- Пересчет с нуля (заполнение существующей базы)
+-- =============================================
+DELETE FROM tasks_fts;
+INSERT INTO tasks_fts (rowid, description, project_name, developer_name)
+SELECT
+    t.id,
+    replace(replace(t.description, 'ё', 'е'), 'Ё', 'Е'),
+    replace(replace(p.name, 'ё', 'е'), 'Ё', 'Е'),
+    replace(replace(d.full_name, 'ё', 'е'), 'Ё', 'Е')
+FROM tasks t
+LEFT JOIN projects p ON t.project_id = p.id
+LEFT JOIN developers d ON t.developer_id = d.id;
+
+DELETE FROM projects_fts;
+INSERT INTO projects_fts (rowid, name, client)
+SELECT id, replace(replace(name, 'ё', 'е'), 'Ё', 'Е'), replace(replace(client, 'ё', 'е'), 'Ё', 'Е') FROM projects;
+
+DELETE FROM developers_fts;
+INSERT INTO developers_fts (rowid, full_name, position)
+SELECT id, replace(replace(full_name, 'ё', 'е'), 'Ё', 'Е'), position FROM developers;
+
+-- =============================================
+-- Триггеры поддержки индекса задач
+-- =============================================
+DROP TRIGGER IF EXISTS fts_task_insert;
+CREATE TRIGGER fts_task_insert
+AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO tasks_fts (rowid, description, project_name, developer_name)
+    VALUES (
+        NEW.id,
+        replace(replace(NEW.description, 'ё', 'е'), 'Ё', 'Е'),
+        (SELECT replace(replace(name, 'ё', 'е'), 'Ё', 'Е') FROM projects WHERE id = NEW.project_id),
+        (SELECT replace(replace(full_name, 'ё', 'е'), 'Ё', 'Е') FROM developers WHERE id = NEW.developer_id)
+    );
+END;
+
+DROP TRIGGER IF EXISTS fts_task_update;
+CREATE TRIGGER fts_task_update
+AFTER UPDATE OF description, project_id, developer_id ON tasks
+BEGIN
+    DELETE FROM tasks_fts WHERE rowid = OLD.id;
+    INSERT INTO tasks_fts (rowid, description, project_name, developer_name)
+    VALUES (
+        NEW.id,
+        replace(replace(NEW.description, 'ё', 'е'), 'Ё', 'Е'),
+        (SELECT replace(replace(name, 'ё', 'е'), 'Ё', 'Е') FROM projects WHERE id = NEW.project_id),
+        (SELECT replace(replace(full_name, 'ё', 'е'), 'Ё', 'Е') FROM developers WHERE id = NEW.developer_id)
+    );
+END;
+
+DROP TRIGGER IF EXISTS fts_task_delete;
+CREATE TRIGGER fts_task_delete
+AFTER DELETE ON tasks
+BEGIN
+    DELETE FROM tasks_fts WHERE rowid = OLD.id;
+END;
+
+-- =============================================
+-- Триггеры поддержки индекса проектов
+-- =============================================
+DROP TRIGGER IF EXISTS fts_project_insert;
+CREATE TRIGGER fts_project_insert
+AFTER INSERT ON projects
+BEGIN
+    INSERT INTO projects_fts (rowid, name, client) VALUES (NEW.id, replace(replace(NEW.name, 'ё', 'е'), 'Ё', 'Е'), replace(replace(NEW.client, 'ё', 'е'), 'Ё', 'Е'));
+END;
+
+DROP TRIGGER IF EXISTS fts_project_update;
+CREATE TRIGGER fts_project_update
+AFTER UPDATE OF name, client ON projects
+BEGIN
+    DELETE FROM projects_fts WHERE rowid = OLD.id;
+    INSERT INTO projects_fts (rowid, name, client) VALUES (NEW.id, replace(replace(NEW.name, 'ё', 'е'), 'Ё', 'Е'), replace(replace(NEW.client, 'ё', 'е'), 'Ё', 'Е'));
+    UPDATE tasks_fts SET project_name = replace(replace(NEW.name, 'ё', 'е'), 'Ё', 'Е')
+    WHERE NEW.name IS NOT OLD.name
+    AND rowid IN (SELECT id FROM tasks WHERE project_id = NEW.id);
+END;
+
+DROP TRIGGER IF EXISTS fts_project_delete;
+CREATE TRIGGER fts_project_delete
+AFTER DELETE ON projects
+BEGIN
+    DELETE FROM projects_fts WHERE rowid = OLD.id;
+END;
+
+-- =============================================
+-- Триггеры поддержки индекса разработчиков
+-- =============================================
+DROP TRIGGER IF EXISTS fts_developer_insert;
+CREATE TRIGGER fts_developer_insert
+AFTER INSERT ON developers
+BEGIN
+    INSERT INTO developers_fts (rowid, full_name, position) VALUES (NEW.id, replace(replace(NEW.full_name, 'ё', 'е'), 'Ё', 'Е'), NEW.position);
+END;
+
+DROP TRIGGER IF EXISTS fts_developer_update;
+CREATE TRIGGER fts_developer_update
+AFTER UPDATE OF full_name, position ON developers
+BEGIN
+    DELETE FROM developers_fts WHERE rowid = OLD.id;
+    INSERT INTO developers_fts (rowid, full_name, position) VALUES (NEW.id, replace(replace(NEW.full_name, 'ё', 'е'), 'Ё', 'Е'), NEW.position);
+    UPDATE tasks_fts SET developer_name = replace(replace(NEW.full_name, 'ё', 'е'), 'Ё', 'Е')
+    WHERE NEW.full_name IS NOT OLD.full_name
+    AND rowid IN (SELECT id FROM tasks WHERE developer_id = NEW.id);
+END;
+
+DROP TRIGGER IF EXISTS fts_developer_delete;
+CREATE TRIGGER fts_developer_delete
+AFTER DELETE ON developers
+BEGIN
+    DELETE FROM developers_fts WHERE rowid = OLD.id;
+END;
@@ -0,0 +1,241 @@
+-- =============================================
+-- Сводные таблицы статистики по проектам и разработчикам.
+-- Поддерживаются триггерами инкрементально, поэтому отчеты читают
+-- O(проектов) строк вместо агрегации всех задач.
+-- Скрипт идемпотентен и выполняется после kaban.sql.
+-- =============================================
+CREATE TABLE IF NOT EXISTS project_stats (
+    project_id INTEGER PRIMARY KEY,
+    total_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    total_hours REAL NOT NULL DEFAULT 0,
+    labor_cost REAL NOT NULL DEFAULT 0,
+    FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS developer_stats (
+    developer_id INTEGER PRIMARY KEY,
+    total_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    total_hours REAL NOT NULL DEFAULT 0,
+    total_earnings REAL NOT NULL DEFAULT 0,
+    FOREIGN KEY (developer_id) REFERENCES developers (id) ON DELETE CASCADE
+);
+
+-- =============================================
+-- Пересчет с нуля (заполнение существующей базы)
+-- =============================================
+DELETE FROM project_stats;
+INSERT INTO project_stats (project_id, total_tasks, completed_tasks, total_hours, labor_cost)
+SELECT
+    p.id,
+    COUNT(t.id),
+    COALESCE(SUM(CASE WHEN t.status = 'завершено' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(t.hours_worked), 0),
+    COALESCE(SUM(t.hours_worked * d.hourly_rate), 0)
+FROM projects p
+LEFT JOIN tasks t ON p.id = t.project_id
+LEFT JOIN developers d ON t.developer_id = d.id
+GROUP BY p.id;
+
+DELETE FROM developer_stats;
+INSERT INTO developer_stats (developer_id, total_tasks, completed_tasks, total_hours, total_earnings)
+SELECT
+    d.id,
+    COUNT(t.id),
+    COALESCE(SUM(CASE WHEN t.status = 'завершено' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(t.hours_worked), 0),
+    COALESCE(SUM(t.hours_worked), 0) * d.hourly_rate
+FROM developers d
+LEFT JOIN tasks t ON d.id = t.developer_id
+GROUP BY d.id;
+
+-- =============================================
+-- Триггеры поддержки статистики
+-- Вместо INSERT OR IGNORE — проверка NOT EXISTS: в триггере, вызванном
+-- действием внешнего ключа (ON DELETE SET NULL), OR IGNORE заменяется на
+-- ABORT, и повторная вставка строки статистики прерывает удаление.
+-- =============================================
+DROP TRIGGER IF EXISTS stats_project_insert;
+CREATE TRIGGER stats_project_insert
+AFTER INSERT ON projects
+BEGIN
+    INSERT INTO project_stats (project_id)
+    SELECT NEW.id WHERE NOT EXISTS (SELECT 1 FROM project_stats WHERE project_id = NEW.id);
+END;
+
+DROP TRIGGER IF EXISTS stats_project_delete;
+CREATE TRIGGER stats_project_delete
+AFTER DELETE ON projects
+BEGIN
+    DELETE FROM project_stats WHERE project_id = OLD.id;
+END;
+
+DROP TRIGGER IF EXISTS stats_developer_insert;
+CREATE TRIGGER stats_developer_insert
+AFTER INSERT ON developers
+BEGIN
+    INSERT INTO developer_stats (developer_id)
+    SELECT NEW.id WHERE NOT EXISTS (SELECT 1 FROM developer_stats WHERE developer_id = NEW.id);
+END;
+
+-- Задачи удаляемого разработчика остаются в проектах без исполнителя
+-- (ON DELETE SET NULL или висячая ссылка при выключенных внешних ключах),
+-- поэтому его часть стоимости работ списывается до удаления строки
+DROP TRIGGER IF EXISTS stats_developer_before_delete;
+CREATE TRIGGER stats_developer_before_delete
+BEFORE DELETE ON developers
+BEGIN
+    UPDATE project_stats
+    SET labor_cost = labor_cost - OLD.hourly_rate * (
+        SELECT COALESCE(SUM(t.hours_worked), 0)
+        FROM tasks t
+        WHERE t.project_id = project_stats.project_id AND t.developer_id = OLD.id
+    )
+    WHERE project_id IN (SELECT project_id FROM tasks WHERE developer_id = OLD.id);
+END;
+
+DROP TRIGGER IF EXISTS stats_developer_delete;
+CREATE TRIGGER stats_developer_delete
+AFTER DELETE ON developers
+BEGIN
+    DELETE FROM developer_stats WHERE developer_id = OLD.id;
+END;
+
+DROP TRIGGER IF EXISTS stats_developer_rate;
+CREATE TRIGGER stats_developer_rate
+AFTER UPDATE OF hourly_rate ON developers
+WHEN NEW.hourly_rate != OLD.hourly_rate
+BEGIN
+    UPDATE project_stats
+    SET labor_cost = labor_cost + (NEW.hourly_rate - OLD.hourly_rate) * (
+        SELECT COALESCE(SUM(t.hours_worked), 0)
+        FROM tasks t
+        WHERE t.project_id = project_stats.project_id AND t.developer_id = NEW.id
+    )
+    WHERE project_id IN (SELECT project_id FROM tasks WHERE developer_id = NEW.id);
+
+    UPDATE developer_stats
+    SET total_earnings = total_hours * NEW.hourly_rate
+    WHERE developer_id = NEW.id;
+END;
+
+DROP TRIGGER IF EXISTS stats_task_insert;
+CREATE TRIGGER stats_task_insert
+AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO project_stats (project_id)
+    SELECT NEW.project_id WHERE NOT EXISTS (SELECT 1 FROM project_stats WHERE project_id = NEW.project_id);
+    UPDATE project_stats
+    SET total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status = 'завершено'),
+        total_hours = total_hours + NEW.hours_worked,
+        labor_cost = labor_cost + NEW.hours_worked * COALESCE((SELECT hourly_rate FROM developers WHERE id = NEW.developer_id), 0)
+    WHERE project_id = NEW.project_id;
+
+    INSERT INTO developer_stats (developer_id)
+    SELECT NEW.developer_id WHERE NEW.developer_id IS NOT NULL
+        AND NOT EXISTS (SELECT 1 FROM developer_stats WHERE developer_id = NEW.developer_id);
+    UPDATE developer_stats
+    SET total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status = 'завершено'),
+        total_hours = total_hours + NEW.hours_worked,
+        total_earnings = total_earnings + NEW.hours_worked * (SELECT hourly_rate FROM developers WHERE id = NEW.developer_id)
+    WHERE developer_id = NEW.developer_id;
+END;
+
+DROP TRIGGER IF EXISTS stats_task_delete;
+CREATE TRIGGER stats_task_delete
+AFTER DELETE ON tasks
+BEGIN
+    UPDATE project_stats
+    SET total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status = 'завершено'),
+        total_hours = total_hours - OLD.hours_worked,
+        labor_cost = labor_cost - OLD.hours_worked * COALESCE((SELECT hourly_rate FROM developers WHERE id = OLD.developer_id), 0)
+    WHERE project_id = OLD.project_id;
+
+    UPDATE developer_stats
+    SET total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status = 'завершено'),
+        total_hours = total_hours - OLD.hours_worked,
+        total_earnings = total_earnings - OLD.hours_worked * (SELECT hourly_rate FROM developers WHERE id = OLD.developer_id)
+    WHERE developer_id = OLD.developer_id;
+END;
+
+DROP TRIGGER IF EXISTS stats_task_update;
+CREATE TRIGGER stats_task_update
+AFTER UPDATE OF project_id, developer_id, status, hours_worked ON tasks
+BEGIN
+    UPDATE project_stats
+    SET total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status = 'завершено'),
+        total_hours = total_hours - OLD.hours_worked,
+        labor_cost = labor_cost - OLD.hours_worked * COALESCE((SELECT hourly_rate FROM developers WHERE id = OLD.developer_id), 0)
+    WHERE project_id = OLD.project_id;
+
+    UPDATE developer_stats
+    SET total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status = 'завершено'),
+        total_hours = total_hours - OLD.hours_worked,
+        total_earnings = total_earnings - OLD.hours_worked * (SELECT hourly_rate FROM developers WHERE id = OLD.developer_id)
+    WHERE developer_id = OLD.developer_id;
+
+    INSERT INTO project_stats (project_id)
+    SELECT NEW.project_id WHERE NOT EXISTS (SELECT 1 FROM project_stats WHERE project_id = NEW.project_id);
+    UPDATE project_stats
+    SET total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status = 'завершено'),
+        total_hours = total_hours + NEW.hours_worked,
+        labor_cost = labor_cost + NEW.hours_worked * COALESCE((SELECT hourly_rate FROM developers WHERE id = NEW.developer_id), 0)
+    WHERE project_id = NEW.project_id;
+
+    INSERT INTO developer_stats (developer_id)
+    SELECT NEW.developer_id WHERE NEW.developer_id IS NOT NULL
+        AND NOT EXISTS (SELECT 1 FROM developer_stats WHERE developer_id = NEW.developer_id);
+    UPDATE developer_stats
+    SET total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status = 'завершено'),
+        total_hours = total_hours + NEW.hours_worked,
+        total_earnings = total_earnings + NEW.hours_worked * (SELECT hourly_rate FROM developers WHERE id = NEW.developer_id)
+    WHERE developer_id = NEW.developer_id;
+END;
+
+-- =============================================
+-- Представления поверх сводных таблиц
+-- =============================================
+DROP VIEW IF EXISTS view_project_stats;
+CREATE VIEW view_project_stats AS
+SELECT
+    p.id,
+    p.name,
+    p.client,
+    p.deadline,
+    p.budget,
+    p.status,
+    p.created_at,
+    COALESCE(s.total_tasks, 0) AS total_tasks,
+    COALESCE(s.completed_tasks, 0) AS completed_tasks,
+    ROUND(COALESCE(s.completed_tasks, 0) * 100.0 / CASE WHEN COALESCE(s.total_tasks, 0) = 0 THEN 1 ELSE s.total_tasks END, 2) AS completion_percentage,
+    COALESCE(s.total_hours, 0) AS total_hours,
+    COALESCE(s.labor_cost, 0) AS labor_cost,
+    u.username AS created_by_username
+FROM projects p
+LEFT JOIN project_stats s ON s.project_id = p.id
+LEFT JOIN users u ON p.created_by = u.id;
+
+DROP VIEW IF EXISTS view_developer_stats;
+CREATE VIEW view_developer_stats AS
+SELECT
+    d.id,
+    d.full_name,
+    d.position,
+    d.hourly_rate,
+    u.username AS user_username,
+    COALESCE(s.total_tasks, 0) AS total_tasks,
+    COALESCE(s.completed_tasks, 0) AS completed_tasks,
+    COALESCE(s.total_hours, 0) AS total_hours,
+    COALESCE(s.total_earnings, 0) AS total_earnings
+FROM developers d
+LEFT JOIN developer_stats s ON s.developer_id = d.id
+LEFT JOIN users u ON d.user_id = u.id;
@@ -0,0 +1,26 @@
+-- =============================================
+-- Поиск дубликата задачи без учета NULL-семантики "="
+-- Задачи без разработчика с тем же проектом и описанием считаются
+-- дубликатами, как в TaskService.create_task и bulk_create_tasks.
+-- Скрипт идемпотентен и выполняется после kaban.sql.
+-- =============================================
+DROP TRIGGER IF EXISTS upsert_task;
+CREATE TRIGGER upsert_task
+BEFORE INSERT ON tasks
+WHEN EXISTS (
+    SELECT 1 FROM tasks
+    WHERE project_id = NEW.project_id
+    AND developer_id IS NEW.developer_id
+    AND description = NEW.description
+)
+BEGIN
+    UPDATE tasks
+    SET status = NEW.status,
+        hours_worked = NEW.hours_worked,
+        created_by = COALESCE(NEW.created_by, created_by)
+    WHERE project_id = NEW.project_id
+    AND developer_id IS NEW.developer_id
+    AND description = NEW.description;
+
+    SELECT raise(IGNORE);
+END;
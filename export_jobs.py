@@ -0,0 +1,365 @@
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from models import DBManager
+from paths import REPORTS_DIR
+from services.export_service import ExportService, ExportQuery
+
+
+class ExportCancelled(Exception):
+    """
+    Экспорт отменен пользователем
+    """
+
+
+class ExportJob:
+    """
+    Фоновая задача экспорта
+
+    Attributes:
+        id: Номер задачи
+        key: Ключ содержимого; одинаковые выгрузки имеют одинаковый ключ
+        title: Название выгрузки для интерфейса
+        export_format: csv или excel
+        filename: Файл, в который пишется выгрузка
+        targets: Другие файлы, куда копируется готовая выгрузка (совпавшие запросы)
+        status: queued, running, done, failed или cancelled
+        rows: Число записанных строк
+        error: Текст ошибки
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    STATUS_NAMES = {
+        QUEUED: 'в очереди',
+        RUNNING: 'выполняется',
+        DONE: 'готово',
+        FAILED: 'ошибка',
+        CANCELLED: 'отменено',
+    }
+
+    def __init__(self, job_id, key, title, export_format, filename, work):
+        self.id = job_id
+        self.key = key
+        self.title = title
+        self.export_format = export_format
+        self.filename = filename
+        self.targets = []
+        self.status = self.QUEUED
+        self.rows = 0
+        self.error = None
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self._work = work
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._future = None
+
+    @property
+    def is_active(self):
+        return self.status in (self.QUEUED, self.RUNNING)
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Ждет завершения задачи
+
+        Returns:
+            bool: Задача завершена
+        """
+        return self._done_event.wait(timeout)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'format': self.export_format,
+            'filename': self.filename,
+            'targets': list(self.targets),
+            'status': self.status,
+            'rows': self.rows,
+            'error': self.error,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'finished_at': self.finished_at.strftime('%Y-%m-%d %H:%M:%S') if self.finished_at else None,
+        }
+
+
+class ExportJobManager:
+    """
+    Очередь фоновых экспортов
+
+    Выгрузки выполняются в пуле рабочих потоков, лишние ждут в очереди
+    пула. Ход выполнения (число записанных строк) и смена состояния
+    сообщаются подписчикам; задачу можно отменить в очереди или на ходу —
+    запись прерывается на ближайшей пачке строк, недописанный файл
+    удаляется. Если такая же выгрузка уже стоит в очереди или выполняется,
+    новая не запускается: возвращается существующая задача, а готовый файл
+    копируется и по новому пути. Завершенные выгрузки записываются в
+    журнал в каталоге reports/.
+    """
+    DEFAULT_WORKERS = 2
+    HISTORY_FILE = 'export_history.jsonl'
+    MAX_HISTORY = 200
+
+    EXTENSIONS = {'csv': '.csv', 'excel': '.xlsx'}
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, export_service=None, reports_dir=None, max_workers=None):
+        """
+        Args:
+            export_service: Сервис экспорта
+            reports_dir: Каталог для файлов по умолчанию и журнала выгрузок
+            max_workers: Число рабочих потоков
+        """
+        self.export_service = export_service or ExportService()
+        self.reports_dir = reports_dir or REPORTS_DIR
+        self.history_path = os.path.join(self.reports_dir, self.HISTORY_FILE)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.DEFAULT_WORKERS, thread_name_prefix='ExportJob'
+        )
+        self._lock = threading.Lock()
+        self._history_lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._jobs = {}
+        self._active = {}
+        self._listeners = []
+
+    @classmethod
+    def shared(cls):
+        """
+        Общая очередь экспортов приложения
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def add_listener(self, callback):
+        """
+        Подписывает функцию на изменения задач
+
+        Функция вызывается с объектом ExportJob в потоке, где изменилась
+        задача (обычно в рабочем потоке пула).
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, job):
+        for callback in list(self._listeners):
+            try:
+                callback(job)
+            except Exception:
+                pass
+
+    def default_filename(self, title, export_format):
+        slug = '_'.join(str(title).lower().split()) or 'export'
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return os.path.join(self.reports_dir, f'{slug}_{timestamp}{self.EXTENSIONS[export_format]}')
+
+    def submit_query(self, entity, filters=None, export_format='csv', filename=None, compress=None):
+        """
+        Ставит в очередь выгрузку из базы
+
+        Args:
+            entity: Тип выгрузки (tasks, projects, developers)
+            filters: Фильтры поиска (см. ExportQuery)
+            export_format: csv или excel
+            filename: Путь к файлу (по умолчанию — в каталоге reports/)
+            compress: Сжимать CSV gzip
+
+        Returns:
+            ExportJob: Новая задача или уже идущая такая же
+        """
+        query = ExportQuery(entity, **(filters or {}))
+        title = self.export_service.QUERY_EXPORTS[entity][1]
+        if filename and compress is None:
+            compress = filename.lower().endswith('.gz')
+        if compress and not filename and export_format == 'csv':
+            filename = self.default_filename(title, export_format) + '.gz'
+        key = ('query', export_format, bool(compress), query.key())
+
+        def work(progress, target):
+            if export_format == 'excel':
+                return self.export_service.export_query_to_excel(query, target, progress=progress)
+            return self.export_service.export_query_to_csv(query, target, compress, progress)
+
+        return self._submit(key, title, export_format, filename, work)
+
+    def submit_report(self, report_data, export_format='csv', filename=None):
+        """
+        Ставит в очередь экспорт готового отчета
+
+        Returns:
+            ExportJob: Новая задача или уже идущая такая же
+        """
+        title = report_data.get('report_name', 'Отчет')
+        digest = hashlib.sha1(
+            json.dumps(report_data, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        key = ('report', export_format, digest)
+
+        def work(progress, target):
+            headers, rows = ExportService.format_report_data(report_data)
+            if export_format == 'excel':
+                return ExportService.export_to_excel(rows, target, title, headers, progress=progress)
+            return ExportService.export_to_csv(rows, target, headers, progress=progress)
+
+        return self._submit(key, title, export_format, filename, work)
+
+    def _submit(self, key, title, export_format, filename, work):
+        if export_format not in self.EXTENSIONS:
+            raise ValueError(f"Неизвестный формат экспорта: {export_format}")
+
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None:
+                # Такая же выгрузка уже идет — готовый файл будет скопирован
+                if filename and filename != job.filename and filename not in job.targets:
+                    job.targets.append(filename)
+                return job
+
+            job = ExportJob(next(self._counter), key, title, export_format,
+                            filename or self.default_filename(title, export_format), work)
+            self._jobs[job.id] = job
+            self._active[key] = job
+            job._future = self._executor.submit(self._run, job)
+        self._notify(job)
+        return job
+
+    def _run(self, job):
+        try:
+            if job.cancel_requested:
+                raise ExportCancelled()
+            job.status = ExportJob.RUNNING
+            job.started_at = datetime.now()
+            self._notify(job)
+
+            def progress(rows):
+                job.rows = rows
+                if job.cancel_requested:
+                    raise ExportCancelled()
+                self._notify(job)
+
+            result = job._work(progress, job.filename)
+            if job.cancel_requested:
+                raise ExportCancelled()
+            if not result['success']:
+                raise RuntimeError(result.get('error'))
+
+            job.rows = result.get('rows_count', job.rows)
+            for target in job.targets:
+                os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+                shutil.copyfile(job.filename, target)
+            self._finish(job, ExportJob.DONE)
+        except ExportCancelled:
+            self._finish(job, ExportJob.CANCELLED)
+        except Exception as e:
+            self._finish(job, ExportJob.FAILED, str(e))
+        finally:
+            (self.export_service.db_manager or DBManager()).release_connection()
+
+    def _finish(self, job, status, error=None):
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.finished_at = datetime.now()
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+        self._append_history(job)
+        job._done_event.set()
+        self._notify(job)
+
+    def cancel(self, job_id):
+        """
+        Отменяет задачу: из очереди она снимается, идущая прерывается
+
+        Returns:
+            bool: Задача была активна
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.is_active:
+                return False
+            job._cancel_event.set()
+            # Снять с пула можно только еще не начатую задачу
+            dequeued = job._future.cancel()
+        if dequeued:
+            self._finish(job, ExportJob.CANCELLED)
+        return True
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def jobs(self, active_only=False):
+        """
+        Задачи текущего сеанса, последние — первыми
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if active_only:
+            jobs = [job for job in jobs if job.is_active]
+        return sorted(jobs, key=lambda job: job.id, reverse=True)
+
+    def _append_history(self, job):
+        try:
+            with self._history_lock:
+                os.makedirs(self.reports_dir, exist_ok=True)
+                with open(self.history_path, 'a', encoding='utf-8') as history_file:
+                    history_file.write(json.dumps(job.to_dict(), ensure_ascii=False) + '\n')
+                # Журнал ограничен последними MAX_HISTORY записями
+                with open(self.history_path, 'r', encoding='utf-8') as history_file:
+                    lines = history_file.readlines()
+                if len(lines) > self.MAX_HISTORY * 2:
+                    with open(self.history_path, 'w', encoding='utf-8') as history_file:
+                        history_file.writelines(lines[-self.MAX_HISTORY:])
+        except OSError:
+            pass
+
+    def history(self, limit=50):
+        """
+        Журнал завершенных выгрузок, последние — первыми
+
+        Returns:
+            list: Словари ExportJob.to_dict()
+        """
+        with self._history_lock:
+            try:
+                with open(self.history_path, 'r', encoding='utf-8') as history_file:
+                    lines = history_file.readlines()
+            except OSError:
+                return []
+        entries = []
+        for line in reversed(lines):
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+            if limit and len(entries) >= limit:
+                break
+        return entries
+
+    def shutdown(self, wait=False):
+        """
+        Отменяет все задачи и останавливает пул
+        """
+        for job in self.jobs(active_only=True):
+            self.cancel(job.id)
+        self._executor.shutdown(wait=wait)
@@ -1,47 +1,75 @@
 import os
 import sys
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import QTimer
+from startup_trace import trace
+
+with trace.span('Импорт PyQt5'):
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    from PyQt5.QtGui import QIcon, QFont
+    from PyQt5.QtCore import QTimer
 
 from paths import ROOT_DIR, resource_path
-from database.bootstrap import ensure_database
-from notification_scheduler import NotificationScheduler
-from ui import LoginWindow, MainWindow, SplashScreen
 
 
 def main():
     os.chdir(ROOT_DIR)
 
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
-    app.setApplicationName('KABAN:manager')
-    app.setWindowIcon(QIcon(resource_path('ui', 'resources', 'icons', 'logo.png')))
-    app.setFont(QFont('Segoe UI', 10))
+    with trace.span('QApplication'):
+        app = QApplication(sys.argv)
+        app.setStyle('Fusion')
+        app.setApplicationName('KABAN:manager')
+        app.setWindowIcon(QIcon(resource_path('ui', 'resources', 'icons', 'logo.png')))
+        app.setFont(QFont('Segoe UI', 10))
 
-    from ui.resources.theme_manager import apply_theme
-    apply_theme(app)
+    with trace.span('Тема'):
+        from ui.resources.theme_manager import apply_theme
+        apply_theme(app)
 
-    ensure_database()
+    with trace.span('Заставка'):
+        from ui.splash_screen import SplashScreen
+        from ui.startup_loader import StartupLoader
+        splash = SplashScreen()
+        splash.show()
 
-    notification_scheduler = NotificationScheduler()
-    notification_scheduler.run_checks()
+    # Заставка видна, пока идет подготовка, а не фиксированное время
+    from database.bootstrap import ensure_database, warm_up
+    loader = StartupLoader([
+        ('Проверка схемы базы данных...', ensure_database),
+        ('Прогрев кэша...', warm_up),
+    ])
+    loader.step_started.connect(splash.set_step)
 
-    splash = SplashScreen()
-    splash.show()
-    splash.start_progress()
+    def on_failed(message):
+        splash.close()
+        QMessageBox.critical(None, 'Ошибка запуска', f'Не удалось подготовить базу данных:\n{message}')
+        app.exit(1)
 
     def show_login():
+        splash.set_ready()
+        with trace.span('Окно входа'):
+            from ui.login_window import LoginWindow
+            login_window = LoginWindow()
         splash.close()
-        login_window = LoginWindow()
-        if login_window.exec_():
-            app.main_window = MainWindow(login_window.user)
-            app.main_window.show()
-        else:
+        trace.mark('Окно входа показано')
+        if not login_window.exec_():
             sys.exit(0)
 
-    QTimer.singleShot(2500, show_login)
+        # Проверки уведомлений идут в фоне и не задерживают запуск
+        from notification_scheduler import NotificationScheduler
+        notification_scheduler = NotificationScheduler()
+        notification_scheduler.start(initial_delay=5)
+        app.aboutToQuit.connect(notification_scheduler.stop)
+
+        with trace.span('Главное окно'):
+            from ui.main_window import MainWindow
+            app.main_window = MainWindow(login_window.user, notification_scheduler)
+            app.main_window.show()
+        # Отчет пишется после первой отрисовки главного окна
+        QTimer.singleShot(0, trace.finish)
+
+    loader.failed.connect(on_failed)
+    loader.finished.connect(show_login)
+    loader.start()
     sys.exit(app.exec_())
 
 
@@ -1,8 +1,11 @@
 from models.developer import Developer
 from models.project import Project
 from models.task import Task
+from models.task_row import TaskRow, TaskRows
 from models.db_manager import DBManager
+from models.connection_pool import ConnectionPool
+from models.query_profiler import QueryProfiler
 from models.user import User
 from models.notification import Notification
 
-__all__ = ['Developer', 'Project', 'Task', 'DBManager', 'User', 'Notification']
+__all__ = ['Developer', 'Project', 'Task', 'TaskRow', 'TaskRows', 'DBManager', 'ConnectionPool', 'QueryProfiler', 'User', 'Notification']
@@ -0,0 +1,217 @@
+import sqlite3
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """
+    Пул соединений SQLite с привязкой соединения к потоку.
+
+    Каждый поток работает через собственное соединение, поэтому запросы
+    из рабочих потоков (отчеты, уведомления) не делят курсор с GUI-потоком.
+    Освобожденные соединения возвращаются в пул и переиспользуются.
+    """
+    MEMORY_PATH = ':memory:'
+
+    # Размер кэша подготовленных операторов каждого соединения (по умолчанию
+    # в sqlite3 — 128): вмещает реестр STATEMENTS, варианты поисковых запросов
+    # и запросы моделей, чтобы горячие запросы не разбирались повторно
+    CACHED_STATEMENTS = 512
+
+    def __init__(self, db_path, max_idle=4, timeout=30.0):
+        """
+        Args:
+            db_path: Путь к файлу базы данных или ':memory:'
+            max_idle: Максимальное количество простаивающих соединений в пуле
+            timeout: Время ожидания блокировки базы данных в секундах
+        """
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._idle = []
+        self._connections = set()
+        self._owners = {}
+        self._generation = 0
+        self._keeper = None
+
+        # Для базы в памяти все соединения должны видеть одни и те же данные,
+        # поэтому используется именованная база с общим кэшем
+        if db_path == self.MEMORY_PATH:
+            self._uri = f"file:kaban-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        else:
+            self._uri = None
+
+    @property
+    def is_memory(self):
+        return self._uri is not None
+
+    def _create_connection(self):
+        if self.is_memory:
+            conn = sqlite3.connect(self._uri, uri=True, timeout=self.timeout, check_same_thread=False,
+                                   cached_statements=self.CACHED_STATEMENTS)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                                   cached_statements=self.CACHED_STATEMENTS)
+            # WAL позволяет читать из GUI-потока, пока рабочий поток пишет
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        # Внешние ключи включаются для каждого соединения: в скриптах миграций
+        # PRAGMA foreign_keys выполняется внутри транзакции и не действует
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _state(self):
+        state = self._local
+        if getattr(state, 'generation', None) != self._generation:
+            state.generation = self._generation
+            state.conn = None
+            state.depth = 0
+            state.pinned = False
+        return state
+
+    def _reclaim_orphans(self):
+        """
+        Возвращает в пул соединения потоков, которые уже завершились
+        """
+        for conn, owner in list(self._owners.items()):
+            thread = owner()
+            if thread is None or not thread.is_alive():
+                del self._owners[conn]
+                self._reset(conn)
+                self._idle.append(conn)
+
+    @staticmethod
+    def _reset(conn):
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+
+    def _acquire(self):
+        with self._lock:
+            if self.is_memory and self._keeper is None:
+                # Держим базу в памяти живой, пока пул не закрыт
+                self._keeper = self._create_connection()
+            self._reclaim_orphans()
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = self._create_connection()
+                self._connections.add(conn)
+            self._owners[conn] = weakref.ref(threading.current_thread())
+            return conn
+
+    def _release(self, conn):
+        with self._lock:
+            self._owners.pop(conn, None)
+            if conn not in self._connections:
+                return
+            self._reset(conn)
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+            else:
+                self._connections.discard(conn)
+                conn.close()
+
+    def checkout(self, pin=False):
+        """
+        Выдает соединение текущего потока
+
+        Повторные вызовы в одном потоке возвращают то же соединение.
+
+        Args:
+            pin: Закрепить соединение за потоком до явного release()
+
+        Returns:
+            sqlite3.Connection: Соединение текущего потока
+        """
+        state = self._state()
+        if state.conn is None:
+            state.conn = self._acquire()
+        state.depth += 1
+        state.pinned = state.pinned or pin
+        return state.conn
+
+    def checkin(self, conn):
+        """
+        Возвращает соединение, полученное через checkout()
+
+        Незакрепленное соединение уходит в пул после последнего checkin().
+        """
+        state = self._state()
+        if state.conn is not conn:
+            return
+        state.depth = max(state.depth - 1, 0)
+        if state.depth == 0 and not state.pinned:
+            state.conn = None
+            self._release(conn)
+
+    def current(self):
+        """
+        Возвращает соединение, уже выданное текущему потоку, или None
+        """
+        return self._state().conn
+
+    def release(self):
+        """
+        Открепляет соединение текущего потока и возвращает его в пул
+        """
+        state = self._state()
+        conn = state.conn
+        state.conn = None
+        state.depth = 0
+        state.pinned = False
+        if conn is not None:
+            self._release(conn)
+
+    @contextmanager
+    def connection(self):
+        """
+        Контекстный менеджер checkout/checkin
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    def close_all(self):
+        """
+        Закрывает все соединения пула
+        """
+        with self._lock:
+            connections = list(self._connections)
+            if self._keeper is not None:
+                connections.append(self._keeper)
+            self._connections.clear()
+            self._idle.clear()
+            self._owners.clear()
+            self._keeper = None
+            self._generation += 1
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def stats(self):
+        """
+        Возвращает состояние пула
+
+        Returns:
+            dict: Количество открытых, простаивающих и занятых соединений
+        """
+        with self._lock:
+            return {
+                'open': len(self._connections),
+                'idle': len(self._idle),
+                'in_use': len(self._owners)
+            }
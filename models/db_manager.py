@@ -1,57 +1,220 @@
-import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 
 from paths import DB_PATH
+from database.migrations import migrate
+from models.connection_pool import ConnectionPool
+from models.query_profiler import QueryProfiler
+from models.entity_cache import EntityCache
+from models.report_cache import ReportCache
 
 
 class DBManager:
+    """
+    Менеджер базы данных.
+
+    Соединения берутся из пула ConnectionPool: у каждого потока свое
+    соединение и свой курсор, поэтому менеджер можно использовать
+    из рабочих потоков параллельно с GUI.
+    """
     _instance = None
 
     def __new__(cls, db_path=None):
         if cls._instance is None:
-            cls._instance = super(DBManager, cls).__new__(cls)
-            cls._instance.db_path = db_path or DB_PATH
-            cls._instance.conn = None
-            cls._instance.cursor = None
+            instance = super(DBManager, cls).__new__(cls)
+            instance.db_path = db_path or DB_PATH
+            instance.pool = ConnectionPool(instance.db_path)
+            instance._local = threading.local()
+            instance.profiler = None
+            instance.entity_cache = EntityCache()
+            instance.report_cache = ReportCache()
+            cls._instance = instance
+            # KABAN_SQL_PROFILE=1 включает профилирование с запуска,
+            # KABAN_SQL_SLOW_MS задает порог медленного запроса
+            if os.environ.get('KABAN_SQL_PROFILE'):
+                slow_ms = os.environ.get('KABAN_SQL_SLOW_MS')
+                instance.enable_profiling(float(slow_ms) if slow_ms else None)
         return cls._instance
 
+    def enable_profiling(self, slow_ms=None, **kwargs):
+        """
+        Включает профилирование запросов
+
+        Args:
+            slow_ms: Порог медленного запроса в миллисекундах
+            kwargs: Прочие параметры QueryProfiler
+
+        Returns:
+            QueryProfiler: Активный профилировщик
+        """
+        if self.profiler is None:
+            self.profiler = QueryProfiler(slow_ms=slow_ms, **kwargs)
+        elif slow_ms is not None:
+            self.profiler.slow_ms = slow_ms
+        return self.profiler
+
+    def disable_profiling(self):
+        """
+        Выключает профилирование; накопленная статистика отбрасывается
+        """
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.close()
+
+    @property
+    def conn(self):
+        """
+        Соединение текущего потока
+        """
+        return self.connect()
+
+    @property
+    def cursor(self):
+        """
+        Курсор текущего потока
+        """
+        conn = self.pool.current()
+        if conn is None:
+            return None
+        return self._thread_cursor(conn)
+
+    def _thread_cursor(self, conn):
+        local = self._local
+        if getattr(local, 'conn', None) is not conn:
+            local.conn = conn
+            local.cursor = conn.cursor()
+        return local.cursor
 
-    def begin_transaction(self):
+    def begin_transaction(self, immediate=False):
         """
         Начинает новую транзакцию
+
+        Args:
+            immediate: Сразу захватить блокировку записи (BEGIN IMMEDIATE)
         """
         try:
-            self.connect()
-            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.execute("BEGIN IMMEDIATE TRANSACTION" if immediate else "BEGIN TRANSACTION")
             return True
         except Exception:
             return False
 
     def connect(self):
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
-        return self.conn
+        """
+        Закрепляет соединение из пула за текущим потоком
+
+        Returns:
+            sqlite3.Connection: Соединение текущего потока
+        """
+        conn = self.pool.current()
+        if conn is None:
+            conn = self.pool.checkout(pin=True)
+        self._thread_cursor(conn)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        Выдает соединение из пула на время блока with
+
+        Если поток уже держит соединение, используется оно же.
+        """
+        with self.pool.connection() as conn:
+            yield conn
+
+    def release_connection(self):
+        """
+        Возвращает соединение текущего потока в пул
+
+        Вызывается рабочими потоками по завершении работы.
+        """
+        self._local.conn = None
+        self._local.cursor = None
+        self.pool.release()
+
+    def query(self, query, params=None):
+        """
+        Выполняет запрос в отдельном курсоре соединения текущего потока
+
+        Returns:
+            sqlite3.Cursor: Курсор с результатом запроса
+        """
+        cursor = self.conn.cursor()
+        if self.profiler is not None:
+            return self.profiler.execute(cursor, query, params)
+        if params:
+            return cursor.execute(query, params)
+        return cursor.execute(query)
+
+    def query_one(self, query, params=None):
+        """
+        Выполняет запрос и возвращает первую строку
+
+        Returns:
+            dict: Строка результата или None
+        """
+        with self.connection() as conn:
+            if self.profiler is not None:
+                row = self.profiler.execute(conn.cursor(), query, params).fetchone()
+                self.profiler.flush()
+            else:
+                row = conn.execute(query, params or ()).fetchone()
+            return dict(row) if row else None
+
+    def query_all(self, query, params=None):
+        """
+        Выполняет запрос и возвращает все строки
+
+        Returns:
+            list: Список словарей с данными
+        """
+        with self.connection() as conn:
+            if self.profiler is not None:
+                rows = self.profiler.execute(conn.cursor(), query, params).fetchall()
+            else:
+                rows = conn.execute(query, params or ()).fetchall()
+            return [dict(row) for row in rows]
+
+    def query_one_cached(self, kind, key, query):
+        """
+        Чтение строки по ключу через кэш сущностей
+
+        Args:
+            kind: Вид записи для кэша (например, 'developers')
+            key: Ключ, он же единственный параметр запроса
+            query: Запрос, возвращающий не более одной строки
+
+        Returns:
+            dict: Строка результата или None
+        """
+        with self.connection() as conn:
+            return self.entity_cache.get(kind, key, conn, lambda: self.query_one(query, (key,)))
 
     def close(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None
-            self.cursor = None
+        self._local = threading.local()
+        self.entity_cache.clear()
+        self.report_cache.clear()
+        self.pool.close_all()
 
     def execute(self, query, params=None):
         self.connect()
+        if self.profiler is not None:
+            return self.profiler.execute(self.cursor, query, params)
         if params:
             return self.cursor.execute(query, params)
         return self.cursor.execute(query)
 
     def execute_many(self, query, params_list):
         self.connect()
+        if self.profiler is not None:
+            return self.profiler.execute(self.cursor, query, params_list, many=True)
         return self.cursor.executemany(query, params_list)
 
     def fetch_one(self):
-        row = self.cursor.fetchone()
+        if self.profiler is not None:
+            row = self.profiler.fetch(self.cursor, 'fetchone')
+        else:
+            row = self.cursor.fetchone()
         return dict(row) if row else None
 
     def fetch_all(self):
@@ -63,7 +226,11 @@ class DBManager:
          """
         if self.cursor:
             columns = [column[0] for column in self.cursor.description]
-            return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
+            if self.profiler is not None:
+                rows = self.profiler.fetch(self.cursor, 'fetchall')
+            else:
+                rows = self.cursor.fetchall()
+            return [dict(zip(columns, row)) for row in rows]
         return []
 
     def commit(self):
@@ -77,9 +244,10 @@ class DBManager:
             return False
 
     def rollback(self):
-        if self.conn:
+        conn = self.pool.current()
+        if conn:
             try:
-                self.conn.rollback()
+                conn.rollback()
             except Exception:
                 return False
             return True
@@ -88,6 +256,14 @@ class DBManager:
     def get_last_row_id(self):
         return self.cursor.lastrowid
 
+    def run_script(self, script_path):
+        """
+        Выполняет SQL-скрипт из файла и фиксирует изменения
+        """
+        with open(script_path, 'r', encoding='utf-8') as sql_file:
+            self.conn.executescript(sql_file.read())
+        self.commit()
+
     def table_exists(self, table_name):
         self.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
@@ -96,26 +272,14 @@ class DBManager:
         return self.fetch_one() is not None
 
     def create_tables_if_not_exist(self):
-        try:
-            tables = ['developers', 'projects', 'tasks']
-            for table in tables:
-                if not self.table_exists(table):
-                    script_dir = os.path.dirname(os.path.dirname(__file__))
-                    sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
-
-                    if not os.path.exists(sql_path):
-                        return False
-
-                    with open(sql_path, 'r', encoding='utf-8') as sql_file:
-                        sql_script = sql_file.read()
-
-                    self.conn.executescript(sql_script)
-                    self.commit()
-                    return True
+        """
+        Создает или обновляет схему базы (см. database/migrations.py)
 
+        Returns:
+            bool: Схема в актуальной версии
+        """
+        try:
+            migrate(self.conn)
             return True
-
-
-
         except Exception:
             return False
\ No newline at end of file
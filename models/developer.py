@@ -95,11 +95,10 @@ class Developer:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
-                "SELECT * FROM developers WHERE id = ?",
-                (developer_id,)
+            data = db_manager.query_one_cached(
+                'developers', developer_id,
+                "SELECT * FROM developers WHERE id = ?"
             )
-            data = db_manager.fetch_one()
 
             if data:
                 return cls.from_dict(data)
@@ -113,8 +112,7 @@ class Developer:
         db_manager = DBManager()
 
         try:
-            db_manager.execute("SELECT * FROM developers")
-            data_list = db_manager.fetch_all()
+            data_list = db_manager.query_all("SELECT * FROM developers")
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -126,11 +124,10 @@ class Developer:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data_list = db_manager.query_all(
                 "SELECT * FROM developers WHERE position = ?",
                 (position,)
             )
-            data_list = db_manager.fetch_all()
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -151,17 +148,14 @@ class Developer:
             return 0
 
         try:
+            # Часы поддерживаются триггерами в developer_stats (database/stats.sql)
             self.db_manager.execute(
-                """
-                SELECT SUM(hours_worked) as total_hours
-                FROM tasks
-                WHERE developer_id = ?
-                """,
+                "SELECT total_hours FROM developer_stats WHERE developer_id = ?",
                 (self.id,)
             )
             result = self.db_manager.fetch_one()
 
-            total_hours = result['total_hours'] if result['total_hours'] else 0
+            total_hours = result['total_hours'] if result and result['total_hours'] else 0
             return total_hours * self.hourly_rate
 
         except Exception as e:
@@ -0,0 +1,118 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class EntityCache:
+    """
+    Кэш строк, читаемых по ключу (разработчик, проект, пользователь по ID)
+
+    Записи живут не дольше ttl секунд, число записей ограничено (LRU).
+    Кэш сбрасывается целиком, как только база могла измениться:
+    перед каждым чтением сверяется подпись соединения — PRAGMA data_version
+    (меняется после фиксации изменений другими соединениями, в том числе
+    из других процессов) и total_changes (изменения самого соединения,
+    включая сделанные триггерами). Поэтому любая запись в базу, через
+    сервисы, модели или напрямую, делает кэш недействительным без явных
+    вызовов. Внутри незавершенной транзакции кэш не используется.
+    """
+    DEFAULT_TTL = 60.0
+    DEFAULT_MAX_ENTRIES = 2048
+    MAX_CONNECTIONS = 16
+
+    def __init__(self, ttl=None, max_entries=None):
+        self.ttl = self.DEFAULT_TTL if ttl is None else ttl
+        self.max_entries = self.DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        # id(conn) -> (conn, подпись); ссылка на соединение не дает переиспользовать id
+        self._signatures = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self, conn):
+        signature = (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+        with self._lock:
+            known = self._signatures.get(id(conn))
+            if known is None or known[1] != signature:
+                # Новое соединение или база изменилась — прежним записям верить нельзя
+                if known is None and len(self._signatures) >= self.MAX_CONNECTIONS:
+                    self._forget_closed()
+                self._signatures[id(conn)] = (conn, signature)
+                self._clear()
+
+    def _forget_closed(self):
+        for conn_id, (conn, _) in list(self._signatures.items()):
+            try:
+                conn.total_changes
+            except sqlite3.ProgrammingError:
+                del self._signatures[conn_id]
+
+    def get(self, kind, key, conn, load):
+        """
+        Возвращает строку из кэша или загружает ее
+
+        Args:
+            kind: Вид записи (обычно имя таблицы)
+            key: Ключ записи (ID)
+            conn: Соединение, через которое выполняется чтение
+            load: Функция загрузки строки (dict или None)
+
+        Returns:
+            dict: Копия строки или None
+        """
+        if conn.in_transaction:
+            return load()
+        self._check_version(conn)
+
+        entry_key = (kind, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        data = load()
+        if data is None:
+            return None
+
+        with self._lock:
+            # Пока строка читалась, кэш мог быть сброшен
+            if generation == self._generation:
+                self._entries[entry_key] = (now + self.ttl, dict(data))
+                self._entries.move_to_end(entry_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return dict(data)
+
+    def invalidate(self, kind=None, key=None):
+        """
+        Удаляет запись, все записи вида kind или весь кэш
+        """
+        with self._lock:
+            if kind is None:
+                self._clear()
+            elif key is not None:
+                self._entries.pop((kind, key), None)
+            else:
+                for entry_key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[entry_key]
+
+    def _clear(self):
+        self._entries.clear()
+        self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+            self._signatures = {}
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
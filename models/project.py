@@ -126,11 +126,10 @@ class Project:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
-                "SELECT * FROM projects WHERE id = ?",
-                (project_id,)
+            data = db_manager.query_one_cached(
+                'projects', project_id,
+                "SELECT * FROM projects WHERE id = ?"
             )
-            data = db_manager.fetch_one()
 
             if data:
                 return cls.from_dict(data)
@@ -143,8 +142,7 @@ class Project:
     def get_all(cls):
         db_manager = DBManager()
         try:
-            db_manager.execute("SELECT * FROM projects")
-            data_list = db_manager.fetch_all()
+            data_list = db_manager.query_all("SELECT * FROM projects")
             return [cls.from_dict(data) for data in data_list]
         except Exception as e:
             return []
@@ -154,11 +152,10 @@ class Project:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data_list = db_manager.query_all(
                 "SELECT * FROM projects WHERE client = ?",
                 (client,)
             )
-            data_list = db_manager.fetch_all()
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -185,22 +182,21 @@ class Project:
             }
 
         try:
+            # Агрегаты поддерживаются триггерами в project_stats (database/stats.sql)
             self.db_manager.execute(
                 """
-                SELECT 
-                    COUNT(*) as total_tasks,
-                    SUM(CASE WHEN status = 'завершено' THEN 1 ELSE 0 END) as completed_tasks,
-                    SUM(hours_worked) as total_hours
-                FROM tasks
+                SELECT total_tasks, completed_tasks, total_hours, labor_cost
+                FROM project_stats
                 WHERE project_id = ?
                 """,
                 (self.id,)
             )
-            result = self.db_manager.fetch_one()
+            result = self.db_manager.fetch_one() or {}
 
-            total_tasks = result['total_tasks']
-            completed_tasks = result['completed_tasks'] or 0
-            total_hours = result['total_hours'] or 0
+            total_tasks = result.get('total_tasks') or 0
+            completed_tasks = result.get('completed_tasks') or 0
+            total_hours = result.get('total_hours') or 0
+            labor_cost = result.get('labor_cost') or 0
 
             progress_percent = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
 
@@ -208,18 +204,6 @@ class Project:
             today = datetime.now().date()
             days_left = (deadline_date - today).days
 
-            self.db_manager.execute(
-                """
-                SELECT SUM(t.hours_worked * d.hourly_rate) as labor_cost
-                FROM tasks t
-                JOIN developers d ON t.developer_id = d.id
-                WHERE t.project_id = ?
-                """,
-                (self.id,)
-            )
-            labor_result = self.db_manager.fetch_one()
-            labor_cost = labor_result['labor_cost'] or 0
-
             return {
                 'total_tasks': total_tasks,
                 'completed_tasks': completed_tasks,
@@ -0,0 +1,374 @@
+import bisect
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+
+from paths import SLOW_QUERY_LOG_PATH
+
+_MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
+_ROOT_DIR = os.path.dirname(_MODELS_DIR)
+_SERVICES_DIR = os.path.join(_ROOT_DIR, 'services') + os.sep
+
+# Файлы, кадры которых пропускаются при поиске места вызова
+_INFRA_FILES = {
+    os.path.join(_MODELS_DIR, 'db_manager.py'),
+    os.path.join(_MODELS_DIR, 'query_profiler.py'),
+    os.path.join(_MODELS_DIR, 'connection_pool.py'),
+    os.path.join(_MODELS_DIR, 'entity_cache.py'),
+    os.path.join(_ROOT_DIR, 'services', 'base_service.py'),
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER_LIST = re.compile(r'\?(\s*,\s*\?)+')
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+OTHER_STATEMENTS = '<прочие запросы>'
+
+
+def normalize_sql(query):
+    """
+    Ключ запроса: одна строка без лишних пробелов, списки ?, ?, ? свернуты
+    """
+    query = _WHITESPACE.sub(' ', query).strip()
+    return _PLACEHOLDER_LIST.sub('?, ...', query)
+
+
+def _call_site():
+    """
+    Метод, из которого выполнен запрос
+
+    Предпочитается метод сервиса; если запрос выполнен не из сервиса,
+    берется первый кадр за пределами DBManager и BaseService.
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    depth = 0
+    while frame is not None and depth < 30:
+        filename = frame.f_code.co_filename
+        if filename not in _INFRA_FILES and 'contextlib' not in filename:
+            code = frame.f_code
+            name = getattr(code, 'co_qualname', code.co_name)
+            if filename.startswith(_SERVICES_DIR):
+                return name
+            if fallback is None:
+                # Функции вне классов дополняются именем модуля
+                fallback = name if '.' in name else f"{os.path.splitext(os.path.basename(filename))[0]}.{name}"
+        frame = frame.f_back
+        depth += 1
+    return fallback or '<неизвестно>'
+
+
+class _Record:
+    """
+    Один выполненный запрос: время растет, пока из курсора читаются строки
+    """
+    __slots__ = ('key', 'query', 'params', 'call_site', 'conn', 'elapsed', 'rows', 'done')
+
+    def __init__(self, key, query, params, call_site, conn, elapsed, rows):
+        self.key = key
+        self.query = query
+        self.params = params
+        self.call_site = call_site
+        self.conn = conn
+        self.elapsed = elapsed
+        self.rows = rows
+        self.done = False
+
+
+class StatementStats:
+    """
+    Накопленная статистика одного запроса с гистограммой длительностей
+    """
+    # Верхние границы корзин гистограммы в миллисекундах
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    __slots__ = ('sql', 'count', 'total', 'max', 'rows', 'slow', 'histogram', 'call_sites', 'plan')
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.call_sites = Counter()
+        self.plan = None
+
+    def add(self, elapsed, rows, call_site, slow):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.rows += rows
+        self.slow += slow
+        self.histogram[bisect.bisect_left(self.BUCKETS_MS, elapsed * 1000)] += 1
+        self.call_sites[call_site] += 1
+
+    def percentile(self, fraction):
+        """
+        Оценка перцентиля по гистограмме (верхняя граница корзины, мс)
+        """
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.histogram):
+            seen += bucket
+            if seen >= threshold:
+                return self.BUCKETS_MS[i] if i < len(self.BUCKETS_MS) else self.max * 1000
+        return self.max * 1000
+
+    def to_dict(self):
+        return {
+            'sql': self.sql,
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total * 1000 / self.count if self.count else 0.0,
+            'p95_ms': self.percentile(0.95),
+            'max_ms': self.max * 1000,
+            'rows': self.rows,
+            'slow': self.slow,
+            'call_sites': dict(self.call_sites.most_common()),
+            'histogram': list(self.histogram),
+            'plan': self.plan,
+        }
+
+
+class ProfiledCursor:
+    """
+    Обертка курсора, дописывающая время чтения и число строк в запись запроса
+    """
+
+    def __init__(self, profiler, cursor, record):
+        self._profiler = profiler
+        self._cursor = cursor
+        self._record = record
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            row = next(self._cursor)
+        except StopIteration:
+            self._profiler._fetched(self._record, 0, time.perf_counter() - started, True)
+            raise
+        self._profiler._fetched(self._record, 1, time.perf_counter() - started, False)
+        return row
+
+    def execute(self, query, params=None):
+        self._profiler.execute(self._cursor, query, params)
+        self._record = self._profiler._pending()
+        return self
+
+    def executemany(self, query, params_list):
+        self._profiler.execute(self._cursor, query, params_list, many=True)
+        self._record = self._profiler._pending()
+        return self
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._profiler._fetched(self._record, row is not None, time.perf_counter() - started, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(self._cursor.arraysize if size is None else size)
+        done = len(rows) < (self._cursor.arraysize if size is None else size)
+        self._profiler._fetched(self._record, len(rows), time.perf_counter() - started, done)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._profiler._fetched(self._record, len(rows), time.perf_counter() - started, True)
+        return rows
+
+
+class QueryProfiler:
+    """
+    Профилировщик SQL-запросов DBManager
+
+    Для каждого запроса (по нормализованному тексту) накапливает число
+    выполнений, время выполнения вместе с чтением строк, число строк,
+    гистограмму длительностей и места вызова. Запросы дольше slow_ms
+    пишутся в журнал медленных запросов вместе с EXPLAIN QUERY PLAN.
+    Включается явно (DBManager.enable_profiling или переменная окружения
+    KABAN_SQL_PROFILE), в выключенном состоянии DBManager его не вызывает.
+    """
+    DEFAULT_SLOW_MS = 100
+    LOGGER_NAME = 'kaban.sql.slow'
+
+    def __init__(self, slow_ms=None, log_path=SLOW_QUERY_LOG_PATH, explain=True, max_statements=500):
+        """
+        Args:
+            slow_ms: Порог медленного запроса в миллисекундах
+            log_path: Файл журнала медленных запросов (None — не писать)
+            explain: Снимать EXPLAIN QUERY PLAN для медленных запросов
+            max_statements: Предел числа различных запросов в статистике
+        """
+        self.slow_ms = self.DEFAULT_SLOW_MS if slow_ms is None else slow_ms
+        self.explain = explain
+        self.max_statements = max_statements
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {}
+        self._handler = None
+        self.logger = logging.getLogger(self.LOGGER_NAME)
+        if log_path:
+            self._handler = logging.FileHandler(log_path, encoding='utf-8', delay=True)
+            self._handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+            self.logger.addHandler(self._handler)
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
+
+    def close(self):
+        """
+        Завершает незаконченные записи потока и закрывает журнал
+        """
+        self.flush()
+        if self._handler is not None:
+            self.logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+    # ----- Запись запросов -----
+
+    def _pending(self):
+        return getattr(self._local, 'record', None)
+
+    def execute(self, cursor, query, params=None, many=False):
+        """
+        Выполняет запрос в курсоре с замером времени
+
+        Returns:
+            ProfiledCursor: Обертка курсора, учитывающая чтение строк
+        """
+        self.flush()
+        call_site = _call_site()
+        started = time.perf_counter()
+        if many:
+            cursor.executemany(query, params)
+        elif params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+        elapsed = time.perf_counter() - started
+
+        record = _Record(normalize_sql(query), query, None if many else params, call_site,
+                         cursor.connection, elapsed, 0)
+        if cursor.description is None:
+            # Изменение данных: строк для чтения нет, запись завершается сразу
+            record.rows = max(cursor.rowcount, 0)
+            self._finish(record)
+        else:
+            self._local.record = record
+        return ProfiledCursor(self, cursor, record)
+
+    def fetch(self, cursor, method, *args):
+        """
+        Читает строки из курсора DBManager (fetchone/fetchall) с замером времени
+        """
+        record = self._pending()
+        started = time.perf_counter()
+        result = getattr(cursor, method)(*args)
+        elapsed = time.perf_counter() - started
+        if record is not None:
+            rows = len(result) if isinstance(result, list) else int(result is not None)
+            # fetch_one DBManager читает только первую строку, запрос на этом завершен
+            self._fetched(record, rows, elapsed, True)
+        return result
+
+    def _fetched(self, record, rows, elapsed, done):
+        if record.done:
+            return
+        record.rows += rows
+        record.elapsed += elapsed
+        if done:
+            self._finish(record)
+
+    def flush(self):
+        """
+        Завершает запись последнего запроса текущего потока
+        """
+        record = self._pending()
+        if record is not None and not record.done:
+            self._finish(record)
+
+    def _finish(self, record):
+        record.done = True
+        if getattr(self._local, 'record', None) is record:
+            self._local.record = None
+        slow = record.elapsed * 1000 >= self.slow_ms
+
+        with self._lock:
+            stats = self._stats.get(record.key)
+            if stats is None:
+                key = record.key if len(self._stats) < self.max_statements else OTHER_STATEMENTS
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = StatementStats(key)
+            stats.add(record.elapsed, record.rows, record.call_site, slow)
+            need_plan = slow and self.explain and stats.plan is None
+
+        if not slow:
+            return
+        if need_plan:
+            stats.plan = self._explain(record)
+        self._log_slow(record, stats.plan)
+
+    def _explain(self, record):
+        if not record.query.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        try:
+            rows = record.conn.execute(f"EXPLAIN QUERY PLAN {record.query}", record.params or ()).fetchall()
+            return [row[-1] for row in rows]
+        except sqlite3.Error:
+            return None
+
+    def _log_slow(self, record, plan):
+        message = (
+            f"{record.elapsed * 1000:.1f} мс, строк: {record.rows}, {record.call_site}: {record.key}"
+        )
+        if record.params:
+            message += f" | параметры: {tuple(record.params)!r}"
+        if plan:
+            message += ''.join(f"\n    {line}" for line in plan)
+        self.logger.warning(message)
+
+    # ----- Отчеты -----
+
+    def statements(self, order_by='total_ms', limit=None):
+        """
+        Статистика запросов, отсортированная по убыванию order_by
+
+        Args:
+            order_by: Поле сортировки (total_ms, mean_ms, p95_ms, max_ms, count, rows, slow)
+            limit: Максимальное количество запросов
+
+        Returns:
+            list: Словари со статистикой (см. StatementStats.to_dict)
+        """
+        self.flush()
+        with self._lock:
+            items = [stats.to_dict() for stats in self._stats.values()]
+        items.sort(key=lambda item: item[order_by], reverse=True)
+        return items[:limit] if limit else items
+
+    def top_offenders(self, limit=10):
+        return self.statements('total_ms', limit)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
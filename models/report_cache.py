@@ -0,0 +1,82 @@
+import copy
+import json
+import threading
+from collections import OrderedDict
+
+
+class ReportCache:
+    """
+    Кэш готовых отчетов
+
+    Запись хранится по ключу (тип отчета, нормализованные параметры) вместе
+    с версиями таблиц (table_versions, database/report_cache.sql), при которых
+    отчет был посчитан. Если версии на момент чтения другие, запись считается
+    устаревшей и удаляется. Объем ограничен числом записей и суммарным
+    размером (по длине JSON); вытесняются давно не читавшиеся записи (LRU).
+    """
+    DEFAULT_MAX_ENTRIES = 64
+    DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = self.DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        self.max_bytes = self.DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        # ключ -> (версии, отчет, размер)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def size_of(report):
+        return len(json.dumps(report, ensure_ascii=False, default=str))
+
+    def get(self, key, versions):
+        """
+        Возвращает копию отчета, посчитанного при тех же версиях таблиц, или None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            report = entry[1]
+        return copy.deepcopy(report)
+
+    def put(self, key, versions, report, size=None):
+        """
+        Сохраняет копию отчета; отчет больше max_bytes не кэшируется
+        """
+        size = self.size_of(report) if size is None else size
+        if size > self.max_bytes:
+            return
+        report = copy.deepcopy(report)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (versions, report, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,194 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+class Statement:
+    """
+    Именованный SQL-запрос реестра
+
+    Attributes:
+        name: Имя запроса (таблица.назначение)
+        sql: Текст запроса
+        placeholders: Количество параметров ?
+        has_where: Запрос уже содержит WHERE, условия дописываются через AND
+    """
+    __slots__ = ('name', 'sql', 'placeholders', 'has_where')
+
+    def __init__(self, name, sql, has_where=False):
+        self.name = name
+        self.sql = ' '.join(sql.split())
+        self.placeholders = self.sql.count('?')
+        self.has_where = has_where
+
+
+class StatementRegistry:
+    """
+    Реестр SQL-запросов сервисного слоя
+
+    Все постоянные запросы регистрируются здесь под именами, поэтому их
+    можно проверить и просмотреть в одном месте. Запросы с необязательными
+    условиями (поиск с фильтрами) собираются compose() один раз на
+    сочетание условий: текст запроса для одного сочетания всегда один и тот
+    же объект строки, и подготовленный оператор берется из кэша соединения
+    (sqlite3 хранит их по тексту запроса, см. ConnectionPool.CACHED_STATEMENTS).
+    """
+    MAX_VARIANTS = 256
+
+    def __init__(self):
+        self._statements = {}
+        self._variants = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name, sql, has_where=False):
+        """
+        Регистрирует запрос
+
+        Raises:
+            ValueError: Имя уже занято или текст не является законченным SQL-оператором
+        """
+        if name in self._statements:
+            raise ValueError(f"Запрос {name} уже зарегистрирован")
+        statement = Statement(name, sql, has_where)
+        if not sqlite3.complete_statement(statement.sql + ';'):
+            raise ValueError(f"Запрос {name} не является законченным SQL-оператором")
+        self._statements[name] = statement
+        return statement
+
+    def get(self, name):
+        return self._statements[name]
+
+    def __getitem__(self, name):
+        return self._statements[name].sql
+
+    def __contains__(self, name):
+        return name in self._statements
+
+    def __len__(self):
+        return len(self._statements)
+
+    def names(self):
+        return sorted(self._statements)
+
+    def compose(self, name, conditions=(), suffix=''):
+        """
+        Текст запроса name с дополнительными условиями и окончанием
+
+        Args:
+            name: Имя зарегистрированного запроса
+            conditions: Условия, объединяемые через AND
+            suffix: Окончание запроса (ORDER BY, LIMIT)
+
+        Returns:
+            str: Текст запроса; для одинаковых аргументов возвращается та же строка
+        """
+        key = (name, tuple(conditions), suffix)
+        with self._lock:
+            sql = self._variants.get(key)
+            if sql is not None:
+                self._variants.move_to_end(key)
+                return sql
+
+        statement = self._statements[name]
+        sql = statement.sql
+        if conditions:
+            sql += (' AND ' if statement.has_where else ' WHERE ') + ' AND '.join(conditions)
+        if suffix:
+            sql += ' ' + suffix
+
+        with self._lock:
+            self._variants[key] = sql
+            if len(self._variants) > self.MAX_VARIANTS:
+                self._variants.popitem(last=False)
+        return sql
+
+    def validate(self, conn):
+        """
+        Подготавливает каждый запрос на соединении без выполнения
+
+        Returns:
+            dict: Ошибки по именам запросов (пустой словарь, если все запросы корректны)
+        """
+        errors = {}
+        for name, statement in self._statements.items():
+            try:
+                conn.execute(f"EXPLAIN {statement.sql}", (None,) * statement.placeholders)
+            except sqlite3.Error as e:
+                errors[name] = str(e)
+        return errors
+
+
+STATEMENTS = StatementRegistry()
+
+# ----- Задачи -----
+
+# Столбцы списка задач вместе с названием проекта и именем разработчика
+STATEMENTS.register('tasks.listing', """
+    SELECT t.id, t.project_id, t.developer_id, t.description, t.status,
+           t.hours_worked, t.created_at, t.updated_at,
+           p.name as project_name, d.full_name as developer_name
+    FROM tasks t
+    LEFT JOIN projects p ON t.project_id = p.id
+    LEFT JOIN developers d ON t.developer_id = d.id
+""")
+
+STATEMENTS.register('tasks.ranked', """
+    SELECT t.id, t.project_id, t.developer_id, t.description, t.status,
+           t.hours_worked, t.created_at, t.updated_at,
+           p.name as project_name, d.full_name as developer_name,
+           bm25(tasks_fts, 4.0, 1.0, 1.0) as score
+    FROM tasks_fts
+    JOIN tasks t ON t.id = tasks_fts.rowid
+    LEFT JOIN projects p ON t.project_id = p.id
+    LEFT JOIN developers d ON t.developer_id = d.id
+    WHERE tasks_fts MATCH ?
+""", has_where=True)
+
+STATEMENTS.register('tasks.find_duplicate', """
+    SELECT id FROM tasks
+    WHERE project_id = ? AND description = ?
+    AND (developer_id = ? OR (developer_id IS NULL AND ? IS NULL))
+""")
+
+# ----- Разработчики -----
+
+STATEMENTS.register('developers.all', "SELECT id, full_name, position, hourly_rate FROM developers")
+
+STATEMENTS.register('developers.by_id', """
+    SELECT id, full_name, position, hourly_rate FROM developers WHERE id = ?
+""")
+
+STATEMENTS.register('developers.by_name', "SELECT id FROM developers WHERE full_name = ?")
+
+STATEMENTS.register('developers.hours', """
+    SELECT SUM(hours_worked) FROM tasks WHERE developer_id = ?
+""", has_where=True)
+
+# ----- Проекты -----
+
+STATEMENTS.register('projects.all', """
+    SELECT id, name, client, deadline, budget, status, created_at FROM projects
+""")
+
+STATEMENTS.register('projects.by_id', "SELECT * FROM projects WHERE id = ?")
+
+STATEMENTS.register('projects.search', """
+    SELECT id, name, client, deadline, budget, created_at FROM projects
+""")
+
+# ----- Пользователи -----
+
+STATEMENTS.register('users.insert', """
+    INSERT INTO users (username, password, email, full_name, role, is_active, last_login, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+""")
+
+STATEMENTS.register('users.update', """
+    UPDATE users SET username = ?, email = ?, full_name = ?, role = ?, is_active = ?
+    WHERE id = ?
+""")
+
+STATEMENTS.register('users.update_with_password', """
+    UPDATE users SET username = ?, email = ?, full_name = ?, role = ?, is_active = ?, password = ?
+    WHERE id = ?
+""")
@@ -6,7 +6,7 @@ class Task:
     VALID_STATUSES = ['новая', 'в работе', 'на проверке', 'завершено']
 
     def __init__(self, id=None, project_id=None, developer_id=None, description="", status="новая",
-                 hours_worked=0, created_at=None, updated_at=None, db_manager=None):
+                 hours_worked=0, created_at=None, updated_at=None, db_manager=None, loader=None):
         self.id = id
         self.project_id = project_id
         self.developer_id = developer_id
@@ -15,7 +15,21 @@ class Task:
         self.hours_worked = hours_worked
         self.created_at = created_at
         self.updated_at = updated_at
-        self.db_manager = db_manager or DBManager()
+        self._db_manager = db_manager
+        # Карта идентичности запроса (BatchLoader): если задана, проверки
+        # существования проекта и разработчика не ходят в базу
+        self.loader = loader
+
+    @property
+    def db_manager(self):
+        # Менеджер запрашивается только при обращении к базе, а не при создании каждой задачи
+        if self._db_manager is None:
+            self._db_manager = DBManager()
+        return self._db_manager
+
+    @db_manager.setter
+    def db_manager(self, value):
+        self._db_manager = value
 
     def __str__(self):
         return f"Task(id={self.id}, description='{self.description}', status='{self.status}', hours_worked={self.hours_worked})"
@@ -57,22 +71,24 @@ class Task:
         if self.hours_worked < 0:
             return False, "Количество часов не может быть отрицательным"
 
-        self.db_manager.execute(
-            "SELECT id FROM projects WHERE id = ?",
-            (self.project_id,)
-        )
-        if not self.db_manager.fetch_one():
+        if not self._exists('projects', self.project_id):
             return False, f"Проект с ID {self.project_id} не существует"
 
-        self.db_manager.execute(
-            "SELECT id FROM developers WHERE id = ?",
-            (self.developer_id,)
-        )
-        if not self.db_manager.fetch_one():
+        if not self._exists('developers', self.developer_id):
             return False, f"Разработчик с ID {self.developer_id} не существует"
 
         return True, None
 
+    def _exists(self, table, row_id):
+        if self.loader is not None:
+            return self.loader.exists(table, row_id)
+
+        self.db_manager.execute(
+            f"SELECT id FROM {table} WHERE id = ?",
+            (row_id,)
+        )
+        return self.db_manager.fetch_one() is not None
+
     def save(self):
         is_valid, error_message = self.validate()
         if not is_valid:
@@ -92,6 +108,8 @@ class Task:
                 )
 
             self.db_manager.commit()
+            if self.loader is not None:
+                self.loader.forget('tasks', self.id)
             return True, None
 
         except Exception as e:
@@ -121,11 +139,10 @@ class Task:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data = db_manager.query_one(
                 "SELECT * FROM tasks WHERE id = ?",
                 (task_id,)
             )
-            data = db_manager.fetch_one()
 
             if data:
                 return cls.from_dict(data)
@@ -139,8 +156,7 @@ class Task:
         db_manager = DBManager()
 
         try:
-            db_manager.execute("SELECT * FROM tasks")
-            data_list = db_manager.fetch_all()
+            data_list = db_manager.query_all("SELECT * FROM tasks")
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -152,11 +168,10 @@ class Task:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data_list = db_manager.query_all(
                 "SELECT * FROM tasks WHERE project_id = ?",
                 (project_id,)
             )
-            data_list = db_manager.fetch_all()
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -168,11 +183,10 @@ class Task:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data_list = db_manager.query_all(
                 "SELECT * FROM tasks WHERE developer_id = ?",
                 (developer_id,)
             )
-            data_list = db_manager.fetch_all()
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -184,11 +198,10 @@ class Task:
         db_manager = DBManager()
 
         try:
-            db_manager.execute(
+            data_list = db_manager.query_all(
                 "SELECT * FROM tasks WHERE status = ?",
                 (status,)
             )
-            data_list = db_manager.fetch_all()
 
             return [cls.from_dict(data) for data in data_list]
 
@@ -201,7 +214,10 @@ class Task:
         """
         if not hasattr(self, '_project') or self._project is None:
             from models.project import Project
-            self._project = Project.get_by_id(self.project_id) if self.project_id else None
+            if self.loader is not None:
+                self._project = self.loader.get_model('projects', self.project_id)
+            else:
+                self._project = Project.get_by_id(self.project_id) if self.project_id else None
         return self._project
 
     def get_developer(self):
@@ -210,7 +226,10 @@ class Task:
         """
         if not hasattr(self, '_developer') or self._developer is None:
             from models.developer import Developer
-            self._developer = Developer.get_by_id(self.developer_id) if self.developer_id else None
+            if self.loader is not None:
+                self._developer = self.loader.get_model('developers', self.developer_id)
+            else:
+                self._developer = Developer.get_by_id(self.developer_id) if self.developer_id else None
         return self._developer
 
     def update_status(self, status):
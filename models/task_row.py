@@ -0,0 +1,189 @@
+from array import array
+from collections import namedtuple
+
+from .task import Task
+
+# Порядок столбцов совпадает с запросом STATEMENTS['tasks.listing']
+LISTING_FIELDS = (
+    'id', 'project_id', 'developer_id', 'description', 'status',
+    'hours_worked', 'created_at', 'updated_at', 'project_name', 'developer_name'
+)
+
+
+class TaskRow(namedtuple('TaskRow', LISTING_FIELDS)):
+    """
+    Строка списка задач только для чтения
+
+    Кортеж без словаря атрибутов и без ссылки на DBManager; название проекта
+    и имя разработчика входят в строку. Для редактирования строка
+    превращается в модель методом to_task().
+    """
+    __slots__ = ()
+
+    def to_task(self, db_manager=None, loader=None):
+        """
+        Полная модель задачи для редактирования
+        """
+        task = Task(
+            id=self.id,
+            project_id=self.project_id,
+            developer_id=self.developer_id,
+            description=self.description,
+            status=self.status,
+            hours_worked=self.hours_worked,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            db_manager=db_manager,
+            loader=loader
+        )
+        task.project_name = self.project_name
+        task.developer_name = self.developer_name
+        return task
+
+    def to_dict(self):
+        return self._asdict()
+
+
+class TextColumn:
+    """
+    Столбец строк в одном буфере UTF-8 со смещениями
+
+    Хранит строку в несколько раз компактнее, чем список объектов str.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+
+    def append(self, value):
+        self._data += (value or '').encode('utf-8')
+        self._offsets.append(len(self._data))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+
+class TaskRows:
+    """
+    Список задач по столбцам
+
+    Числовые поля лежат в массивах array, тексты — в TextColumn, статусы —
+    кодами в байтовом массиве, названия проектов и имена разработчиков —
+    в справочниках по ID. На строку не создается ни одного объекта Python,
+    строка TaskRow собирается только при обращении по индексу.
+    """
+    STATUSES = tuple(Task.VALID_STATUSES)
+
+    def __init__(self, rows=None):
+        self.clear()
+        if rows is not None:
+            self.extend_rows(rows)
+
+    def clear(self):
+        self.ids = array('q')
+        self.project_ids = array('q')
+        self.developer_ids = array('q')
+        self.hours = array('d')
+        self.status_codes = array('b')
+        self.descriptions = TextColumn()
+        self.created = TextColumn()
+        self.updated = TextColumn()
+        self.project_names = {}
+        self.developer_names = {}
+        self._status_index = {status: code for code, status in enumerate(self.STATUSES)}
+        self._statuses = list(self.STATUSES)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _status_code(self, status):
+        status = status or ''
+        code = self._status_index.get(status)
+        if code is None:
+            code = len(self._statuses)
+            self._statuses.append(status)
+            self._status_index[status] = code
+        return code
+
+    def append_row(self, row):
+        """
+        Добавляет строку запроса в порядке LISTING_FIELDS (кортеж, sqlite3.Row или TaskRow)
+        """
+        (task_id, project_id, developer_id, description, status,
+         hours, created_at, updated_at, project_name, developer_name) = row[:10]
+        project_id = project_id or 0
+        developer_id = developer_id or 0
+        self.ids.append(task_id)
+        self.project_ids.append(project_id)
+        self.developer_ids.append(developer_id)
+        self.hours.append(hours or 0)
+        self.status_codes.append(self._status_code(status))
+        self.descriptions.append(description)
+        self.created.append(str(created_at or ''))
+        self.updated.append(str(updated_at or ''))
+        if project_id and project_name and project_id not in self.project_names:
+            self.project_names[project_id] = project_name
+        if developer_id and developer_name and developer_id not in self.developer_names:
+            self.developer_names[developer_id] = developer_name
+
+    def extend_rows(self, rows):
+        for row in rows:
+            self.append_row(row)
+
+    def append(self, task):
+        """
+        Добавляет задачу (объект Task или TaskRow)
+        """
+        self.append_row((
+            task.id, task.project_id, task.developer_id, task.description, task.status,
+            task.hours_worked, getattr(task, 'created_at', None), getattr(task, 'updated_at', None),
+            getattr(task, 'project_name', None), getattr(task, 'developer_name', None)
+        ))
+
+    def extend(self, tasks):
+        for task in tasks:
+            self.append(task)
+
+    def status(self, index):
+        return self._statuses[self.status_codes[index]]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        project_id = self.project_ids[index] or None
+        developer_id = self.developer_ids[index] or None
+        return TaskRow(
+            self.ids[index], project_id, developer_id, self.descriptions[index],
+            self.status(index), self.hours[index], self.created[index] or None,
+            self.updated[index] or None, self.project_names.get(project_id),
+            self.developer_names.get(developer_id)
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        """
+        Приблизительный объем данных столбцов в байтах (без справочников)
+        """
+        arrays = (self.ids, self.project_ids, self.developer_ids, self.hours, self.status_codes)
+        return (sum(a.itemsize * len(a) for a in arrays)
+                + self.descriptions.nbytes + self.created.nbytes + self.updated.nbytes)
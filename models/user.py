@@ -1,4 +1,5 @@
 from models.db_manager import DBManager
+from models.statements import STATEMENTS
 import hashlib
 import os
 from datetime import datetime
@@ -79,11 +80,7 @@ class User:
             
             if self.id:
                 # Обновление существующего пользователя
-                query = """
-                    UPDATE users
-                    SET username = ?, email = ?, full_name = ?, 
-                        role = ?, is_active = ?
-                """
+                query = STATEMENTS['users.update']
                 params = [
                     self.username, self.email, self.full_name,
                     self.role, self.is_active
@@ -93,10 +90,9 @@ class User:
                 if self.password and not self.password.startswith('$'):
                     hashed_password = self._hash_password(self.password)
                     self.password = hashed_password
-                    query += ", password = ?"
+                    query = STATEMENTS['users.update_with_password']
                     params.append(hashed_password)
                 
-                query += " WHERE id = ?"
                 params.append(self.id)
                 
                 self.db_manager.conn.execute(query, params)
@@ -104,12 +100,7 @@ class User:
                 hashed_password = self._hash_password(self.password)
                 self.password = hashed_password
 
-                query = """
-                    INSERT INTO users (username, password, email, full_name, 
-                                      role, is_active, last_login, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                cursor = self.db_manager.conn.execute(query, (
+                cursor = self.db_manager.conn.execute(STATEMENTS['users.insert'], (
                     self.username, hashed_password, self.email, self.full_name,
                     self.role, self.is_active, self.last_login, self.created_at
                 ))
@@ -260,28 +251,24 @@ class User:
         db_manager = db_manager or DBManager()
         
         try:
-            db_manager.connect()
-            
-            query = """
+            row = db_manager.query_one_cached('users', user_id, """
                 SELECT id, username, password, email, full_name, 
                        role, is_active, last_login, created_at
                 FROM users
                 WHERE id = ?
-            """
-            cursor = db_manager.conn.execute(query, (user_id,))
-            row = cursor.fetchone()
+            """)
             
             if row:
                 return cls(
-                    id=row[0],
-                    username=row[1],
-                    password=row[2],
-                    email=row[3],
-                    full_name=row[4],
-                    role=row[5],
-                    is_active=bool(row[6]),
-                    last_login=row[7],
-                    created_at=row[8],
+                    id=row['id'],
+                    username=row['username'],
+                    password=row['password'],
+                    email=row['email'],
+                    full_name=row['full_name'],
+                    role=row['role'],
+                    is_active=bool(row['is_active']),
+                    last_login=row['last_login'],
+                    created_at=row['created_at'],
                     db_manager=db_manager
                 )
             
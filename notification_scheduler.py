@@ -1,18 +1,201 @@
+import random
+import threading
+import time
+from datetime import datetime
+
 from services.notification_service import NotificationService
 
+
 class NotificationScheduler:
     """
     Планировщик для автоматической проверки и создания уведомлений
+
+    Проверки выполняются в фоновом потоке со своим соединением из пула
+    DBManager. У каждой проверки свой интервал; к интервалу добавляется
+    случайный разброс, чтобы проверки не срабатывали одновременно.
+    Если предыдущий запуск еще идет, новый пропускается.
     """
-    def __init__(self):
-        self.notification_service = NotificationService()
+    # Интервалы проверок в секундах
+    DEFAULT_INTERVALS = {
+        'overdue_projects': 15 * 60,
+        'upcoming_deadlines': 30 * 60,
+        'inactive_tasks': 60 * 60,
+        'budget_warnings': 15 * 60,
+    }
+    # Доля интервала, на которую может сдвигаться очередной запуск
+    DEFAULT_JITTER = 0.1
 
-    def run_checks(self):
+    def __init__(self, intervals=None, jitter=None, notification_service=None):
         """
-        Запускает все проверки для создания уведомлений
+        Args:
+            intervals: Интервалы проверок в секундах {имя проверки: интервал}
+            jitter: Доля интервала для случайного сдвига (0 — без сдвига)
+            notification_service: Сервис уведомлений
+        """
+        self.notification_service = notification_service or NotificationService()
+        self.intervals = dict(self.DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+        self.jitter = self.DEFAULT_JITTER if jitter is None else jitter
+
+        self._listeners = []
+        self._run_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread = None
+        self._next_run = {}
+        self._last_run = {}
+        self.skipped_runs = 0
+
+    def add_listener(self, callback):
         """
+        Подписывает функцию на результаты проверок
+
+        Функция вызывается в потоке планировщика со словарем результатов,
+        при ошибке — со словарем, содержащим ключ error.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, results):
+        for callback in list(self._listeners):
+            try:
+                callback(results)
+            except Exception:
+                pass
+
+    def _delay(self, name):
+        interval = self.intervals[name]
+        if self.jitter:
+            interval += random.uniform(-self.jitter, self.jitter) * interval
+        return max(interval, 0)
+
+    def run_checks(self, names=None):
+        """
+        Запускает проверки в текущем потоке
+
+        Args:
+            names: Имена проверок (None — все проверки)
+
+        Returns:
+            dict: Результаты проверок, {'total': 0} при ошибке
+            или None, если предыдущий запуск еще не завершен
+        """
+        if not self._run_lock.acquire(blocking=False):
+            with self._state_lock:
+                self.skipped_runs += 1
+            return None
+
         try:
-            results = self.notification_service.run_all_checks()
-            return results
-        except Exception as e:
-            return {'total': 0}
+            timings = {}
+            started_at = datetime.now()
+            started = time.perf_counter()
+            try:
+                results = self.notification_service.run_checks(names, timings)
+                error = None
+            except Exception as e:
+                results = {'total': 0, 'error': str(e)}
+                error = str(e)
+
+            duration = time.perf_counter() - started
+            with self._state_lock:
+                for name in (names or self.intervals):
+                    self._last_run[name] = {
+                        'started_at': started_at,
+                        'duration': timings.get(name, duration if error else 0.0),
+                        'created': results.get(name, 0),
+                        'error': error
+                    }
+            results['duration'] = duration
+        finally:
+            self._run_lock.release()
+
+        self._notify(results)
+        return results
+
+    def run_now(self):
+        """
+        Просит фоновый поток выполнить все проверки без ожидания интервала
+        """
+        if not self.is_running():
+            return False
+        with self._state_lock:
+            for name in self.intervals:
+                self._next_run[name] = 0
+        self._wake_event.set()
+        return True
+
+    def start(self, initial_delay=0):
+        """
+        Запускает фоновый поток планировщика
+
+        Args:
+            initial_delay: Задержка перед первым запуском в секундах
+        """
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        first_run = time.monotonic() + initial_delay
+        with self._state_lock:
+            self._next_run = {name: first_run for name in self.intervals}
+        self._thread = threading.Thread(
+            target=self._loop, name='NotificationScheduler', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """
+        Останавливает фоновый поток и дожидается завершения текущего запуска
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self):
+        db_manager = self.notification_service.db_manager
+        try:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+                with self._state_lock:
+                    due = [name for name, at in self._next_run.items() if at <= now]
+                    wait = min(self._next_run.values()) - now if self._next_run else None
+
+                if due:
+                    self.run_checks(due)
+                    with self._state_lock:
+                        now = time.monotonic()
+                        for name in due:
+                            self._next_run[name] = now + self._delay(name)
+                    continue
+
+                self._wake_event.wait(wait)
+                self._wake_event.clear()
+        finally:
+            db_manager.release_connection()
+
+    def last_run(self):
+        """
+        Возвращает сведения о последнем запуске каждой проверки
+
+        Returns:
+            dict: {имя проверки: {started_at, duration, created, error}}
+        """
+        with self._state_lock:
+            return {name: dict(info) for name, info in self._last_run.items()}
+
+    def next_run_in(self):
+        """
+        Возвращает время до следующего запуска каждой проверки в секундах
+        """
+        now = time.monotonic()
+        with self._state_lock:
+            return {name: max(at - now, 0) for name, at in self._next_run.items()}
@@ -10,3 +10,17 @@ def resource_path(*parts):
 
 DB_PATH = resource_path('database', 'kaban.db')
 SQL_PATH = resource_path('database', 'kaban.sql')
+STATS_SQL_PATH = resource_path('database', 'stats.sql')
+SEARCH_SQL_PATH = resource_path('database', 'search.sql')
+NOTIFICATIONS_SQL_PATH = resource_path('database', 'notifications.sql')
+REPORT_CACHE_SQL_PATH = resource_path('database', 'report_cache.sql')
+INDEXES_SQL_PATH = resource_path('database', 'indexes.sql')
+TASK_UPSERT_SQL_PATH = resource_path('database', 'task_upsert.sql')
+# Журнал медленных SQL-запросов (рядом с app_log.txt)
+SLOW_QUERY_LOG_PATH = resource_path('slow_query_log.txt')
+# Разбивка времени запуска (KABAN_STARTUP_TRACE=1)
+STARTUP_TRACE_PATH = resource_path('startup_trace.txt')
+# Скомпилированные темы оформления (пересобираются при отсутствии)
+THEME_CACHE_PATH = resource_path('theme_cache.json')
+# Каталог выгрузок по умолчанию и журнала экспортов
+REPORTS_DIR = resource_path('reports')
@@ -4,9 +4,12 @@ from services.task_service import TaskService
 from services.report_service import ReportService
 from services.auth_service import AuthService
 from services.notification_service import NotificationService
-from services.export_service import ExportService
+from services.export_service import ExportService, ExportQuery
+from services.batch_loader import BatchLoader
+from services.import_service import ImportService
 
 __all__ = [
     'DeveloperService', 'ProjectService', 'TaskService', 'ReportService',
-    'AuthService', 'NotificationService', 'ExportService'
+    'AuthService', 'NotificationService', 'ExportService', 'ExportQuery', 'BatchLoader',
+    'ImportService'
 ]
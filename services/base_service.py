@@ -1,5 +1,7 @@
 from models import DBManager
 from exceptions import DatabaseException, ValidationException, BusinessException
+import re
+from datetime import datetime, timedelta
 import sqlite3
 
 class BaseService:
@@ -17,15 +19,86 @@ class BaseService:
         Выполняет SQL-запрос и обрабатывает исключения
         """
         try:
-            cursor = self.db_manager.conn.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            return cursor
+            return self.db_manager.query(query, params)
         except sqlite3.Error as e:
             raise DatabaseException(f"Ошибка при выполнении запроса: {query}", e)
     
+    # Размер пачки при чтении курсора генератором
+    ITER_BATCH_SIZE = 1000
+
+    def iter_query(self, query, params=None, batch_size=None):
+        """
+        Выполняет запрос и отдает строки по одной, читая курсор пачками fetchmany
+
+        Запрос выполняется сразу, ошибки SQL возникают при вызове; список
+        всех строк не строится.
+        """
+        cursor = self.execute_query(query, params)
+        return self._iter_cursor(cursor, batch_size or self.ITER_BATCH_SIZE)
+
+    @staticmethod
+    def _iter_cursor(cursor, batch_size):
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def day_range(start_date=None, end_date=None):
+        """
+        Переводит период по дням в полуоткрытый интервал [начало, конец)
+
+        Отметки времени в базе хранятся строками 'YYYY-MM-DD HH:MM:SS',
+        поэтому условие column >= начало AND column < конец сравнивает
+        столбец как есть и может идти по индексу, в отличие от
+        date(column) BETWEEN ... . Конец — день, следующий за end_date.
+
+        Returns:
+            tuple: (начало, конец) строками 'YYYY-MM-DD'; None для незаданной границы
+        """
+        bounds = []
+        for value, shift, field in ((start_date, 0, 'start_date'), (end_date, 1, 'end_date')):
+            if not value:
+                bounds.append(None)
+                continue
+            try:
+                day = datetime.strptime(str(value).strip()[:10], '%Y-%m-%d').date()
+            except ValueError:
+                raise ValidationException("Дата должна быть в формате YYYY-MM-DD", field)
+            bounds.append((day + timedelta(days=shift)).isoformat())
+        return tuple(bounds)
+
+    @staticmethod
+    def fts_query(text):
+        """
+        Превращает строку поиска в выражение MATCH для FTS5
+
+        Каждое слово ищется по префиксу, все слова должны встретиться.
+        Кавычки и операторы FTS5 во вводе пользователя не интерпретируются,
+        ё заменяется на е, как в индексах из database/search.sql.
+
+        Returns:
+            str: Выражение MATCH или None, если в строке нет слов
+        """
+        words = re.findall(r'\w+', (text or '').replace('ё', 'е').replace('Ё', 'Е'))
+        if not words:
+            return None
+        return ' '.join(f'"{word}"*' for word in words)
+
+    def begin_write(self):
+        """
+        Начинает транзакцию с блокировкой записи (BEGIN IMMEDIATE)
+
+        DBManager.begin_transaction не выбрасывает исключений, а возвращает
+        False; без блокировки пакетная запись продолжаться не должна.
+        """
+        if not self.db_manager.begin_transaction(immediate=True):
+            raise DatabaseException("Не удалось начать транзакцию записи: база данных заблокирована")
+
     def commit(self):
         """
         Фиксирует изменения в базе данных
@@ -0,0 +1,166 @@
+from models import DBManager, Task, Project, Developer
+
+
+class BatchLoader:
+    """
+    Карта идентичности на время одного запроса.
+
+    Собирает проекты, разработчиков и задачи пачками через один запрос
+    WHERE id IN (...) на таблицу и отвечает на повторные обращения и
+    проверки существования из памяти, без дополнительных SELECT.
+    """
+    # Держимся ниже SQLITE_MAX_VARIABLE_NUMBER старых сборок SQLite
+    CHUNK_SIZE = 500
+
+    MODELS = {
+        'tasks': Task,
+        'projects': Project,
+        'developers': Developer
+    }
+
+    def __init__(self, db_manager=None):
+        """
+        Args:
+            db_manager: Менеджер базы данных
+        """
+        self.db_manager = db_manager or DBManager()
+        self._rows = {table: {} for table in self.MODELS}
+        self._missing = {table: set() for table in self.MODELS}
+        self.query_count = 0
+
+    @staticmethod
+    def _normalize_id(value):
+        # Валидаторы приводят идентификаторы к float
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def prime(self, table, row):
+        """
+        Кладет уже загруженную строку в карту
+
+        Args:
+            table: Имя таблицы
+            row: Словарь с данными строки (должен содержать id)
+        """
+        row_id = self._normalize_id(row['id'])
+        self._rows[table][row_id] = row
+        self._missing[table].discard(row_id)
+
+    def forget(self, table, row_id):
+        """
+        Удаляет строку из карты, чтобы следующее обращение перечитало ее
+        """
+        row_id = self._normalize_id(row_id)
+        self._rows[table].pop(row_id, None)
+        self._missing[table].discard(row_id)
+
+    def load_many(self, table, ids):
+        """
+        Загружает строки по списку ID одним запросом на пачку
+
+        Args:
+            table: Имя таблицы (tasks, projects, developers)
+            ids: Итерируемый набор ID
+
+        Returns:
+            dict: Словарь {id: строка} для найденных записей
+        """
+        rows = self._rows[table]
+        missing = self._missing[table]
+        wanted = []
+        seen = set()
+        for row_id in ids:
+            if row_id is None:
+                continue
+            row_id = self._normalize_id(row_id)
+            if row_id in seen:
+                continue
+            seen.add(row_id)
+            if row_id not in rows and row_id not in missing:
+                wanted.append(row_id)
+
+        for start in range(0, len(wanted), self.CHUNK_SIZE):
+            chunk = wanted[start:start + self.CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            found = self.db_manager.query_all(
+                f"SELECT * FROM {table} WHERE id IN ({placeholders})",
+                chunk
+            )
+            self.query_count += 1
+            for row in found:
+                rows[row['id']] = row
+            missing.update(set(chunk) - {row['id'] for row in found})
+
+        return {row_id: rows[row_id] for row_id in seen if row_id in rows}
+
+    def load(self, table, row_id):
+        """
+        Загружает одну строку
+
+        Returns:
+            dict: Строка или None, если запись не найдена
+        """
+        if row_id is None:
+            return None
+        return self.load_many(table, [row_id]).get(self._normalize_id(row_id))
+
+    def exists(self, table, row_id):
+        """
+        Проверяет существование записи
+        """
+        return self.load(table, row_id) is not None
+
+    def get_model(self, table, row_id):
+        """
+        Возвращает объект модели для записи
+
+        Returns:
+            Объект Task, Project или Developer либо None
+        """
+        row = self.load(table, row_id)
+        if row is None:
+            return None
+        return self.MODELS[table].from_dict(row)
+
+    def get_tasks(self, task_ids):
+        """
+        Загружает задачи вместе с проектами и разработчиками
+
+        Выполняет не более трех запросов на пачку задач, независимо от их
+        количества. Проверки в Task.validate() обслуживаются этой же картой.
+
+        Args:
+            task_ids: Список ID задач
+
+        Returns:
+            list: Объекты Task в порядке task_ids (ненайденные пропускаются)
+        """
+        task_rows = self.load_many('tasks', task_ids)
+        self.load_many('projects', (row['project_id'] for row in task_rows.values()))
+        self.load_many('developers', (row['developer_id'] for row in task_rows.values()))
+
+        tasks = []
+        for task_id in task_ids:
+            row = task_rows.get(self._normalize_id(task_id))
+            if row is None:
+                continue
+            task = Task(
+                id=row['id'],
+                project_id=row['project_id'],
+                developer_id=row['developer_id'],
+                description=row['description'],
+                status=row['status'],
+                hours_worked=row['hours_worked'],
+                created_at=row.get('created_at'),
+                updated_at=row.get('updated_at'),
+                db_manager=self.db_manager,
+                loader=self
+            )
+            project = self.load('projects', task.project_id)
+            developer = self.load('developers', task.developer_id)
+            task.project_name = project['name'] if project else None
+            task.developer_name = developer['full_name'] if developer else None
+            tasks.append(task)
+
+        return tasks
@@ -1,5 +1,6 @@
 from services.base_service import BaseService
 from models import Developer
+from models.statements import STATEMENTS
 from validation import DeveloperValidator
 from exceptions import BusinessException, ValidationException, DatabaseException
 
@@ -12,8 +13,7 @@ class DeveloperService(BaseService):
         Получает список всех разработчиков
         """
         try:
-            query = "SELECT id, full_name, position, hourly_rate FROM developers"
-            cursor = self.execute_query(query)
+            cursor = self.execute_query(STATEMENTS['developers.all'])
             
             developers = []
             for row in cursor.fetchall():
@@ -35,8 +35,7 @@ class DeveloperService(BaseService):
         """
         Получает разработчика по ID
         """
-        query = "SELECT id, full_name, position, hourly_rate FROM developers WHERE id = ?"
-        result = self.db_manager.execute(query, (developer_id,)).fetchone()
+        result = self.db_manager.execute(STATEMENTS['developers.by_id'], (developer_id,)).fetchone()
 
         if not result:
             raise BusinessException(f"Разработчик с ID {developer_id} не найден")
@@ -52,8 +51,7 @@ class DeveloperService(BaseService):
             validated_data = DeveloperValidator.validate(data)
             
             # Проверка на дубликаты по полному имени
-            query = "SELECT id FROM developers WHERE full_name = ?"
-            cursor = self.execute_query(query, [validated_data['full_name']])
+            cursor = self.execute_query(STATEMENTS['developers.by_name'], [validated_data['full_name']])
             existing_developer = cursor.fetchone()
             
             if existing_developer:
@@ -152,23 +150,48 @@ class DeveloperService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при удалении разработчика: {str(e)}")
     
+    def iter_developers(self, search_term=None, position=None, batch_size=None):
+        """
+        Генератор строк разработчиков прямо из курсора (для экспорта)
+
+        Yields:
+            tuple: (id, full_name, position, hourly_rate) в порядке ID
+        """
+        try:
+            conditions = []
+            params = []
+
+            if search_term:
+                conditions.append("full_name LIKE ?")
+                params.append(f"%{search_term}%")
+
+            if position:
+                conditions.append("position = ?")
+                params.append(position)
+
+            return self.iter_query(STATEMENTS.compose('developers.all', conditions, "ORDER BY id"), params, batch_size)
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при получении списка разработчиков: {str(e)}")
+
     def search_developers(self, search_term=None, position=None):
         """
         Поиск разработчиков по имени и/или должности
         """
         try:
-            query = "SELECT id, full_name, position, hourly_rate FROM developers WHERE 1=1"
+            conditions = []
             params = []
             
             if search_term:
-                query += " AND full_name LIKE ?"
+                conditions.append("full_name LIKE ?")
                 params.append(f"%{search_term}%")
             
             if position:
-                query += " AND position = ?"
+                conditions.append("position = ?")
                 params.append(position)
             
-            cursor = self.execute_query(query, params)
+            cursor = self.execute_query(STATEMENTS.compose('developers.all', conditions), params)
             
             developers = []
             for row in cursor.fetchall():
@@ -186,6 +209,45 @@ class DeveloperService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при поиске разработчиков: {str(e)}")
     
+    def search_developers_ranked(self, text, limit=50):
+        """
+        Полнотекстовый поиск разработчиков по имени и должности с ранжированием
+
+        Returns:
+            list: Разработчики от наиболее релевантного; у каждого задан атрибут rank
+        """
+        try:
+            match = self.fts_query(text)
+            if not match:
+                return []
+
+            cursor = self.execute_query("""
+                SELECT d.id, d.full_name, d.position, d.hourly_rate,
+                       bm25(developers_fts, 2.0, 1.0) as score
+                FROM developers_fts
+                JOIN developers d ON d.id = developers_fts.rowid
+                WHERE developers_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            """, [match, limit])
+
+            developers = []
+            for row in cursor.fetchall():
+                developer = Developer(
+                    id=row[0],
+                    full_name=row[1],
+                    position=row[2],
+                    hourly_rate=row[3]
+                )
+                developer.rank = row[4]
+                developers.append(developer)
+
+            return developers
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при поиске разработчиков: {str(e)}")
+
     def calculate_developer_salary(self, developer_id, start_date=None, end_date=None):
         """
         Расчет зарплаты разработчика за период
@@ -197,22 +259,20 @@ class DeveloperService(BaseService):
                 raise BusinessException(f"Разработчик с ID {developer_id} не найден")
             
             # Формирование запроса для получения задач за период
-            query = """
-                SELECT SUM(hours_worked) 
-                FROM tasks 
-                WHERE developer_id = ?
-            """
+            conditions = []
             params = [developer_id]
+            period_start, period_end = self.day_range(start_date, end_date)
             
-            if start_date:
-                query += " AND date(created_at) >= date(?)"
-                params.append(start_date)
+            # Полуоткрытый интервал по created_at: сумма считается по idx_tasks_developer_period
+            if period_start:
+                conditions.append("created_at >= ?")
+                params.append(period_start)
             
-            if end_date:
-                query += " AND date(created_at) <= date(?)"
-                params.append(end_date)
+            if period_end:
+                conditions.append("created_at < ?")
+                params.append(period_end)
             
-            cursor = self.execute_query(query, params)
+            cursor = self.execute_query(STATEMENTS.compose('developers.hours', conditions), params)
             total_hours = cursor.fetchone()[0] or 0
             
             # Расчет зарплаты
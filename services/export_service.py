@@ -1,68 +1,274 @@
 import os
 import csv
+import gzip
 from datetime import datetime
-from exceptions import BusinessException
+from itertools import chain, islice
+from exceptions import BusinessException, ValidationException
+
+
+class ExportQuery:
+    """
+    Описание выгрузки из базы: сущность и фильтры поиска
+
+    Пустые фильтры отбрасываются, поэтому одинаковые выгрузки дают
+    равные описания (key()).
+
+    Фильтры:
+        tasks: search_term, project_id, developer_id, status
+        projects: search_term, client, start_date, end_date, developer_id
+        developers: search_term, position
+    """
+    ENTITIES = ('tasks', 'projects', 'developers')
+
+    def __init__(self, entity, **filters):
+        if entity not in self.ENTITIES:
+            raise ValidationException(f"Неизвестный тип выгрузки: {entity}")
+        self.entity = entity
+        self.filters = {name: value for name, value in filters.items() if value not in (None, '')}
+
+    def key(self):
+        return (self.entity, tuple(sorted(self.filters.items())))
+
+    def __eq__(self, other):
+        return isinstance(other, ExportQuery) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"ExportQuery({self.entity!r}, {self.filters!r})"
+
 
 class ExportService:
     """
     Сервис для экспорта данных в различные форматы
     """
-    
+    # Столбцы и имя листа выгрузок из базы (ExportQuery)
+    QUERY_EXPORTS = {
+        'tasks': (["ID", "Проект", "Разработчик", "Описание", "Статус", "Часы", "Дата создания"], 'Задачи'),
+        'projects': (["ID", "Название", "Клиент", "Дедлайн", "Бюджет", "Статус"], 'Проекты'),
+        'developers': (["ID", "ФИО", "Должность", "Ставка в час"], 'Разработчики'),
+    }
+    # Число строк в пачке при записи файла (и шаг сообщений о ходе экспорта)
+    BATCH_SIZE = 1000
+    # Предел строк на листе Excel (с заголовком)
+    EXCEL_MAX_ROWS = 1048576
+    EXCEL_MAX_TITLE = 31
+    # Ширина столбцов оценивается по первым строкам, а не по всему файлу
+    WIDTH_SAMPLE_SIZE = 500
+    MAX_COLUMN_WIDTH = 60
+
+    def __init__(self, db_manager=None):
+        """
+        Args:
+            db_manager: Менеджер базы данных для выгрузок по ExportQuery
+        """
+        self.db_manager = db_manager
+
     @staticmethod
-    def export_to_csv(data, filename, headers=None):
+    def _task_values(task):
+        return [
+            task.id,
+            task.project_name or 'Неизвестный проект',
+            task.developer_name or 'Не назначен',
+            task.description,
+            task.status,
+            task.hours_worked,
+            task.created_at,
+        ]
+
+    def query_rows(self, query):
+        """
+        Строки выгрузки по описанию запроса
+
+        Запрос выполняется сразу, строки читаются из курсора пачками по мере
+        обхода генератора.
+
+        Args:
+            query: ExportQuery
+
+        Returns:
+            tuple: (заголовки, имя листа, генератор строк)
+        """
+        from services.developer_service import DeveloperService
+        from services.project_service import ProjectService
+        from services.task_service import TaskService
+
+        headers, sheet_name = self.QUERY_EXPORTS[query.entity]
+        if query.entity == 'tasks':
+            rows = map(self._task_values, TaskService(self.db_manager).iter_tasks(**query.filters))
+        elif query.entity == 'projects':
+            rows = (row[:6] for row in ProjectService(self.db_manager).iter_projects(**query.filters))
+        else:
+            rows = DeveloperService(self.db_manager).iter_developers(**query.filters)
+        return headers, sheet_name, rows
+
+    def export_query_to_csv(self, query, filename, compress=None, progress=None):
+        """
+        Экспортирует выгрузку из базы в CSV-файл потоком из курсора
+
+        Расход памяти не зависит от числа строк: строки идут из курсора
+        в файл пачками по BATCH_SIZE.
+
+        Args:
+            query: ExportQuery
+            filename: Путь к файлу для сохранения
+            compress: Сжимать файл gzip (по умолчанию — если имя оканчивается на .gz)
+            progress: Функция progress(rows_count)
+
+        Returns:
+            dict: Результат операции
+        """
+        headers, _, rows = self.query_rows(query)
+        return self.export_to_csv(rows, filename, headers, compress=compress, progress=progress)
+
+    def export_query_to_excel(self, query, filename, sheet_name=None, progress=None):
+        """
+        Экспортирует выгрузку из базы в Excel-файл потоком из курсора
+
+        Args:
+            query: ExportQuery
+            filename: Путь к файлу для сохранения
+            sheet_name: Имя листа (по умолчанию — по типу выгрузки)
+            progress: Функция progress(rows_count)
+
+        Returns:
+            dict: Результат операции
+        """
+        headers, default_sheet_name, rows = self.query_rows(query)
+        return self.export_to_excel(rows, filename, sheet_name or default_sheet_name, headers, progress=progress)
+
+    @staticmethod
+    def export_to_csv(data, filename, headers=None, compress=None, batch_size=None, progress=None):
         """
         Экспортирует данные в CSV-файл
-        
+
+        Строки пишутся пачками по batch_size по мере чтения data, поэтому
+        data может быть генератором строк прямо из курсора. Файл сначала
+        пишется под временным именем и заменяет прежний только целиком.
+
         Args:
-            data: Данные для экспорта (список словарей или список списков)
+            data: Данные для экспорта (список или генератор словарей, списков или кортежей)
             filename: Путь к файлу для сохранения
             headers: Заголовки столбцов (если None, используются ключи из первого элемента data)
-        
+            compress: Сжимать файл gzip (по умолчанию — если имя оканчивается на .gz)
+            batch_size: Число строк в пачке
+            progress: Функция progress(rows_count), вызывается после каждой пачки
+
         Returns:
             dict: Результат операции
         """
+        temp_filename = filename + '.part'
         try:
             # Создаем директорию для файла, если она не существует
             os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-            
-            # Если данные - список словарей, преобразуем их в список списков
-            if data and isinstance(data[0], dict):
-                if headers is None:
-                    headers = list(data[0].keys())
-                rows = [list(item.values()) for item in data]
-            else:
-                rows = data
-            
-            # Записываем данные в CSV-файл
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+
+            if compress is None:
+                compress = filename.lower().endswith('.gz')
+            batch_size = batch_size or ExportService.BATCH_SIZE
+
+            items = iter(data)
+            first = next(items, None)
+            # Заголовки берутся из ключей первого словаря
+            if isinstance(first, dict) and headers is None:
+                headers = list(first.keys())
+            rows = ExportService.iter_rows(chain([first], items) if first is not None else ())
+
+            opener = gzip.open if compress else open
+            rows_count = 0
+            with opener(temp_filename, 'wt', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 if headers:
                     writer.writerow(headers)
-                writer.writerows(rows)
-            
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    writer.writerows(batch)
+                    rows_count += len(batch)
+                    if progress:
+                        progress(rows_count)
+            os.replace(temp_filename, filename)
+
             return {
                 'success': True,
                 'filename': filename,
-                'rows_count': len(rows)
+                'rows_count': rows_count
             }
-        
+
         except Exception as e:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
             return {
                 'success': False,
                 'error': str(e)
             }
-    
+
     @staticmethod
-    def export_to_excel(data, filename, sheet_name='Sheet1', headers=None):
+    def iter_rows(data):
+        """
+        Превращает данные в поток списков значений
+
+        Args:
+            data: Список или генератор словарей, кортежей или списков
+
+        Yields:
+            Значения строки
+        """
+        for item in data:
+            if isinstance(item, dict):
+                yield list(item.values())
+            else:
+                yield item
+
+    @staticmethod
+    def estimate_column_widths(headers, sample):
+        """
+        Оценивает ширину столбцов Excel по заголовкам и выборке строк
+
+        Returns:
+            list: Ширина каждого столбца
+        """
+        lengths = [len(str(header)) for header in headers or []]
+        for row in sample:
+            for col_idx, value in enumerate(row):
+                length = len(str(value)) if value not in (None, '') else 0
+                if col_idx >= len(lengths):
+                    lengths.append(length)
+                elif length > lengths[col_idx]:
+                    lengths[col_idx] = length
+        return [min((length + 2) * 1.2, ExportService.MAX_COLUMN_WIDTH) for length in lengths]
+
+    @staticmethod
+    def _sheet_title(sheet_name, number):
+        """
+        Имя листа с номером части; недопустимые в Excel символы заменяются
+        """
+        title = ''.join('_' if char in '[]:*?/\\' else char for char in str(sheet_name)) or 'Sheet'
+        suffix = f' ({number})' if number > 1 else ''
+        return title[:ExportService.EXCEL_MAX_TITLE - len(suffix)] + suffix
+
+    @staticmethod
+    def export_to_excel(data, filename, sheet_name='Sheet1', headers=None, max_rows_per_sheet=None,
+                        sample_size=None, progress=None):
         """
         Экспортирует данные в Excel-файл
-        
+
+        Книга пишется в потоковом режиме openpyxl (write_only): строки сразу
+        уходят в файл и не хранятся в памяти, поэтому data может быть
+        генератором строк прямо из курсора. Ширина столбцов оценивается по
+        первым sample_size строкам. Если строк больше, чем помещается на лист,
+        они продолжаются на следующих листах с тем же заголовком.
+
         Args:
-            data: Данные для экспорта (список словарей или список списков)
+            data: Данные для экспорта (список или генератор словарей, списков или кортежей)
             filename: Путь к файлу для сохранения
             sheet_name: Имя листа в Excel-файле
             headers: Заголовки столбцов (если None, используются ключи из первого элемента data)
-        
+            max_rows_per_sheet: Наибольшее число строк данных на листе
+            sample_size: Число строк для оценки ширины столбцов
+            progress: Функция progress(rows_count), вызывается каждые BATCH_SIZE строк
+
         Returns:
             dict: Результат операции
         """
@@ -70,69 +276,87 @@ class ExportService:
             # Проверяем наличие библиотеки openpyxl
             try:
                 import openpyxl
+                from openpyxl.cell import WriteOnlyCell
                 from openpyxl.styles import Font, Alignment, PatternFill
+                from openpyxl.utils import get_column_letter
             except ImportError:
                 return {
                     'success': False,
                     'error': 'Для экспорта в Excel требуется библиотека openpyxl. Установите её с помощью pip install openpyxl'
                 }
-            
+
             # Создаем директорию для файла, если она не существует
             os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-            
-            # Создаем новую книгу Excel и активный лист
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = sheet_name
-            
-            # Если данные - список словарей, преобразуем их в список списков и получаем заголовки
-            if data and isinstance(data[0], dict):
-                if headers is None:
-                    headers = list(data[0].keys())
-                rows = [list(item.values()) for item in data]
-            else:
-                rows = data
-            
-            # Записываем заголовки
-            if headers:
-                for col_idx, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_idx, value=header)
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center')
-                    cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-            
-            # Записываем данные
-            for row_idx, row_data in enumerate(rows, 2 if headers else 1):
-                for col_idx, cell_value in enumerate(row_data, 1):
-                    ws.cell(row=row_idx, column=col_idx, value=cell_value)
-            
-            # Автоматически подгоняем ширину столбцов
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                adjusted_width = (max_length + 2) * 1.2
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
+
+            items = iter(data)
+            sample_size = sample_size or ExportService.WIDTH_SAMPLE_SIZE
+            sample = list(islice(items, sample_size))
+
+            # Заголовки берутся из ключей первого словаря
+            if sample and isinstance(sample[0], dict) and headers is None:
+                headers = list(sample[0].keys())
+            sample = list(ExportService.iter_rows(sample))
+            rows = chain(sample, ExportService.iter_rows(items))
+
+            limit = ExportService.EXCEL_MAX_ROWS - (1 if headers else 0)
+            if max_rows_per_sheet:
+                limit = min(limit, max_rows_per_sheet)
+            widths = ExportService.estimate_column_widths(headers, sample)
+
+            wb = openpyxl.Workbook(write_only=True)
+            header_font = Font(bold=True)
+            header_alignment = Alignment(horizontal='center')
+            header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+
+            def new_sheet(number):
+                ws = wb.create_sheet(ExportService._sheet_title(sheet_name, number))
+                # В потоковом режиме ширина задается до записи строк
+                for col_idx, width in enumerate(widths, 1):
+                    ws.column_dimensions[get_column_letter(col_idx)].width = width
+                if headers:
+                    header_cells = []
+                    for header in headers:
+                        cell = WriteOnlyCell(ws, value=header)
+                        cell.font = header_font
+                        cell.alignment = header_alignment
+                        cell.fill = header_fill
+                        header_cells.append(cell)
+                    ws.append(header_cells)
+                return ws
+
+            sheets = 1
+            ws = new_sheet(sheets)
+            rows_count = 0
+            sheet_rows = 0
+            for row in rows:
+                if sheet_rows == limit:
+                    sheets += 1
+                    ws = new_sheet(sheets)
+                    sheet_rows = 0
+                ws.append(list(row))
+                sheet_rows += 1
+                rows_count += 1
+                if progress and rows_count % ExportService.BATCH_SIZE == 0:
+                    progress(rows_count)
+
             # Сохраняем файл
             wb.save(filename)
-            
+            if progress:
+                progress(rows_count)
+
             return {
                 'success': True,
                 'filename': filename,
-                'rows_count': len(rows)
+                'rows_count': rows_count,
+                'sheets': sheets
             }
-        
+
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
-    
+
     @staticmethod
     def format_report_data(report_data):
         """
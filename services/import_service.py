@@ -0,0 +1,402 @@
+import csv
+from datetime import datetime
+from itertools import islice
+
+from services.base_service import BaseService
+from services.batch_loader import BatchLoader
+from validation import TaskValidator, ProjectValidator, DeveloperValidator
+from exceptions import BusinessException, ValidationException, DatabaseException
+
+
+class ImportService(BaseService):
+    """
+    Сервис потокового импорта данных из CSV-файлов.
+
+    Файл читается генератором по пачкам, поэтому расход памяти не зависит
+    от размера файла. Каждая пачка валидируется и записывается одним
+    executemany в собственной транзакции. Дубликаты обрабатываются
+    триггерами upsert_* из схемы базы данных.
+    """
+    DEFAULT_CHUNK_SIZE = 1000
+    MAX_REPORTED_ERRORS = 100
+
+    # Заголовки CSV (в том числе из экспорта таблиц приложения) -> поля модели
+    HEADER_ALIASES = {
+        'tasks': {
+            'описание': 'description', 'description': 'description',
+            'проект': 'project_name', 'project': 'project_name', 'project_name': 'project_name',
+            'project_id': 'project_id',
+            'разработчик': 'developer_name', 'developer': 'developer_name',
+            'developer_name': 'developer_name', 'developer_id': 'developer_id',
+            'статус': 'status', 'status': 'status',
+            'часы': 'hours_worked', 'hours': 'hours_worked', 'hours_worked': 'hours_worked'
+        },
+        'projects': {
+            'название': 'name', 'name': 'name',
+            'клиент': 'client', 'client': 'client',
+            'срок сдачи': 'deadline', 'дедлайн': 'deadline', 'deadline': 'deadline',
+            'бюджет': 'budget', 'budget': 'budget',
+            'статус': 'status', 'status': 'status'
+        },
+        'developers': {
+            'фио': 'full_name', 'full_name': 'full_name', 'name': 'full_name',
+            'должность': 'position', 'position': 'position',
+            'почасовая ставка': 'hourly_rate', 'ставка': 'hourly_rate', 'hourly_rate': 'hourly_rate'
+        }
+    }
+
+    def iter_chunks(self, filename, entity, chunk_size=None):
+        """
+        Читает CSV-файл по пачкам
+
+        Args:
+            filename: Путь к CSV-файлу
+            entity: Тип данных (tasks, projects, developers)
+            chunk_size: Размер пачки
+
+        Yields:
+            list: Пачка пар (номер строки, словарь с полями модели)
+        """
+        aliases = self.HEADER_ALIASES[entity]
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+        with open(filename, 'r', newline='', encoding='utf-8-sig') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if not header:
+                return
+            fields = [aliases.get(column.strip().lower()) for column in header]
+
+            # Первая строка данных в файле имеет номер 2
+            rows = enumerate(reader, start=2)
+            while True:
+                chunk = []
+                for line, values in islice(rows, chunk_size):
+                    if not any(value.strip() for value in values):
+                        continue
+                    record = {}
+                    for field, value in zip(fields, values):
+                        if field:
+                            record[field] = value.strip()
+                    chunk.append((line, record))
+                if not chunk:
+                    break
+                yield chunk
+
+    @staticmethod
+    def _normalize_date(value):
+        if not value:
+            return value
+        for date_format in ('%Y-%m-%d', '%d.%m.%Y'):
+            try:
+                return datetime.strptime(value, date_format).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return value
+
+    def _load_name_index(self, table, column):
+        cursor = self.execute_query(f"SELECT {column}, id FROM {table} ORDER BY id")
+        index = {}
+        for name, row_id in cursor.fetchall():
+            index.setdefault(name, row_id)
+        return index
+
+    def _new_summary(self, entity, dry_run):
+        return {
+            'entity': entity,
+            'dry_run': dry_run,
+            'processed': 0,
+            'imported': 0,
+            'skipped': 0,
+            'errors': []
+        }
+
+    def _add_error(self, summary, line, message):
+        summary['skipped'] += 1
+        if len(summary['errors']) < self.MAX_REPORTED_ERRORS:
+            summary['errors'].append({'line': line, 'error': message})
+
+    def _write_chunk(self, query, params):
+        try:
+            self.begin_write()
+            self.db_manager.execute_many(query, params)
+            self.commit()
+        except Exception as e:
+            self.rollback()
+            raise DatabaseException("Ошибка при записи пачки импорта", e)
+
+    def import_csv(self, filename, entity, chunk_size=None, dry_run=False, progress_callback=None):
+        """
+        Импортирует CSV-файл
+
+        Args:
+            filename: Путь к CSV-файлу
+            entity: Тип данных (tasks, projects, developers)
+            chunk_size: Размер пачки
+            dry_run: Только проверить данные, ничего не записывая
+            progress_callback: Функция, вызываемая после каждой пачки с итогами импорта
+
+        Returns:
+            dict: Итоги импорта (processed, imported, skipped, errors)
+        """
+        importers = {
+            'tasks': self._import_task_chunk,
+            'projects': self._import_project_chunk,
+            'developers': self._import_developer_chunk
+        }
+        try:
+            if entity not in importers:
+                raise BusinessException(f"Неизвестный тип данных для импорта: {entity}")
+
+            summary = self._new_summary(entity, dry_run)
+            context = {}
+            if entity == 'tasks':
+                context['projects'] = self._load_name_index('projects', 'name')
+                context['developers'] = self._load_name_index('developers', 'full_name')
+                # Трудозатраты строк, принятых в предыдущих пачках пробного
+                # запуска: в базу они не записаны
+                context['dry_run_costs'] = {}
+
+            for chunk in self.iter_chunks(filename, entity, chunk_size):
+                importers[entity](chunk, summary, context, dry_run)
+                summary['processed'] += len(chunk)
+                if progress_callback:
+                    progress_callback(dict(summary))
+
+            return summary
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при импорте из CSV: {str(e)}")
+
+    def import_tasks(self, filename, **kwargs):
+        """
+        Импортирует задачи из CSV-файла
+        """
+        return self.import_csv(filename, 'tasks', **kwargs)
+
+    def import_projects(self, filename, **kwargs):
+        """
+        Импортирует проекты из CSV-файла
+        """
+        return self.import_csv(filename, 'projects', **kwargs)
+
+    def import_developers(self, filename, **kwargs):
+        """
+        Импортирует разработчиков из CSV-файла
+        """
+        return self.import_csv(filename, 'developers', **kwargs)
+
+    def _resolve_reference(self, record, context, name_field, id_field, index_name):
+        if record.get(id_field):
+            return record[id_field]
+        name = record.get(name_field)
+        if not name:
+            return None
+        return context[index_name].get(name)
+
+    def _load_budgets(self, project_ids):
+        """
+        Бюджет и текущие трудозатраты проектов, как их считает триггер check_project_budget
+
+        Returns:
+            dict: ID проекта -> [бюджет, трудозатраты]
+        """
+        project_ids = list(set(project_ids))
+        budgets = {}
+        for start in range(0, len(project_ids), BatchLoader.CHUNK_SIZE):
+            chunk = project_ids[start:start + BatchLoader.CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = self.execute_query(f"""
+                SELECT p.id, p.budget, (
+                    SELECT COALESCE(SUM(t.hours_worked * d.hourly_rate), 0)
+                    FROM tasks t
+                    JOIN developers d ON t.developer_id = d.id
+                    WHERE t.project_id = p.id
+                )
+                FROM projects p
+                WHERE p.id IN ({placeholders})
+            """, chunk)
+            budgets.update({row[0]: [row[1], row[2]] for row in cursor.fetchall()})
+        return budgets
+
+    def _developer_rate(self, context, developer_id):
+        rates = context.setdefault('rates', {})
+        if developer_id not in rates:
+            cursor = self.execute_query("SELECT hourly_rate FROM developers WHERE id = ?", [developer_id])
+            row = cursor.fetchone()
+            rates[developer_id] = row[0] if row else None
+        return rates[developer_id]
+
+    # Ключей задач в одном запросе поиска дубликатов (по 3 параметра на ключ)
+    KEY_LOOKUP_SIZE = 300
+
+    def _load_existing_tasks(self, keys):
+        """
+        Часы существующих задач с ключами (проект, разработчик, описание) из пачки
+
+        Строка с таким ключом обновляет задачу (триггер upsert_task), а не
+        добавляет новую. Разработчики сравниваются через IS, как в триггере.
+
+        Returns:
+            dict: Ключ -> часы
+        """
+        keys = list(set(keys))
+        existing = {}
+        for start in range(0, len(keys), self.KEY_LOOKUP_SIZE):
+            chunk = keys[start:start + self.KEY_LOOKUP_SIZE]
+            values = ', '.join('(?, ?, ?)' for _ in chunk)
+            cursor = self.execute_query(f"""
+                WITH chunk_keys(project_id, developer_id, description) AS (VALUES {values})
+                SELECT t.project_id, t.developer_id, t.description, t.hours_worked
+                FROM chunk_keys k
+                JOIN tasks t ON t.project_id = k.project_id
+                    AND t.developer_id IS k.developer_id
+                    AND t.description = k.description
+            """, [value for key in chunk for value in key])
+            for row in cursor.fetchall():
+                existing[(row[0], row[1], row[2])] = row[3]
+        return existing
+
+    def _import_task_chunk(self, chunk, summary, context, dry_run):
+        rows = []
+        for line, record in chunk:
+            project_id = self._resolve_reference(record, context, 'project_name', 'project_id', 'projects')
+            if project_id is None:
+                self._add_error(summary, line, f"Проект '{record.get('project_name', '')}' не найден")
+                continue
+            developer_id = self._resolve_reference(record, context, 'developer_name', 'developer_id', 'developers')
+            if developer_id is None and record.get('developer_name'):
+                self._add_error(summary, line, f"Разработчик '{record['developer_name']}' не найден")
+                continue
+
+            data = {
+                'project_id': project_id,
+                'developer_id': developer_id,
+                'description': record.get('description'),
+                'status': record.get('status') or 'новая',
+                'hours_worked': record.get('hours_worked') or 0
+            }
+            try:
+                data = TaskValidator.validate(data)
+            except ValidationException as e:
+                self._add_error(summary, line, str(e))
+                continue
+
+            developer_id = int(data['developer_id']) if data.get('developer_id') else None
+            rows.append((line, int(data['project_id']), developer_id, data))
+
+        if not rows:
+            return
+        # Блокировка записи берется до чтения бюджетов и дубликатов, как в
+        # TaskService.bulk_create_tasks: между проверкой и записью пачки
+        # другое соединение не изменит задачи
+        if not dry_run:
+            self.begin_write()
+        try:
+            params = self._check_task_rows(rows, summary, context, dry_run)
+            if params and not dry_run:
+                self.db_manager.execute_many(
+                    "INSERT INTO tasks (project_id, developer_id, description, status, hours_worked) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    params
+                )
+            if not dry_run:
+                self.commit()
+        except Exception as e:
+            if not dry_run:
+                self.rollback()
+            if isinstance(e, DatabaseException):
+                raise e
+            raise DatabaseException("Ошибка при записи пачки импорта", e)
+        summary['imported'] += len(params)
+
+    def _check_task_rows(self, rows, summary, context, dry_run):
+        """
+        Проверяет бюджет строк пачки и собирает параметры вставки
+
+        Память — на одну пачку: ключи существующих задач читаются только
+        для строк пачки. В пробном запуске трудозатраты предыдущих пачек
+        учитываются по проектам, повторы между пачками — нет.
+        """
+        budgets = self._load_budgets(row[1] for row in rows)
+        dry_run_costs = context['dry_run_costs']
+        if dry_run:
+            for project_id, budget in budgets.items():
+                budget[1] += dry_run_costs.get(project_id, 0)
+        existing = self._load_existing_tasks(
+            (project_id, developer_id, data['description']) for _, project_id, developer_id, data in rows
+        )
+
+        params = []
+        for line, project_id, developer_id, data in rows:
+            budget = budgets.get(project_id)
+            if budget is None:
+                self._add_error(summary, line, f"Проект с ID {project_id} не найден")
+                continue
+            key = (project_id, developer_id, data['description'])
+            if developer_id:
+                rate = self._developer_rate(context, developer_id)
+                if rate is None:
+                    self._add_error(summary, line, f"Разработчик с ID {developer_id} не найден")
+                    continue
+                if key in existing:
+                    # Повтор существующей задачи обновляет ее: триггер бюджета
+                    # не срабатывает, меняются только трудозатраты проекта
+                    cost = (data['hours_worked'] - existing[key]) * rate
+                else:
+                    # Та же проверка, что в триггере check_project_budget
+                    cost = data['hours_worked'] * rate
+                    if budget[1] + cost > budget[0]:
+                        self._add_error(summary, line, "Превышение бюджета проекта")
+                        continue
+                budget[1] += cost
+                if dry_run:
+                    dry_run_costs[project_id] = dry_run_costs.get(project_id, 0) + cost
+            # Следующий повтор в пачке обновит уже добавленную строку
+            existing[key] = data['hours_worked']
+
+            params.append((project_id, developer_id, data['description'], data['status'], data['hours_worked']))
+        return params
+
+    def _import_project_chunk(self, chunk, summary, context, dry_run):
+        params = []
+        for line, record in chunk:
+            data = dict(record)
+            data['deadline'] = self._normalize_date(data.get('deadline'))
+            data.setdefault('budget', 0)
+            try:
+                data = ProjectValidator.validate(data)
+                if not data.get('deadline'):
+                    raise ValidationException("Поле не может быть пустым", 'deadline')
+            except ValidationException as e:
+                self._add_error(summary, line, str(e))
+                continue
+            params.append((data['name'], data['client'], data['deadline'], data['budget'],
+                           data.get('status') or 'в работе'))
+
+        if params and not dry_run:
+            self._write_chunk(
+                "INSERT INTO projects (name, client, deadline, budget, status) VALUES (?, ?, ?, ?, ?)",
+                params
+            )
+        summary['imported'] += len(params)
+
+    def _import_developer_chunk(self, chunk, summary, context, dry_run):
+        params = []
+        for line, record in chunk:
+            try:
+                data = DeveloperValidator.validate(dict(record))
+                if 'hourly_rate' not in data:
+                    raise ValidationException("Поле не может быть пустым", 'hourly_rate')
+            except ValidationException as e:
+                self._add_error(summary, line, str(e))
+                continue
+            params.append((data['full_name'], data['position'], data['hourly_rate']))
+
+        if params and not dry_run:
+            self._write_chunk(
+                "INSERT INTO developers (full_name, position, hourly_rate) VALUES (?, ?, ?)",
+                params
+            )
+        summary['imported'] += len(params)
@@ -2,11 +2,15 @@ from services.base_service import BaseService
 from models.notification import Notification
 from exceptions import BusinessException, ValidationException, DatabaseException
 from datetime import datetime, timedelta
+import time
 
 class NotificationService(BaseService):
     """
     Сервис для работы с уведомлениями
     """
+    # True, пока run_all_checks() выполняет проверки одной транзакцией
+    _in_batch = False
+
     def get_all_notifications(self, limit=None, offset=None, only_unread=False):
         """
         Получает список всех уведомлений
@@ -161,14 +165,24 @@ class NotificationService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при удалении уведомлений: {str(e)}")
 
-    def _notification_exists(self, related_id, related_type):
-        query = """
-            SELECT id FROM notifications
-            WHERE related_id = ? AND related_type = ? AND is_read = 0
-            LIMIT 1
+    def _run_check(self, query, params):
+        """
+        Выполняет проверку одним запросом INSERT ... SELECT
+
+        Вне run_all_checks() каждая проверка фиксируется отдельно,
+        внутри — все проверки идут одной транзакцией.
+
+        Returns:
+            int: Количество созданных уведомлений
         """
-        cursor = self.execute_query(query, [related_id, related_type])
-        return cursor.fetchone() is not None
+        cursor = self.execute_query(query, params)
+        if not self._in_batch:
+            self.commit()
+        return max(cursor.rowcount, 0)
+
+    @staticmethod
+    def _now():
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     def check_overdue_projects(self):
         """
@@ -180,40 +194,23 @@ class NotificationService(BaseService):
         try:
             today = datetime.now().strftime('%Y-%m-%d')
 
-            # Упрощенный запрос без проверки существующих уведомлений
+            # Повторное уведомление не создается, пока предыдущее не прочитано
             query = """
-                SELECT id, name, deadline
-                FROM projects
-                WHERE deadline < ? AND status != 'завершено'
-            """
-            cursor = self.execute_query(query, [today])
-
-            projects = cursor.fetchall()
-
-            count = 0
-            for row in projects:
-                project_id = row[0]
-                project_name = row[1]
-                deadline = row[2]
-
-                if self._notification_exists(project_id, 'project_overdue'):
-                    continue
-
-
-                # Создаем уведомление о просроченном проекте
-                notification = self.create_notification(
-                    title="Просрочен дедлайн проекта",
-                    message=f"Проект '{project_name}' просрочен. Дедлайн был {deadline}.",
-                    type="warning",
-                    related_id=project_id,
-                    related_type="project_overdue"
+                INSERT OR IGNORE INTO notifications (title, message, type, related_id, related_type, is_read, created_at)
+                SELECT 'Просрочен дедлайн проекта',
+                       printf('Проект ''%s'' просрочен. Дедлайн был %s.', p.name, p.deadline),
+                       'warning', p.id, 'project_overdue', 0, ?
+                FROM projects p
+                WHERE p.deadline < ? AND p.status != 'завершено'
+                AND NOT EXISTS (
+                    SELECT 1 FROM notifications n
+                    WHERE n.related_type = 'project_overdue' AND n.related_id = p.id AND n.is_read = 0
                 )
-
-                if notification:
-                    count += 1
-
-            return count
+            """
+            return self._run_check(query, [self._now(), today])
         except Exception:
+            if self._in_batch:
+                raise
             return 0
 
     def check_upcoming_deadlines(self, days=3):
@@ -230,35 +227,20 @@ class NotificationService(BaseService):
             today = datetime.now().date()
             future_date = (today + timedelta(days=days)).strftime('%Y-%m-%d')
             
-            # Получаем проекты, у которых дедлайн через указанное количество дней
+            # Проекты, у которых дедлайн через указанное количество дней
             query = """
-                SELECT id, name, deadline
-                FROM projects
-                WHERE date(deadline) = ? AND deadline IS NOT NULL
-                AND id NOT IN (
-                    SELECT related_id FROM notifications 
-                    WHERE related_type = 'project_upcoming' AND related_id IS NOT NULL
+                INSERT OR IGNORE INTO notifications (title, message, type, related_id, related_type, is_read, created_at)
+                SELECT 'Приближается дедлайн проекта',
+                       printf('До дедлайна проекта ''%s'' осталось %d дней. Дедлайн: %s.', p.name, ?, p.deadline),
+                       'info', p.id, 'project_upcoming', 0, ?
+                FROM projects p
+                WHERE p.deadline >= ? AND p.deadline < ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM notifications n
+                    WHERE n.related_type = 'project_upcoming' AND n.related_id = p.id
                 )
             """
-            cursor = self.execute_query(query, [future_date])
-            
-            count = 0
-            for row in cursor.fetchall():
-                project_id = row[0]
-                project_name = row[1]
-                deadline = row[2]
-                
-                # Создаем уведомление о приближающемся дедлайне
-                self.create_notification(
-                    title="Приближается дедлайн проекта",
-                    message=f"До дедлайна проекта '{project_name}' осталось {days} дней. Дедлайн: {deadline}.",
-                    type="info",
-                    related_id=project_id,
-                    related_type="project_upcoming"
-                )
-                count += 1
-            
-            return count
+            return self._run_check(query, [days, self._now(), *self.day_range(future_date, future_date)])
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
@@ -275,40 +257,26 @@ class NotificationService(BaseService):
             int: Количество созданных уведомлений
         """
         try:
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            # date(updated_at) <= день отсечки  <=>  updated_at < следующий день
+            _, cutoff_date = self.day_range(None, (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'))
             
-            # Получаем задачи, которые не обновлялись более указанного количества дней и не завершены
+            # Задачи, которые не обновлялись более указанного количества дней и не завершены
             query = """
-                SELECT t.id, t.description, p.name as project_name, d.full_name as developer_name
+                INSERT OR IGNORE INTO notifications (title, message, type, related_id, related_type, is_read, created_at)
+                SELECT 'Неактивная задача',
+                       printf('Задача ''%s'' в проекте ''%s'' (разработчик: %s) не обновлялась более %d дней.',
+                              t.description, p.name, COALESCE(d.full_name, 'Не назначен'), ?),
+                       'warning', t.id, 'task_inactive', 0, ?
                 FROM tasks t
                 JOIN projects p ON t.project_id = p.id
                 LEFT JOIN developers d ON t.developer_id = d.id
-                WHERE t.status != 'завершено' AND date(t.updated_at) <= ?
-                AND t.id NOT IN (
-                    SELECT related_id FROM notifications 
-                    WHERE related_type = 'task_inactive' AND related_id IS NOT NULL
+                WHERE t.updated_at < ? AND t.status != 'завершено'
+                AND NOT EXISTS (
+                    SELECT 1 FROM notifications n
+                    WHERE n.related_type = 'task_inactive' AND n.related_id = t.id
                 )
             """
-            cursor = self.execute_query(query, [cutoff_date])
-            
-            count = 0
-            for row in cursor.fetchall():
-                task_id = row[0]
-                task_description = row[1]
-                project_name = row[2]
-                developer_name = row[3] or "Не назначен"
-                
-                # Создаем уведомление о неактивной задаче
-                self.create_notification(
-                    title="Неактивная задача",
-                    message=f"Задача '{task_description}' в проекте '{project_name}' (разработчик: {developer_name}) не обновлялась более {days} дней.",
-                    type="warning",
-                    related_id=task_id,
-                    related_type="task_inactive"
-                )
-                count += 1
-            
-            return count
+            return self._run_check(query, [days, self._now(), cutoff_date])
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
@@ -325,67 +293,81 @@ class NotificationService(BaseService):
             int: Количество созданных уведомлений
         """
         try:
-            # Получаем проекты, у которых использовано более указанного процента бюджета
+            # Проекты, у которых использовано более указанного процента бюджета
             query = """
-                SELECT p.id, p.name, p.budget, SUM(t.hours_worked * d.hourly_rate) as cost
+                INSERT OR IGNORE INTO notifications (title, message, type, related_id, related_type, is_read, created_at)
+                SELECT 'Предупреждение о бюджете',
+                       printf('Проект ''%s'' использовал %.1f%% бюджета (%.2f из %.2f).',
+                              p.name, SUM(t.hours_worked * d.hourly_rate) * 100.0 / p.budget,
+                              SUM(t.hours_worked * d.hourly_rate), p.budget),
+                       CASE WHEN SUM(t.hours_worked * d.hourly_rate) < p.budget THEN 'warning' ELSE 'error' END,
+                       p.id, 'budget_warning', 0, ?
                 FROM projects p
                 JOIN tasks t ON p.id = t.project_id
                 JOIN developers d ON t.developer_id = d.id
                 WHERE p.budget > 0
-                GROUP BY p.id
-                HAVING cost >= p.budget * ?
-                AND p.id NOT IN (
-                    SELECT related_id FROM notifications 
-                    WHERE related_type = 'budget_warning' AND related_id IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM notifications n
+                    WHERE n.related_type = 'budget_warning' AND n.related_id = p.id
                 )
+                GROUP BY p.id
+                HAVING SUM(t.hours_worked * d.hourly_rate) >= p.budget * ?
             """
-            cursor = self.execute_query(query, [threshold])
-            
-            count = 0
-            for row in cursor.fetchall():
-                project_id = row[0]
-                project_name = row[1]
-                budget = row[2]
-                cost = row[3]
-                percent = (cost / budget) * 100
-                
-                # Создаем уведомление о превышении бюджета
-                self.create_notification(
-                    title="Предупреждение о бюджете",
-                    message=f"Проект '{project_name}' использовал {percent:.1f}% бюджета ({cost:.2f} из {budget:.2f}).",
-                    type="warning" if cost < budget else "error",
-                    related_id=project_id,
-                    related_type="budget_warning"
-                )
-                count += 1
-            
-            return count
+            return self._run_check(query, [self._now(), threshold])
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
             raise BusinessException(f"Ошибка при проверке бюджета проектов: {str(e)}")
     
-    def run_all_checks(self):
+    # Проверки, выполняемые run_checks(), в порядке запуска
+    CHECKS = (
+        ('overdue_projects', 'check_overdue_projects'),
+        ('upcoming_deadlines', 'check_upcoming_deadlines'),
+        ('inactive_tasks', 'check_inactive_tasks'),
+        ('budget_warnings', 'check_budget_warnings'),
+    )
+
+    def run_checks(self, names=None, timings=None):
         """
-        Запускает все проверки и создает уведомления
-        
+        Запускает выбранные проверки одной транзакцией
+
+        Args:
+            names: Имена проверок из CHECKS (None — все проверки)
+            timings: Словарь, в который записывается длительность каждой проверки в секундах
+
         Returns:
-            dict: Количество созданных уведомлений по каждой проверке
+            dict: Количество созданных уведомлений по каждой проверке и итог total
         """
         try:
-            overdue = self.check_overdue_projects()
-            upcoming = self.check_upcoming_deadlines()
-            inactive = self.check_inactive_tasks()
-            budget = self.check_budget_warnings()
-            
-            return {
-                'overdue_projects': overdue,
-                'upcoming_deadlines': upcoming,
-                'inactive_tasks': inactive,
-                'budget_warnings': budget,
-                'total': overdue + upcoming + inactive + budget
-            }
+            checks = [(name, method) for name, method in self.CHECKS if names is None or name in names]
+            results = {}
+            self._in_batch = True
+            try:
+                self.db_manager.begin_transaction(immediate=True)
+                for name, method in checks:
+                    started = time.perf_counter()
+                    results[name] = getattr(self, method)()
+                    if timings is not None:
+                        timings[name] = time.perf_counter() - started
+                self.commit()
+            except Exception:
+                self.rollback()
+                raise
+            finally:
+                self._in_batch = False
+
+            results['total'] = sum(results.values())
+            return results
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
             raise BusinessException(f"Ошибка при выполнении проверок: {str(e)}")
+
+    def run_all_checks(self):
+        """
+        Запускает все проверки и создает уведомления
+        
+        Returns:
+            dict: Количество созданных уведомлений по каждой проверке
+        """
+        return self.run_checks()
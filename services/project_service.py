@@ -1,5 +1,6 @@
 from services.base_service import BaseService
 from models import Project, Task
+from models.statements import STATEMENTS
 from validation import ProjectValidator
 from exceptions import BusinessException, ValidationException, DatabaseException
 from datetime import datetime
@@ -14,8 +15,7 @@ class ProjectService(BaseService):
         Получает список всех проектов
         """
         try:
-            query = "SELECT id, name, client, deadline, budget, status, created_at FROM projects"
-            cursor = self.execute_query(query)
+            cursor = self.execute_query(STATEMENTS['projects.all'])
 
             projects = []
             for row in cursor.fetchall():
@@ -40,8 +40,7 @@ class ProjectService(BaseService):
         """
         Получает проект по ID
         """
-        query = "SELECT * FROM projects WHERE id = ?"
-        result = self.db_manager.execute(query, (project_id,)).fetchone()
+        result = self.db_manager.execute(STATEMENTS['projects.by_id'], (project_id,)).fetchone()
 
         if not result:
             raise BusinessException(f"Проект с ID {project_id} не найден")
@@ -165,31 +164,75 @@ class ProjectService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при удалении проекта: {str(e)}")
 
+    def iter_projects(self, search_term=None, client=None, start_date=None, end_date=None,
+                      developer_id=None, batch_size=None):
+        """
+        Генератор строк проектов прямо из курсора (для экспорта)
+
+        Args:
+            search_term: Подстрока названия или клиента
+            client: Клиент (точное совпадение)
+            start_date, end_date: Границы срока сдачи
+            developer_id: Только проекты, в задачах которых участвует разработчик
+
+        Yields:
+            tuple: (id, name, client, deadline, budget, status, created_at) в порядке ID
+        """
+        try:
+            conditions = []
+            params = []
+
+            if search_term:
+                conditions.append("(name LIKE ? OR client LIKE ?)")
+                params.extend([f"%{search_term}%", f"%{search_term}%"])
+
+            if client:
+                conditions.append("client = ?")
+                params.append(client)
+
+            if start_date:
+                conditions.append("date(deadline) >= date(?)")
+                params.append(start_date)
+
+            if end_date:
+                conditions.append("date(deadline) <= date(?)")
+                params.append(end_date)
+
+            if developer_id:
+                conditions.append("id IN (SELECT project_id FROM tasks WHERE developer_id = ?)")
+                params.append(developer_id)
+
+            return self.iter_query(STATEMENTS.compose('projects.all', conditions, "ORDER BY id"), params, batch_size)
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при получении списка проектов: {str(e)}")
+
     def search_projects(self, search_term=None, client=None, start_date=None, end_date=None):
         """
         Поиск проектов по названию, клиенту и/или дате
         """
         try:
-            query = "SELECT id, name, client, deadline, budget, created_at FROM projects WHERE 1=1"
+            conditions = []
             params = []
             
             if search_term:
-                query += " AND (name LIKE ? OR client LIKE ?)"
+                conditions.append("(name LIKE ? OR client LIKE ?)")
                 params.extend([f"%{search_term}%", f"%{search_term}%"])
             
             if client:
-                query += " AND client LIKE ?"
+                conditions.append("client LIKE ?")
                 params.append(f"%{client}%")
             
             if start_date:
-                query += " AND date(deadline) >= date(?)"
+                conditions.append("date(deadline) >= date(?)")
                 params.append(start_date)
             
             if end_date:
-                query += " AND date(deadline) <= date(?)"
+                conditions.append("date(deadline) <= date(?)")
                 params.append(end_date)
             
-            cursor = self.execute_query(query, params)
+            cursor = self.execute_query(STATEMENTS.compose('projects.search', conditions), params)
             
             projects = []
             for row in cursor.fetchall():
@@ -209,6 +252,47 @@ class ProjectService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при поиске проектов: {str(e)}")
     
+    def search_projects_ranked(self, text, limit=50):
+        """
+        Полнотекстовый поиск проектов по названию и клиенту с ранжированием
+
+        Returns:
+            list: Проекты от наиболее релевантного; у каждого задан атрибут rank
+        """
+        try:
+            match = self.fts_query(text)
+            if not match:
+                return []
+
+            cursor = self.execute_query("""
+                SELECT p.id, p.name, p.client, p.deadline, p.budget, p.created_at,
+                       bm25(projects_fts, 2.0, 1.0) as score
+                FROM projects_fts
+                JOIN projects p ON p.id = projects_fts.rowid
+                WHERE projects_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            """, [match, limit])
+
+            projects = []
+            for row in cursor.fetchall():
+                project = Project(
+                    id=row[0],
+                    name=row[1],
+                    client=row[2],
+                    deadline=row[3],
+                    budget=row[4],
+                    created_at=row[5]
+                )
+                project.rank = row[6]
+                projects.append(project)
+
+            return projects
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при поиске проектов: {str(e)}")
+
     def get_project_progress(self, project_id):
         """
         Получает прогресс проекта
@@ -235,18 +319,18 @@ class ProjectService(BaseService):
             if not project:
                 raise BusinessException(f"Проект с ID {project_id} не найден")
             
-            # Получение задач проекта
-            tasks = project.get_tasks()
-            
-            total_cost = 0
-            for task in tasks:
-                developer = task.get_developer()
-                if developer:
-                    total_cost += task.hours_worked * developer.hourly_rate
+            # Агрегаты поддерживаются триггерами в project_stats (database/stats.sql)
+            cursor = self.execute_query(
+                "SELECT total_hours, labor_cost FROM project_stats WHERE project_id = ?",
+                [project_id]
+            )
+            row = cursor.fetchone()
+            total_hours = row[0] if row else 0
+            total_cost = row[1] if row else 0
             
             return {
                 'project': project,
-                'total_hours': sum(task.hours_worked for task in tasks),
+                'total_hours': total_hours,
                 'total_cost': total_cost,
                 'budget': project.budget,
                 'budget_remaining': project.budget - total_cost if project.budget else None
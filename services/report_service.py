@@ -1,3 +1,6 @@
+import json
+import sqlite3
+
 from services.base_service import BaseService
 from exceptions import BusinessException, ValidationException, DatabaseException
 from datetime import datetime, timedelta
@@ -5,11 +8,112 @@ from datetime import datetime, timedelta
 class ReportService(BaseService):
     """
     Сервис для генерации отчетов
+
+    Готовые отчеты кэшируются в DBManager.report_cache по типу отчета,
+    нормализованным параметрам и версиям таблиц, от которых отчет зависит
+    (счетчики table_versions из database/report_cache.sql). Пока данные
+    не менялись, повторный запрос отчета не обращается к таблицам.
+    Отчеты за прошедшие месяцы дополнительно сохраняются в таблице
+    report_cache и переживают перезапуск приложения.
     """
+    # Таблицы, изменения которых меняют отчет
+    REPORT_TABLES = {
+        'overdue_tasks': ('tasks', 'projects', 'developers'),
+        'developer_workload': ('tasks', 'developers'),
+        'project_status': ('tasks', 'projects', 'developers'),
+        'monthly_revenue': ('tasks', 'projects', 'developers'),
+    }
+    # Сколько отчетов хранится в таблице report_cache
+    MAX_SAVED_REPORTS = 200
+
+    def _table_versions(self, tables):
+        """
+        Версии таблиц или None, если счетчики недоступны (кэш не используется)
+        """
+        with self.db_manager.connection() as conn:
+            # Внутри транзакции версии могут откатиться вместе с данными
+            if conn.in_transaction:
+                return None
+            try:
+                versions = dict(conn.execute("SELECT name, version FROM table_versions").fetchall())
+            except sqlite3.OperationalError:
+                return None
+        return tuple(versions.get(table, 0) for table in tables)
+
+    def _cached_report(self, report_type, params, build, persist=False):
+        """
+        Отчет из кэша или построенный функцией build
+
+        Args:
+            report_type: Тип отчета (ключ REPORT_TABLES)
+            params: Нормализованные параметры отчета (кортеж)
+            build: Функция построения отчета
+            persist: Сохранять отчет в таблице report_cache (прошедшие периоды)
+        """
+        versions = self._table_versions(self.REPORT_TABLES[report_type])
+        if versions is None:
+            return build()
+
+        cache = self.db_manager.report_cache
+        key = (report_type, params)
+        report = cache.get(key, versions)
+        if report is not None:
+            return report
+
+        report = self._load_saved_report(report_type, params, versions) if persist else None
+        if report is None:
+            report = build()
+            if persist:
+                self._save_report(report_type, params, versions, report)
+        cache.put(key, versions, report)
+        return report
+
+    def _load_saved_report(self, report_type, params, versions):
+        try:
+            row = self.db_manager.query_one(
+                "SELECT versions, payload FROM report_cache WHERE report_type = ? AND params = ?",
+                (report_type, json.dumps(params))
+            )
+        except sqlite3.Error:
+            return None
+        if row is None or json.loads(row['versions']) != list(versions):
+            return None
+        return json.loads(row['payload'])
+
+    def _save_report(self, report_type, params, versions, report):
+        # Сохранение — только ускорение: ошибка записи не мешает отчету
+        try:
+            with self.db_manager.connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO report_cache (report_type, params, versions, payload) VALUES (?, ?, ?, ?)",
+                    (report_type, json.dumps(params), json.dumps(list(versions)),
+                     json.dumps(report, ensure_ascii=False, default=str))
+                )
+                conn.execute(
+                    "DELETE FROM report_cache WHERE rowid NOT IN "
+                    "(SELECT rowid FROM report_cache ORDER BY created_at DESC, rowid DESC LIMIT ?)",
+                    (self.MAX_SAVED_REPORTS,)
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _is_past_period(end_date):
+        """
+        Период целиком до начала текущего месяца
+        """
+        month_start = datetime.now().replace(day=1).strftime('%Y-%m-%d')
+        return str(end_date)[:10] < month_start
+
     def get_overdue_tasks_report(self):
         """
         Отчет по просроченным задачам
         """
+        today = datetime.now().strftime('%Y-%m-%d')
+        return self._cached_report('overdue_tasks', (today,), self._build_overdue_tasks_report)
+
+    def _build_overdue_tasks_report(self):
         try:
             query = """
                 SELECT t.id, t.description, t.status, t.hours_worked, 
@@ -54,28 +158,38 @@ class ReportService(BaseService):
         """
         Отчет по загрузке разработчиков
         """
+        if not start_date:
+            # По умолчанию - начало текущего месяца
+            today = datetime.now()
+            start_date = datetime(today.year, today.month, 1).strftime('%Y-%m-%d')
+
+        if not end_date:
+            # По умолчанию - сегодня
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        start_date, end_date = str(start_date).strip(), str(end_date).strip()
+        return self._cached_report(
+            'developer_workload', (start_date, end_date),
+            lambda: self._build_developer_workload_report(start_date, end_date),
+            persist=self._is_past_period(end_date)
+        )
+
+    def _build_developer_workload_report(self, start_date, end_date):
         try:
-            if not start_date:
-                # По умолчанию - начало текущего месяца
-                today = datetime.now()
-                start_date = datetime(today.year, today.month, 1).strftime('%Y-%m-%d')
-            
-            if not end_date:
-                # По умолчанию - сегодня
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            
             query = """
                 SELECT d.id, d.full_name, d.position, d.hourly_rate,
                        COUNT(t.id) as task_count,
                        SUM(t.hours_worked) as total_hours,
                        SUM(t.hours_worked * d.hourly_rate) as total_cost
                 FROM developers d
-                LEFT JOIN tasks t ON d.id = t.developer_id
-                WHERE (t.created_at IS NULL OR (date(t.created_at) >= date(?) AND date(t.created_at) <= date(?)))
+                LEFT JOIN tasks t ON t.developer_id = d.id
+                    AND t.created_at >= ? AND t.created_at < ?
                 GROUP BY d.id
                 ORDER BY total_hours DESC
             """
-            cursor = self.execute_query(query, [start_date, end_date])
+            # Период проверяется в условии соединения: задачи каждого разработчика
+            # читаются диапазоном из idx_tasks_developer_period
+            cursor = self.execute_query(query, list(self.day_range(start_date, end_date)))
             
             developers = []
             for row in cursor.fetchall():
@@ -109,17 +223,19 @@ class ReportService(BaseService):
         """
         Отчет по статусу проектов
         """
+        # Просрочка и остаток дней считаются от текущей даты
+        today = datetime.now().strftime('%Y-%m-%d')
+        return self._cached_report('project_status', (today,), self._build_project_status_report)
+
+    def _build_project_status_report(self):
         try:
+            # Агрегаты поддерживаются триггерами в project_stats (database/stats.sql)
             query = """
                 SELECT p.id, p.name, p.client, p.deadline, p.budget,
-                       COUNT(t.id) as total_tasks,
-                       SUM(CASE WHEN t.status = 'завершено' THEN 1 ELSE 0 END) as completed_tasks,
-                       SUM(t.hours_worked) as total_hours,
-                       SUM(t.hours_worked * d.hourly_rate) as total_cost
+                       s.total_tasks, s.completed_tasks, s.total_hours,
+                       s.labor_cost as total_cost
                 FROM projects p
-                LEFT JOIN tasks t ON p.id = t.project_id
-                LEFT JOIN developers d ON t.developer_id = d.id
-                GROUP BY p.id
+                LEFT JOIN project_stats s ON s.project_id = p.id
                 ORDER BY p.deadline ASC
             """
             cursor = self.execute_query(query)
@@ -166,35 +282,47 @@ class ReportService(BaseService):
         """
         Отчет по доходам за месяц
         """
+        if not year or not month:
+            today = datetime.now()
+            year = year or today.year
+            month = month or today.month
+
+        year, month = int(year), int(month)
+        today = datetime.now()
+        return self._cached_report(
+            'monthly_revenue', (year, month),
+            lambda: self._build_monthly_revenue_report(year, month),
+            persist=(year, month) < (today.year, today.month)
+        )
+
+    def _build_monthly_revenue_report(self, year, month):
         try:
-            if not year or not month:
-                today = datetime.now()
-                year = year or today.year
-                month = month or today.month
-            
             # Первый день месяца
             start_date = datetime(year, month, 1).strftime('%Y-%m-%d')
             
-            # Последний день месяца
+            # Первый день следующего месяца — граница не включается
             if month == 12:
-                end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
+                next_month = datetime(year + 1, 1, 1)
             else:
-                end_date = datetime(year, month + 1, 1) - timedelta(days=1)
-            end_date = end_date.strftime('%Y-%m-%d')
+                next_month = datetime(year, month + 1, 1)
+
+            # Последний день месяца
+            end_date = (next_month - timedelta(days=1)).strftime('%Y-%m-%d')
             
+            # Задачи месяца читаются диапазоном по idx_tasks_period
             query = """
                 SELECT p.id, p.name, p.client, p.budget,
                        COUNT(t.id) as task_count,
                        SUM(t.hours_worked) as total_hours,
                        SUM(t.hours_worked * d.hourly_rate) as total_cost
-                FROM projects p
-                LEFT JOIN tasks t ON p.id = t.project_id
+                FROM tasks t
+                JOIN projects p ON p.id = t.project_id
                 LEFT JOIN developers d ON t.developer_id = d.id
-                WHERE date(t.created_at) >= date(?) AND date(t.created_at) <= date(?)
+                WHERE t.created_at >= ? AND t.created_at < ?
                 GROUP BY p.id
                 ORDER BY total_cost DESC
             """
-            cursor = self.execute_query(query, [start_date, end_date])
+            cursor = self.execute_query(query, [start_date, next_month.strftime('%Y-%m-%d')])
             
             projects = []
             for row in cursor.fetchall():
@@ -227,3 +355,18 @@ class ReportService(BaseService):
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
             raise BusinessException(f"Ошибка при генерации отчета по доходам за месяц: {str(e)}")
+
+    def rebuild_summary_stats(self):
+        """
+        Пересчитывает сводные таблицы статистики с нуля
+
+        Нужен только после правок базы в обход триггеров.
+        """
+        try:
+            from paths import STATS_SQL_PATH
+            self.db_manager.run_script(STATS_SQL_PATH)
+            # Правки в обход триггеров не меняют версии таблиц
+            self.db_manager.report_cache.clear()
+            return True
+        except Exception as e:
+            raise DatabaseException("Ошибка при пересчете сводной статистики", e)
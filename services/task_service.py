@@ -1,5 +1,7 @@
 from services.base_service import BaseService
-from models import Task, Developer, Project
+from services.batch_loader import BatchLoader
+from models import Task, TaskRow, TaskRows
+from models.statements import STATEMENTS
 from validation import TaskValidator
 from exceptions import BusinessException, ValidationException, DatabaseException
 
@@ -10,62 +12,56 @@ class TaskService(BaseService):
     def get_all_tasks(self):
         """
         Получает список всех задач
+
+        Returns:
+            list: Строки TaskRow (только для чтения, с названием проекта и именем
+            разработчика); для редактирования — TaskRow.to_task()
         """
         try:
-            query = """
-                SELECT t.id, t.project_id, t.developer_id, t.description, t.status, 
-                       t.hours_worked, t.created_at, t.updated_at,
-                       p.name as project_name, d.full_name as developer_name
-                FROM tasks t
-                LEFT JOIN projects p ON t.project_id = p.id
-                LEFT JOIN developers d ON t.developer_id = d.id
-            """
-            cursor = self.execute_query(query)
-            
-            tasks = []
-            for row in cursor.fetchall():
-                task = Task(
-                    id=row[0],
-                    project_id=row[1],
-                    developer_id=row[2],
-                    description=row[3],
-                    status=row[4],
-                    hours_worked=row[5],
-                    created_at=row[6],
-                    updated_at=row[7]
-                )
-                # Добавляем дополнительную информацию
-                task.project_name = row[8]
-                task.developer_name = row[9]
-                tasks.append(task)
-            
-            return tasks
+            cursor = self.execute_query(STATEMENTS['tasks.listing'])
+            return [TaskRow._make(row) for row in cursor]
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
             raise BusinessException(f"Ошибка при получении списка задач: {str(e)}")
 
-    def get_task_by_id(self, task_id):
+    def get_task_by_id(self, task_id, loader=None):
         """
         Получает задачу по ID
+
+        Args:
+            task_id: ID задачи
+            loader: Карта идентичности запроса (BatchLoader)
         """
         try:
-            task = Task.get_by_id(task_id)
-            if task:
-                # Добавляем дополнительную информацию напрямую
-                from models.project import Project
-                from models.developer import Developer
+            tasks = self.get_tasks_by_ids([task_id], loader)
+            return tasks[0] if tasks else None
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при получении задачи: {str(e)}")
 
-                project = Project.get_by_id(task.project_id) if task.project_id else None
-                developer = Developer.get_by_id(task.developer_id) if task.developer_id else None
+    def get_tasks_by_ids(self, task_ids, loader=None):
+        """
+        Получает задачи по списку ID вместе с названиями проектов и именами разработчиков
 
-                task.project_name = project.name if project else None
-                task.developer_name = developer.full_name if developer else None
-            return task
+        Проекты и разработчики подгружаются одним запросом IN (...) на пачку,
+        а не отдельным запросом на каждую задачу.
+
+        Args:
+            task_ids: Список ID задач
+            loader: Карта идентичности запроса (BatchLoader)
+
+        Returns:
+            list: Список найденных задач
+        """
+        try:
+            loader = loader or BatchLoader(self.db_manager)
+            return loader.get_tasks(list(task_ids))
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
-            raise BusinessException(f"Ошибка при получении задачи: {str(e)}")
+            raise BusinessException(f"Ошибка при получении задач: {str(e)}")
 
     def create_task(self, data):
         """
@@ -74,25 +70,19 @@ class TaskService(BaseService):
         try:
             # Валидация данных
             validated_data = TaskValidator.validate(data)
+            loader = BatchLoader(self.db_manager)
         
             # Проверка существования проекта
-            project = Project.get_by_id(validated_data['project_id'])
-            if not project:
+            if not loader.exists('projects', validated_data['project_id']):
                 raise BusinessException(f"Проект с ID {validated_data['project_id']} не найден")
         
             # Проверка существования разработчика, если указан
             if validated_data.get('developer_id'):
-                developer = Developer.get_by_id(validated_data['developer_id'])
-                if not developer:
+                if not loader.exists('developers', validated_data['developer_id']):
                     raise BusinessException(f"Разработчик с ID {validated_data['developer_id']} не найден")
         
             # Проверка на дубликаты по проекту, разработчику и описанию
-            query = """
-                SELECT id FROM tasks 
-                WHERE project_id = ? AND description = ? 
-                AND (developer_id = ? OR (developer_id IS NULL AND ? IS NULL))
-            """
-            cursor = self.execute_query(query, [
+            cursor = self.execute_query(STATEMENTS['tasks.find_duplicate'], [
                 validated_data['project_id'], 
                 validated_data['description'],
                 validated_data.get('developer_id'),
@@ -103,7 +93,7 @@ class TaskService(BaseService):
             if existing_task:
                 # Если задача с такими параметрами уже существует, обновляем её
                 task_id = existing_task[0]
-                task = Task.get_by_id(task_id)
+                task = self.get_task_by_id(task_id, loader)
             
                 # Обновляем только те поля, которые предоставлены
                 if 'status' in validated_data:
@@ -126,6 +116,7 @@ class TaskService(BaseService):
                     status=validated_data.get('status', 'новая'),
                     hours_worked=validated_data.get('hours_worked', 0),
                     db_manager=self.db_manager,
+                    loader=loader
                 )
             
                 # Сохранение в базу данных
@@ -160,15 +151,13 @@ class TaskService(BaseService):
             
             # Проверка существования проекта
             if 'project_id' in data and data['project_id'] != task.project_id:
-                project = Project.get_by_id(validated_data['project_id'])
-                if not project:
+                if not task.loader.exists('projects', validated_data['project_id']):
                     raise BusinessException(f"Проект с ID {validated_data['project_id']} не найден")
             
             # Проверка существования разработчика, если указан
             if 'developer_id' in data and data['developer_id'] != task.developer_id:
                 if validated_data.get('developer_id'):
-                    developer = Developer.get_by_id(validated_data['developer_id'])
-                    if not developer:
+                    if not task.loader.exists('developers', validated_data['developer_id']):
                         raise BusinessException(f"Разработчик с ID {validated_data['developer_id']} не найден")
             
             # Обновление полей
@@ -221,8 +210,7 @@ class TaskService(BaseService):
                 raise BusinessException(f"Задача с ID {task_id} не найдена")
             
             # Проверка существования разработчика
-            developer = Developer.get_by_id(developer_id)
-            if not developer:
+            if not task.loader.exists('developers', developer_id):
                 raise BusinessException(f"Разработчик с ID {developer_id} не найден")
             
             # Назначение задачи
@@ -301,59 +289,467 @@ class TaskService(BaseService):
                 raise e
             raise BusinessException(f"Ошибка при обновлении часов задачи: {str(e)}")
     
+    # Размер страницы по умолчанию (совпадает с настройкой rows_per_page)
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 1000
+
+    @staticmethod
+    def _search_conditions(search_term=None, project_id=None, developer_id=None, status=None, fts=False):
+        conditions = []
+        params = []
+
+        if search_term and fts:
+            # Поиск по полнотекстовому индексу tasks_fts вместо сканирования таблицы
+            conditions.append("t.id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)")
+            params.append(BaseService.fts_query(search_term) or '""')
+        elif search_term:
+            conditions.append("t.description LIKE ?")
+            params.append(f"%{search_term}%")
+
+        if project_id:
+            conditions.append("t.project_id = ?")
+            params.append(project_id)
+
+        if developer_id:
+            conditions.append("t.developer_id = ?")
+            params.append(developer_id)
+
+        if status:
+            conditions.append("t.status = ?")
+            params.append(status)
+
+        return conditions, params
+
     def search_tasks(self, search_term=None, project_id=None, developer_id=None, status=None):
         """
         Поиск задач по описанию, проекту, разработчику и/или статусу
         """
         try:
-            query = """
-                SELECT t.id, t.project_id, t.developer_id, t.description, t.status, 
-                       t.hours_worked, t.created_at, t.updated_at,
-                       p.name as project_name, d.full_name as developer_name
-                FROM tasks t
-                LEFT JOIN projects p ON t.project_id = p.id
-                LEFT JOIN developers d ON t.developer_id = d.id
-                WHERE 1=1
-            """
-            params = []
-            
-            if search_term:
-                query += " AND t.description LIKE ?"
-                params.append(f"%{search_term}%")
-            
-            if project_id:
-                query += " AND t.project_id = ?"
-                params.append(project_id)
-            
-            if developer_id:
-                query += " AND t.developer_id = ?"
-                params.append(developer_id)
-            
-            if status:
-                query += " AND t.status = ?"
-                params.append(status)
-            
-            cursor = self.execute_query(query, params)
-            
+            conditions, params = self._search_conditions(search_term, project_id, developer_id, status)
+            cursor = self.execute_query(STATEMENTS.compose('tasks.listing', conditions), params)
+            return [TaskRow._make(row) for row in cursor]
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при поиске задач: {str(e)}")
+
+    def get_task_rows(self, search_term=None, project_id=None, developer_id=None, status=None):
+        """
+        Список задач в столбцовом хранилище для больших выборок
+
+        Строки читаются из курсора по одной и сразу раскладываются по столбцам,
+        поэтому в памяти не держатся ни объекты задач, ни промежуточный список.
+
+        Returns:
+            TaskRows: Задачи в порядке ID; обращение по индексу дает TaskRow
+        """
+        try:
+            conditions, params = self._search_conditions(search_term, project_id, developer_id, status)
+            cursor = self.execute_query(STATEMENTS.compose('tasks.listing', conditions, "ORDER BY t.id"), params)
+            return TaskRows(cursor)
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при получении списка задач: {str(e)}")
+
+    def iter_tasks(self, search_term=None, project_id=None, developer_id=None, status=None, batch_size=None):
+        """
+        Генератор строк списка задач прямо из курсора (для экспорта)
+
+        Yields:
+            TaskRow: Задачи в порядке ID
+        """
+        try:
+            conditions, params = self._search_conditions(search_term, project_id, developer_id, status)
+            rows = self.iter_query(STATEMENTS.compose('tasks.listing', conditions, "ORDER BY t.id"), params, batch_size)
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при получении списка задач: {str(e)}")
+        return map(TaskRow._make, rows)
+
+    def search_tasks_page(self, search_term=None, project_id=None, developer_id=None, status=None,
+                          limit=None, cursor=None):
+        """
+        Постраничный поиск задач, от недавно измененных к старым
+
+        Страницы строятся по ключу (updated_at, id), а не через OFFSET,
+        поэтому каждая следующая страница читается по индексу
+        idx_tasks_updated_at с того места, где закончилась предыдущая.
+
+        Args:
+            search_term: Подстрока описания
+            project_id: ID проекта
+            developer_id: ID разработчика
+            status: Статус задачи
+            limit: Размер страницы
+            cursor: Курсор (updated_at, id) из предыдущей страницы (None — первая страница)
+
+        Returns:
+            dict: tasks — задачи страницы, next_cursor — курсор следующей страницы
+            (None, если страница последняя)
+        """
+        try:
+            limit = self.DEFAULT_PAGE_SIZE if limit is None else int(limit)
+            if limit <= 0 or limit > self.MAX_PAGE_SIZE:
+                raise ValidationException(
+                    f"Размер страницы должен быть от 1 до {self.MAX_PAGE_SIZE}", 'limit'
+                )
+
+            conditions, params = self._search_conditions(
+                search_term, project_id, developer_id, status, fts=True
+            )
+            if cursor:
+                updated_at, last_id = cursor
+                conditions.append("(t.updated_at, t.id) < (?, ?)")
+                params.extend([updated_at, last_id])
+
+            # Лишняя строка показывает, есть ли следующая страница
+            query = STATEMENTS.compose(
+                'tasks.listing', conditions, "ORDER BY t.updated_at DESC, t.id DESC LIMIT ?"
+            )
+            params.append(limit + 1)
+
+            rows = self.execute_query(query, params).fetchall()
+            tasks = [TaskRow._make(row) for row in rows[:limit]]
+            next_cursor = None
+            if len(rows) > limit:
+                last = tasks[-1]
+                next_cursor = (last.updated_at, last.id)
+
+            return {'tasks': tasks, 'next_cursor': next_cursor}
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при поиске задач: {str(e)}")
+
+    def search_tasks_ranked(self, text, project_id=None, developer_id=None, status=None, limit=50):
+        """
+        Полнотекстовый поиск задач с ранжированием по релевантности
+
+        Ищет по описанию задачи, названию проекта и имени разработчика
+        (слова по префиксу). Совпадения в описании весят больше.
+
+        Args:
+            text: Строка поиска
+            project_id: ID проекта
+            developer_id: ID разработчика
+            status: Статус задачи
+            limit: Максимальное количество результатов
+
+        Returns:
+            list: Задачи от наиболее релевантной; у каждой задан атрибут rank
+        """
+        try:
+            match = self.fts_query(text)
+            if not match:
+                return []
+
+            conditions, params = self._search_conditions(None, project_id, developer_id, status)
+            query = STATEMENTS.compose('tasks.ranked', conditions, "ORDER BY score LIMIT ?")
+
+            cursor = self.execute_query(query, [match] + params + [limit])
             tasks = []
             for row in cursor.fetchall():
-                task = Task(
-                    id=row[0],
-                    project_id=row[1],
-                    developer_id=row[2],
-                    description=row[3],
-                    status=row[4],
-                    hours_worked=row[5],
-                    created_at=row[6],
-                    updated_at=row[7]
-                )
-                # Добавляем дополнительную информацию
-                task.project_name = row[8]
-                task.developer_name = row[9]
+                task = TaskRow._make(row[:10]).to_task(self.db_manager)
+                task.rank = row[10]
                 tasks.append(task)
-            
             return tasks
         except Exception as e:
             if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
                 raise e
             raise BusinessException(f"Ошибка при поиске задач: {str(e)}")
+
+    @staticmethod
+    def _bulk_result(index, task_id=None, error=None):
+        return {
+            'index': index,
+            'task_id': task_id,
+            'success': error is None,
+            'error': error
+        }
+
+    def _run_bulk_write(self, query, params_list):
+        """
+        Выполняет пакетную запись одной транзакцией
+        """
+        try:
+            self.begin_write()
+            self.db_manager.execute_many(query, params_list)
+            self.commit()
+        except Exception as e:
+            self.rollback()
+            raise BusinessException(f"Ошибка при пакетной записи задач: {str(e)}")
+
+    def _get_project_costs(self, project_ids):
+        """
+        Текущие трудозатраты по проектам, как их считает триггер check_project_budget
+        """
+        project_ids = list(project_ids)
+        costs = {}
+        for start in range(0, len(project_ids), BatchLoader.CHUNK_SIZE):
+            chunk = project_ids[start:start + BatchLoader.CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = self.execute_query(f"""
+                SELECT t.project_id, COALESCE(SUM(t.hours_worked * d.hourly_rate), 0)
+                FROM tasks t
+                JOIN developers d ON t.developer_id = d.id
+                WHERE t.project_id IN ({placeholders})
+                GROUP BY t.project_id
+            """, chunk)
+            costs.update({row[0]: row[1] for row in cursor.fetchall()})
+        return costs
+
+    def _get_existing_task_keys(self, project_ids):
+        """
+        Существующие задачи по ключу (проект, разработчик, описание)
+
+        Задачи без разработчика сравниваются по None, как в tasks.find_duplicate
+        и триггере upsert_task (developer_id IS ?).
+
+        Returns:
+            dict: Ключ -> (ID задачи, часы)
+        """
+        project_ids = list(project_ids)
+        keys = {}
+        for start in range(0, len(project_ids), BatchLoader.CHUNK_SIZE):
+            chunk = project_ids[start:start + BatchLoader.CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = self.execute_query(f"""
+                SELECT id, project_id, developer_id, description, hours_worked
+                FROM tasks
+                WHERE project_id IN ({placeholders})
+            """, chunk)
+            for row in cursor.fetchall():
+                keys[(row[1], row[2], row[3])] = (row[0], row[4])
+        return keys
+
+    def bulk_create_tasks(self, items):
+        """
+        Пакетно создает задачи одной транзакцией
+
+        Дубликаты (проект, разработчик, описание) обновляются, как в create_task.
+        Строки, которые превысили бы бюджет проекта (триггер check_project_budget),
+        отклоняются по отдельности, не прерывая остальную пачку.
+
+        Args:
+            items: Список словарей с данными задач
+
+        Returns:
+            list: Результаты по строкам (index, task_id, success, error)
+        """
+        try:
+            results = [None] * len(items)
+            loader = BatchLoader(self.db_manager)
+
+            # Векторная валидация: сначала поля, затем ссылки одним запросом на таблицу
+            validated = []
+            for index, data in enumerate(items):
+                try:
+                    validated.append((index, TaskValidator.validate(dict(data))))
+                except ValidationException as e:
+                    results[index] = self._bulk_result(index, error=str(e))
+
+            loader.load_many('projects', (data['project_id'] for _, data in validated))
+            loader.load_many('developers', (data.get('developer_id') for _, data in validated))
+
+            rows = []
+            for index, data in validated:
+                project_id = int(data['project_id'])
+                developer_id = int(data['developer_id']) if data.get('developer_id') else None
+                if not loader.exists('projects', project_id):
+                    results[index] = self._bulk_result(index, error=f"Проект с ID {project_id} не найден")
+                    continue
+                if developer_id and not loader.exists('developers', developer_id):
+                    results[index] = self._bulk_result(index, error=f"Разработчик с ID {developer_id} не найден")
+                    continue
+                rows.append((index, project_id, developer_id, data['description'],
+                             data.get('status', 'новая'), data.get('hours_worked', 0)))
+
+            project_ids = {row[1] for row in rows}
+            inserts = []
+            updates = []
+            # Блокировка записи берется до чтения дубликатов и трудозатрат:
+            # иначе задача, добавленная другим соединением в промежутке, сдвинет
+            # ID, которые выдаются подряд от last_insert_rowid()
+            self.begin_write()
+            try:
+                existing = self._get_existing_task_keys(project_ids)
+                costs = self._get_project_costs(project_ids)
+
+                pending = {}
+                for index, project_id, developer_id, description, status, hours in rows:
+                    key = (project_id, developer_id, description)
+                    rate = loader.load('developers', developer_id)['hourly_rate'] if developer_id else 0
+                    if key in existing:
+                        # Обновление бюджет не проверяет (триггер срабатывает только
+                        # на INSERT), но меняет трудозатраты для следующих строк
+                        task_id, old_hours = existing[key]
+                        costs[project_id] = costs.get(project_id, 0) + (hours - old_hours) * rate
+                        existing[key] = (task_id, hours)
+                        updates.append((index, task_id, status, hours))
+                        continue
+
+                    # Та же проверка, что в триггере check_project_budget; повтор
+                    # внутри пачки заменяет часы уже добавленной строки
+                    previous_hours = inserts[pending[key]][3] if key in pending else 0
+                    if developer_id:
+                        cost = (hours - previous_hours) * rate
+                        budget = loader.load('projects', project_id)['budget']
+                        if costs.get(project_id, 0) + cost > budget:
+                            results[index] = self._bulk_result(index, error="Превышение бюджета проекта")
+                            continue
+                        costs[project_id] = costs.get(project_id, 0) + cost
+
+                    if key in pending:
+                        inserts[pending[key]] = (inserts[pending[key]][0] + [index], key, status, hours)
+                        continue
+                    pending[key] = len(inserts)
+                    inserts.append(([index], key, status, hours))
+
+                if updates:
+                    self.db_manager.execute_many(
+                        "UPDATE tasks SET status = ?, hours_worked = ? WHERE id = ?",
+                        [(status, hours, task_id) for _, task_id, status, hours in updates]
+                    )
+                if inserts:
+                    self.db_manager.execute_many(
+                        "INSERT INTO tasks (project_id, developer_id, description, status, hours_worked) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [key + (status, hours) for _, key, status, hours in inserts]
+                    )
+                    # Внутри немедленной транзакции AUTOINCREMENT выдает ID подряд
+                    last_id = self.execute_query("SELECT last_insert_rowid()").fetchone()[0]
+                self.commit()
+            except Exception as e:
+                self.rollback()
+                raise BusinessException(f"Ошибка при пакетном создании задач: {str(e)}")
+
+            for index, task_id, _, _ in updates:
+                results[index] = self._bulk_result(index, task_id)
+            first_id = last_id - len(inserts) + 1 if inserts else None
+            for offset, (indexes, _, _, _) in enumerate(inserts):
+                for index in indexes:
+                    results[index] = self._bulk_result(index, first_id + offset)
+
+            return results
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при пакетном создании задач: {str(e)}")
+
+    def _load_bulk_targets(self, task_ids, loader):
+        """
+        Загружает задачи пачки и заполняет результаты для ненайденных
+        """
+        loader.load_many('tasks', task_ids)
+        results = []
+        found = []
+        for index, task_id in enumerate(task_ids):
+            if loader.exists('tasks', task_id):
+                results.append(self._bulk_result(index, task_id))
+                found.append(task_id)
+            else:
+                results.append(self._bulk_result(index, task_id, f"Задача с ID {task_id} не найдена"))
+        return results, found
+
+    def bulk_update_status(self, task_ids, status):
+        """
+        Пакетно обновляет статус задач одной транзакцией
+
+        Args:
+            task_ids: Список ID задач
+            status: Новый статус
+
+        Returns:
+            list: Результаты по строкам (index, task_id, success, error)
+        """
+        try:
+            if status not in Task.VALID_STATUSES:
+                raise ValidationException(
+                    f"Недопустимый статус. Допустимые значения: {', '.join(Task.VALID_STATUSES)}",
+                    'status'
+                )
+
+            task_ids = list(task_ids)
+            results, found = self._load_bulk_targets(task_ids, BatchLoader(self.db_manager))
+            if found:
+                self._run_bulk_write(
+                    "UPDATE tasks SET status = ? WHERE id = ?",
+                    [(status, task_id) for task_id in found]
+                )
+            return results
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при пакетном обновлении статуса задач: {str(e)}")
+
+    def bulk_assign(self, task_ids, developer_id):
+        """
+        Пакетно назначает задачи разработчику одной транзакцией
+
+        Новые задачи, как и в assign_task, переводятся в статус "в работе".
+
+        Args:
+            task_ids: Список ID задач
+            developer_id: ID разработчика
+
+        Returns:
+            list: Результаты по строкам (index, task_id, success, error)
+        """
+        try:
+            loader = BatchLoader(self.db_manager)
+            if not loader.exists('developers', developer_id):
+                raise BusinessException(f"Разработчик с ID {developer_id} не найден")
+
+            task_ids = list(task_ids)
+            results, found = self._load_bulk_targets(task_ids, loader)
+            if found:
+                self._run_bulk_write(
+                    "UPDATE tasks SET developer_id = ?, "
+                    "status = CASE WHEN status = 'новая' THEN 'в работе' ELSE status END "
+                    "WHERE id = ?",
+                    [(developer_id, task_id) for task_id in found]
+                )
+            return results
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при пакетном назначении задач: {str(e)}")
+
+    def bulk_update_hours(self, hours_by_task):
+        """
+        Пакетно обновляет часы задач одной транзакцией
+
+        Args:
+            hours_by_task: Словарь {ID задачи: часы} или список пар (ID задачи, часы)
+
+        Returns:
+            list: Результаты по строкам (index, task_id, success, error)
+        """
+        try:
+            pairs = list(hours_by_task.items()) if isinstance(hours_by_task, dict) else list(hours_by_task)
+            task_ids = [task_id for task_id, _ in pairs]
+            results, _ = self._load_bulk_targets(task_ids, BatchLoader(self.db_manager))
+
+            params = []
+            for index, (task_id, hours) in enumerate(pairs):
+                if not results[index]['success']:
+                    continue
+                try:
+                    hours = float(hours)
+                    if hours < 0:
+                        raise ValueError
+                except (TypeError, ValueError):
+                    error = ValidationException("Часы должны быть положительным числом", 'hours_worked')
+                    results[index] = self._bulk_result(index, task_id, str(error))
+                    continue
+                params.append((hours, task_id))
+
+            if params:
+                self._run_bulk_write("UPDATE tasks SET hours_worked = ? WHERE id = ?", params)
+            return results
+        except Exception as e:
+            if isinstance(e, (BusinessException, ValidationException, DatabaseException)):
+                raise e
+            raise BusinessException(f"Ошибка при пакетном обновлении часов задач: {str(e)}")
@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from paths import STARTUP_TRACE_PATH
+
+
+class StartupTrace:
+    """
+    Трассировка запуска приложения
+
+    Этапы запуска (импорты, проверка схемы, прогрев кэша, создание окон)
+    замеряются блоками span(); mark() отмечает момент без длительности.
+    Время считается от импорта модуля. finish() печатает разбивку в stderr
+    и сохраняет ее в startup_trace.txt. Включается переменной окружения
+    KABAN_STARTUP_TRACE=1; в выключенном состоянии span() ничего не замеряет.
+    Время импорта отдельных модулей показывает python -X importtime main.py.
+    """
+    def __init__(self, enabled=False, log_path=STARTUP_TRACE_PATH):
+        self.enabled = enabled
+        self.log_path = log_path
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # (начало от старта, длительность или None, глубина, имя, поток)
+        self._events = []
+        self._finished = False
+
+    @classmethod
+    def from_environment(cls):
+        return cls(enabled=bool(os.environ.get('KABAN_STARTUP_TRACE')))
+
+    def _now_ms(self):
+        return (time.perf_counter() - self._origin) * 1000
+
+    def _record(self, started, elapsed, name):
+        depth = getattr(self._local, 'depth', 0)
+        thread = threading.current_thread().name
+        with self._lock:
+            self._events.append((started, elapsed, depth, name, thread))
+
+    @contextmanager
+    def span(self, name):
+        """
+        Замеряет блок with как этап запуска; этапы могут быть вложенными
+        """
+        if not self.enabled or self._finished:
+            yield
+            return
+        started = self._now_ms()
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+            self._record(started, self._now_ms() - started, name)
+
+    def mark(self, name):
+        """
+        Отмечает момент запуска (например, показ окна)
+        """
+        if self.enabled and not self._finished:
+            self._record(self._now_ms(), None, name)
+
+    def report(self):
+        """
+        Разбивка запуска по этапам в порядке начала
+
+        Returns:
+            list: Строки отчета
+        """
+        with self._lock:
+            events = sorted(self._events, key=lambda event: (event[0], event[2]))
+        lines = [f"Запуск: {self._now_ms():.1f} мс"]
+        for started, elapsed, depth, name, thread in events:
+            duration = f"{elapsed:9.1f} мс" if elapsed is not None else ' ' * 12
+            place = '' if thread == 'MainThread' else f"  [{thread}]"
+            lines.append(f"{started:9.1f} мс {duration}  {'  ' * depth}{name}{place}")
+        return lines
+
+    def finish(self):
+        """
+        Завершает трассировку: печатает и сохраняет отчет (один раз)
+        """
+        if not self.enabled or self._finished:
+            return
+        self.mark('Запуск завершен')
+        self._finished = True
+        text = '\n'.join(self.report())
+        print(text, file=sys.stderr)
+        if self.log_path:
+            try:
+                with open(self.log_path, 'w', encoding='utf-8') as trace_file:
+                    trace_file.write(text + '\n')
+            except OSError:
+                pass
+
+
+trace = StartupTrace.from_environment()
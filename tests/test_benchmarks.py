@@ -0,0 +1,100 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import generate_database, database_fingerprint
+from benchmarks.runner import compute_stats, compare_results
+from database.migrations import SCHEMA_VERSION, pending_migrations
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Тесты генератора данных и формата результатов бенчмарков
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, seed=7):
+        path = os.path.join(self.temp_dir, name)
+        generate_database(path, tasks=400, seed=seed, anchor_date=date(2025, 6, 1))
+        return path
+
+    def test_generator_is_deterministic(self):
+        """
+        Тест детерминированности генератора
+        """
+        first = self._generate('a.db')
+        second = self._generate('b.db')
+        other = self._generate('c.db', seed=8)
+
+        self.assertEqual(database_fingerprint(first), database_fingerprint(second))
+        self.assertNotEqual(database_fingerprint(first), database_fingerprint(other))
+
+    def test_generated_data_is_consistent(self):
+        """
+        Тест согласованности сгенерированных данных со схемой
+        """
+        conn = sqlite3.connect(self._generate('kaban.db'))
+        try:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 400)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM tasks_fts").fetchone()[0], 400)
+
+            # Трудозатраты ни одного проекта не превышают бюджет
+            over_budget = conn.execute("""
+                SELECT COUNT(*) FROM projects p
+                WHERE p.budget < (
+                    SELECT COALESCE(SUM(t.hours_worked * d.hourly_rate), 0)
+                    FROM tasks t JOIN developers d ON t.developer_id = d.id
+                    WHERE t.project_id = p.id
+                ) - 0.01
+            """).fetchone()[0]
+            self.assertEqual(over_budget, 0)
+
+            # Триггеры схемы восстановлены после загрузки
+            triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+            self.assertIn('check_project_budget', triggers)
+            self.assertIn('fts_task_insert', triggers)
+
+            # Схема та же, что у приложения: миграции не будут применяться повторно
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+            self.assertEqual(pending_migrations(conn), [])
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            self.assertIn('idx_tasks_period', indexes)
+        finally:
+            conn.close()
+
+    def test_compare_results(self):
+        """
+        Тест сравнения результатов двух запусков
+        """
+        baseline = {'benchmarks': [
+            {'name': 'a', 'stats': compute_stats([0.010, 0.010, 0.010])},
+            {'name': 'b', 'stats': compute_stats([0.010, 0.012])},
+        ]}
+        current = {'benchmarks': [
+            {'name': 'a', 'stats': compute_stats([0.015, 0.015, 0.015])},
+            {'name': 'b', 'stats': compute_stats([0.010, 0.012])},
+            {'name': 'c', 'stats': compute_stats([0.001])},
+        ]}
+
+        rows = {row['name']: row for row in compare_results(baseline, current, threshold=0.1)}
+
+        self.assertEqual(set(rows), {'a', 'b'})
+        self.assertTrue(rows['a']['regression'])
+        self.assertAlmostEqual(rows['a']['change'], 0.5)
+        self.assertFalse(rows['b']['regression'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,8 @@ class TestControllers(unittest.TestCase):
         # Инициализируем базу данных
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
+        stats_sql_path = os.path.join(script_dir, 'database', 'stats.sql')
+        search_sql_path = os.path.join(script_dir, 'database', 'search.sql')
         
         with open(sql_path, 'r', encoding='utf-8') as sql_file:
             sql_script = sql_file.read()
@@ -34,6 +36,10 @@ class TestControllers(unittest.TestCase):
         cls.db_manager.conn.executescript(sql_script)
         cls.db_manager.commit()
         
+        # Загружаем сводные таблицы статистики и полнотекстовый поиск
+        cls.db_manager.run_script(stats_sql_path)
+        cls.db_manager.run_script(search_sql_path)
+        
         # Создаем контроллеры с общей тестовой БД
         cls.developer_controller = DeveloperController(DeveloperService(cls.db_manager))
         cls.project_controller = ProjectController(ProjectService(cls.db_manager))
@@ -3,13 +3,21 @@ import os
 import unittest
 import tempfile
 import csv
+import gzip
 import json
+import threading
+import time
 
 # Добавляем родительскую директорию в путь для импорта
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from models import DBManager
 from controllers.export_controller import ExportController
+from services.export_service import ExportService, ExportQuery
 from services.report_service import ReportService
+from services.task_service import TaskService
+from exceptions import ValidationException
+from export_jobs import ExportJob, ExportJobManager
 
 class TestExport(unittest.TestCase):
     """
@@ -130,5 +138,192 @@ class TestExport(unittest.TestCase):
         self.assertEqual(ws.cell(2, 2).value, 'Тест 1')
         self.assertEqual(ws.cell(2, 3).value, 100)
 
+    def test_streaming_excel_export(self):
+        """
+        Тест потокового экспорта в Excel с делением на листы
+        """
+        # Ширина столбцов оценивается по выборке и ограничена сверху
+        widths = ExportService.estimate_column_widths(['id', 'name'], [[1, 'ab'], [22, 'x' * 200, 'c']])
+        self.assertEqual(widths[:2], [(2 + 2) * 1.2, ExportService.MAX_COLUMN_WIDTH])
+        self.assertEqual(len(widths), 3)
+        self.assertEqual(ExportService._sheet_title('Отчет: [итог]', 1), 'Отчет_ _итог_')
+        self.assertEqual(len(ExportService._sheet_title('Очень длинное название листа книги', 12)), 31)
+
+        try:
+            import openpyxl
+        except ImportError:
+            self.skipTest("Библиотека openpyxl не установлена")
+
+        # Строки приходят генератором и не собираются в список
+        rows = ((i, f'Задача {i}') for i in range(1, 6))
+        filename = os.path.join(self.temp_dir, 'test_stream.xlsx')
+        result = ExportService.export_to_excel(rows, filename, 'Задачи', ['id', 'name'], max_rows_per_sheet=2)
+
+        self.assertTrue(result['success'])
+        self.assertEqual((result['rows_count'], result['sheets']), (5, 3))
+
+        wb = openpyxl.load_workbook(filename, read_only=True)
+        self.assertEqual(wb.sheetnames, ['Задачи', 'Задачи (2)', 'Задачи (3)'])
+        values = [list(row) for row in wb['Задачи (3)'].iter_rows(values_only=True)]
+        self.assertEqual(values, [['id', 'name'], [5, 'Задача 5']])
+        wb.close()
+
+
+class TestQueryExport(unittest.TestCase):
+    """
+    Тесты потокового экспорта из базы по описанию выгрузки
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Настройка перед всеми тестами
+        """
+        cls.db_manager = DBManager(':memory:')
+
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
+
+        with open(sql_path, 'r', encoding='utf-8') as sql_file:
+            sql_script = sql_file.read()
+
+        cls.db_manager.connect()
+        cls.db_manager.conn.executescript(sql_script)
+        cls.db_manager.commit()
+
+        cls.export_controller = ExportController(ExportService(cls.db_manager))
+        cls.task_service = TaskService(cls.db_manager)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Очистка после всех тестов
+        """
+        cls.db_manager.close()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for file in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, file))
+        os.rmdir(self.temp_dir)
+
+    def test_query_to_csv(self):
+        """
+        Тест выгрузки задач из курсора в CSV и CSV.gz
+        """
+        status = self.task_service.get_task_rows()[0].status
+        tasks = self.task_service.get_task_rows(status=status)
+
+        progress = []
+        filename = os.path.join(self.temp_dir, 'tasks.csv.gz')
+        result = self.export_controller.export_query_to_csv(
+            'tasks', {'status': status, 'project_id': None}, filename, progress=progress.append
+        )
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data']['rows_count'], len(tasks))
+        self.assertEqual(progress[-1], len(tasks))
+        self.assertFalse(os.path.exists(filename + '.part'))
+
+        with gzip.open(filename, 'rt', newline='', encoding='utf-8') as csvfile:
+            rows = list(csv.reader(csvfile))
+        self.assertEqual(rows[0], ExportService.QUERY_EXPORTS['tasks'][0])
+        self.assertEqual([int(row[0]) for row in rows[1:]], [task.id for task in tasks])
+        self.assertTrue(all(row[4] == status for row in rows[1:]))
+
+        # Пачки фиксированного размера: прогресс сообщается после каждой
+        progress = []
+        filename = os.path.join(self.temp_dir, 'developers.csv')
+        result = ExportService.export_to_csv(
+            ExportService(self.db_manager).query_rows(ExportQuery('developers'))[2],
+            filename, ['ID'], batch_size=2, progress=progress.append
+        )
+        developers = self.db_manager.query_one("SELECT COUNT(*) AS count FROM developers")['count']
+        self.assertEqual(result['rows_count'], developers)
+        self.assertEqual(progress, [min(n, developers) for n in range(2, developers + 2, 2)])
+
+    def test_query_spec(self):
+        """
+        Тест описания выгрузки
+        """
+        self.assertEqual(
+            ExportQuery('tasks', status='новая', project_id=None, search_term=''),
+            ExportQuery('tasks', status='новая')
+        )
+        self.assertNotEqual(ExportQuery('tasks'), ExportQuery('projects'))
+        with self.assertRaises(ValidationException):
+            ExportQuery('users')
+
+        result = self.export_controller.export_query_to_csv('users', {}, os.path.join(self.temp_dir, 'x.csv'))
+        self.assertFalse(result['success'])
+
+    def test_background_export_jobs(self):
+        """
+        Тест очереди фоновых экспортов: дубликаты, отмена, журнал
+        """
+        manager = ExportJobManager(ExportService(self.db_manager), reports_dir=self.temp_dir, max_workers=1)
+        updates = []
+        manager.add_listener(lambda job: updates.append((job.id, job.status)))
+        try:
+            # Единственный рабочий поток занят, следующие задачи ждут в очереди
+            release = threading.Event()
+
+            def blocking(progress, target):
+                release.wait(5)
+                return {'success': True, 'rows_count': 0}
+
+            blocker = manager._submit(('block',), 'Блокировка', 'csv', None, blocking)
+
+            first_file = os.path.join(self.temp_dir, 'developers_1.csv')
+            second_file = os.path.join(self.temp_dir, 'developers_2.csv')
+            first = manager.submit_query('developers', {}, 'csv', first_file)
+            # Такая же выгрузка не запускается повторно, файл будет скопирован
+            second = manager.submit_query('developers', {'position': None}, 'csv', second_file)
+            self.assertIs(second, first)
+            self.assertEqual(first.targets, [second_file])
+
+            queued = manager.submit_query('projects', {}, 'csv', os.path.join(self.temp_dir, 'projects.csv'))
+            self.assertTrue(manager.cancel(queued.id))
+            self.assertEqual(queued.status, ExportJob.CANCELLED)
+            self.assertEqual(len(manager.jobs(active_only=True)), 2)
+
+            release.set()
+            self.assertTrue(first.wait(5))
+            self.assertEqual(blocker.status, ExportJob.DONE)
+            self.assertEqual(first.status, ExportJob.DONE)
+            developers = self.db_manager.query_one("SELECT COUNT(*) AS count FROM developers")['count']
+            self.assertEqual(first.rows, developers)
+            with open(first_file, encoding='utf-8') as f1, open(second_file, encoding='utf-8') as f2:
+                self.assertEqual(f1.read(), f2.read())
+            self.assertFalse(os.path.exists(queued.filename))
+            self.assertIn((first.id, ExportJob.RUNNING), updates)
+
+            # Идущая задача прерывается на ближайшей пачке строк
+            started = threading.Event()
+
+            def endless(progress, target):
+                started.set()
+                while True:
+                    progress(1)
+                    time.sleep(0.01)
+
+            running = manager._submit(('endless',), 'Бесконечная', 'csv', None, endless)
+            self.assertTrue(started.wait(5))
+            manager.cancel(running.id)
+            self.assertTrue(running.wait(5))
+            self.assertEqual(running.status, ExportJob.CANCELLED)
+
+            # После завершения та же выгрузка запускается заново
+            self.assertIsNot(manager.submit_query('developers', {}, 'csv', first_file), first)
+
+            history = manager.history()
+            self.assertIn(running.id, [entry['id'] for entry in history])
+            self.assertEqual(
+                {entry['id']: entry['status'] for entry in history if entry['id'] in (first.id, queued.id)},
+                {first.id: ExportJob.DONE, queued.id: ExportJob.CANCELLED}
+            )
+        finally:
+            manager.shutdown(wait=True)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,179 @@
+import sys
+import os
+import unittest
+import tempfile
+import csv
+from unittest import mock
+from datetime import datetime, timedelta
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import DBManager
+from services import ImportService
+from controllers import ImportController
+from exceptions import DatabaseException
+
+class TestImport(unittest.TestCase):
+    """
+    Тесты для потокового импорта из CSV
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Настройка перед всеми тестами
+        """
+        # Используем временную базу данных для тестов
+        cls.db_manager = DBManager(':memory:')
+
+        # Инициализируем базу данных
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
+
+        with open(sql_path, 'r', encoding='utf-8') as sql_file:
+            sql_script = sql_file.read()
+
+        cls.db_manager.connect()
+        cls.db_manager.conn.executescript(sql_script)
+        cls.db_manager.commit()
+
+        cls.import_service = ImportService(cls.db_manager)
+        cls.import_controller = ImportController(cls.import_service)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Очистка после всех тестов
+        """
+        cls.db_manager.close()
+
+    def setUp(self):
+        """
+        Настройка перед каждым тестом
+        """
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Очистка после каждого теста
+        """
+        for file in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, file))
+        os.rmdir(self.temp_dir)
+
+    def _write_csv(self, name, rows):
+        filename = os.path.join(self.temp_dir, name)
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            csv.writer(csvfile).writerows(rows)
+        return filename
+
+    def _count(self, table):
+        return self.db_manager.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_import_projects_and_tasks(self):
+        """
+        Тест импорта проектов и задач с разрешением имен
+        """
+        deadline = (datetime.now() + timedelta(days=60)).strftime('%d.%m.%Y')
+        projects_file = self._write_csv('projects.csv', [
+            ['ID', 'Название', 'Клиент', 'Срок сдачи', 'Бюджет', 'Статус'],
+            ['1', 'Импортный проект', 'Импортный клиент', deadline, '100000', 'в работе'],
+            ['2', '', 'Без названия', deadline, '1000', 'в работе']
+        ])
+        result = self.import_service.import_projects(projects_file)
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(result['errors'][0]['line'], 3)
+
+        tasks_file = self._write_csv('tasks.csv', [
+            ['ID', 'Проект', 'Разработчик', 'Описание', 'Статус', 'Часы']
+        ] + [
+            [str(i), 'Импортный проект', 'Иванов Иван Иванович', f'Импортная задача {i}', 'в работе', '2']
+            for i in range(5)
+        ] + [
+            ['6', 'Нет такого проекта', 'Иванов Иван Иванович', 'Потерянная задача', 'в работе', '1']
+        ])
+
+        tasks_before = self._count('tasks')
+        progress = []
+        dry = self.import_service.import_tasks(tasks_file, chunk_size=2, dry_run=True,
+                                               progress_callback=progress.append)
+        self.assertEqual(dry['imported'], 5)
+        self.assertEqual(dry['skipped'], 1)
+        self.assertEqual([p['processed'] for p in progress], [2, 4, 6])
+        self.assertEqual(self._count('tasks'), tasks_before)
+
+        result = self.import_controller.import_tasks_from_csv(tasks_file, chunk_size=2)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data']['imported'], 5)
+        self.assertEqual(self._count('tasks'), tasks_before + 5)
+
+    def test_import_rejects_over_budget_rows(self):
+        """
+        Тест отклонения задач, превышающих бюджет проекта
+        """
+        deadline = (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')
+        self.db_manager.conn.execute(
+            "INSERT INTO projects (name, client, deadline, budget) VALUES (?, ?, ?, ?)",
+            ('Маленький проект', 'Клиент', deadline, 2000)
+        )
+        self.db_manager.commit()
+
+        tasks_file = self._write_csv('tasks.csv', [
+            ['Проект', 'Разработчик', 'Описание', 'Часы'],
+            ['Маленький проект', 'Иванов Иван Иванович', 'Первая', '1'],
+            ['Маленький проект', 'Иванов Иван Иванович', 'Вторая', '1'],
+        ])
+        result = self.import_service.import_tasks(tasks_file)
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['errors'][0]['line'], 3)
+
+    def test_reimport_updates_existing_tasks(self):
+        """
+        Тест повторного импорта: существующие задачи обновляются без проверки бюджета
+        """
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        tasks_file = os.path.join(script_dir, 'tasks.csv')
+
+        self.import_service.import_tasks(tasks_file)
+        tasks_before = self._count('tasks')
+        result = self.import_service.import_tasks(tasks_file, chunk_size=5)
+        self.assertEqual(result['skipped'], 0, result['errors'])
+        self.assertEqual(result['imported'], result['processed'])
+        self.assertEqual(self._count('tasks'), tasks_before)
+
+        # Повтор задачи в маленьком проекте меняет часы, а не добавляет стоимость
+        deadline = (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')
+        self.db_manager.conn.execute(
+            "INSERT INTO projects (name, client, deadline, budget) VALUES (?, ?, ?, ?)",
+            ('Проект повторного импорта', 'Клиент', deadline, 3000)
+        )
+        self.db_manager.commit()
+        small_file = self._write_csv('small.csv', [
+            ['Проект', 'Разработчик', 'Описание', 'Часы'],
+            ['Проект повторного импорта', 'Иванов Иван Иванович', 'Повторная', '1'],
+            ['Проект повторного импорта', 'Иванов Иван Иванович', 'Повторная', '2'],
+        ])
+        self.assertEqual(self.import_service.import_tasks(small_file)['imported'], 2)
+        self.assertEqual(self.import_service.import_tasks(small_file)['skipped'], 0)
+        self.assertEqual([row[0] for row in self.db_manager.conn.execute(
+            "SELECT hours_worked FROM tasks WHERE description = 'Повторная'"
+        )], [2.0])
+    def test_import_requires_write_lock(self):
+        """
+        Тест: пачка без блокировки записи не проверяется и не записывается
+        """
+        tasks_file = self._write_csv('locked.csv', [
+            ['Проект', 'Разработчик', 'Описание', 'Часы'],
+            ['Интернет-магазин', 'Иванов Иван Иванович', 'Без блокировки', '1'],
+        ])
+        tasks_before = self._count('tasks')
+        with mock.patch.object(self.db_manager, 'begin_transaction', return_value=False):
+            with self.assertRaises(DatabaseException):
+                self.import_service.import_tasks(tasks_file)
+            # Пробный запуск ничего не пишет и блокировку не берет
+            self.assertEqual(self.import_service.import_tasks(tasks_file, dry_run=True)['imported'], 1)
+        self.assertEqual(self._count('tasks'), tasks_before)
+
+if __name__ == '__main__':
+    unittest.main()
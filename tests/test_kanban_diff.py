@@ -0,0 +1,56 @@
+import sys
+import os
+import unittest
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import TaskRow
+from ui.kanban_diff import group_by_status, card_signature, diff_column
+
+
+def make_row(task_id, status='новая', description='Задача', hours=0.0):
+    return TaskRow(
+        task_id, 1, 1, description, status, hours,
+        '2024-01-01 10:00:00', '2024-01-01 10:00:00', 'Проект', 'Разработчик'
+    )
+
+
+class TestKanbanDiff(unittest.TestCase):
+    """
+    Тесты сравнения снимков Kanban-доски
+    """
+    STATUSES = ['новая', 'в работе', 'на проверке', 'завершено']
+
+    def test_group_by_status(self):
+        """
+        Тест раскладки задач по колонкам
+        """
+        rows = [make_row(1), make_row(2, 'в работе'), make_row(3, 'Новая'), make_row(4, 'архив')]
+        groups = group_by_status(rows, self.STATUSES)
+        self.assertEqual([row.id for row in groups['новая']], [1, 3])
+        self.assertEqual([row.id for row in groups['в работе']], [2])
+        self.assertEqual(groups['завершено'], [])
+
+    def test_diff_column(self):
+        """
+        Тест сравнения колонки с прошлым снимком
+        """
+        previous = {row.id: card_signature(row) for row in [make_row(1), make_row(2), make_row(3)]}
+        tasks = [make_row(4), make_row(2, hours=3.5), make_row(1)]
+
+        diff = diff_column(previous, tasks)
+        self.assertEqual(diff.added, [4])
+        self.assertEqual(diff.changed, [2])
+        self.assertEqual(diff.removed, [3])
+
+    def test_status_not_in_signature(self):
+        """
+        Тест: смена статуса не меняет содержимое карточки
+        """
+        self.assertEqual(card_signature(make_row(1)), card_signature(make_row(1, 'завершено')))
+        self.assertEqual(diff_column({}, []), ([], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import sys
+import os
+import sqlite3
+import tempfile
+import unittest
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.migrations import MIGRATIONS, SCHEMA_VERSION, Migration, migrate, pending_migrations, schema_version
+from exceptions import DatabaseException
+from models.connection_pool import ConnectionPool
+
+
+class TestMigrations(unittest.TestCase):
+    """
+    Тесты версионных миграций схемы
+    """
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _objects(self, kind):
+        return {row[0] for row in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = ?", (kind,)
+        )}
+
+    def test_new_database(self):
+        """
+        Тест создания новой базы всеми шагами
+        """
+        self.assertEqual(migrate(self.conn), [m.version for m in MIGRATIONS])
+        self.assertEqual(schema_version(self.conn), SCHEMA_VERSION)
+        self.assertTrue({'tasks', 'project_stats', 'tasks_fts', 'table_versions'} <= self._objects('table'))
+        self.assertIn('idx_tasks_developer_period', self._objects('index'))
+
+        # Повторный запуск ничего не применяет
+        self.assertEqual(pending_migrations(self.conn), [])
+        self.assertEqual(migrate(self.conn), [])
+
+    def test_legacy_database(self):
+        """
+        Тест обновления базы, созданной до миграций
+        """
+        with open(MIGRATIONS[0].script_path, 'r', encoding='utf-8') as sql_file:
+            self.conn.executescript(sql_file.read())
+        self.conn.execute("INSERT INTO developers (full_name, position, hourly_rate) VALUES ('Старый Олег', 'QA', 500)")
+        self.conn.commit()
+        self.assertEqual(schema_version(self.conn), 0)
+
+        # Основная схема не пересоздается: данные сохраняются
+        self.assertEqual(migrate(self.conn), [m.version for m in MIGRATIONS[1:]])
+        self.assertEqual(self.conn.execute(
+            "SELECT COUNT(*) FROM developers WHERE full_name = 'Старый Олег'"
+        ).fetchone()[0], 1)
+        self.assertEqual(self.conn.execute(
+            "SELECT COUNT(*) FROM project_stats"
+        ).fetchone()[0], self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0])
+
+    def test_failed_migration(self):
+        """
+        Тест отката шага с ошибкой
+        """
+        migrate(self.conn)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_path = os.path.join(tmp_dir, 'broken.sql')
+            with open(script_path, 'w', encoding='utf-8') as sql_file:
+                sql_file.write("CREATE TABLE migration_probe (id INTEGER);\nSELECT * FROM no_such_table;\n")
+            broken = MIGRATIONS + [Migration(SCHEMA_VERSION + 1, 'Сломанный шаг', script_path)]
+
+            with self.assertRaises(DatabaseException):
+                migrate(self.conn, broken)
+
+        # Шаг откатился целиком, версия не изменилась
+        self.assertEqual(schema_version(self.conn), SCHEMA_VERSION)
+        self.assertNotIn('migration_probe', self._objects('table'))
+        self.assertFalse(self.conn.in_transaction)
+
+    def test_foreign_keys(self):
+        """
+        Тест каскадов внешних ключей в базе после миграций
+        """
+        pool = ConnectionPool(ConnectionPool.MEMORY_PATH)
+        conn = pool.checkout(pin=True)
+        try:
+            migrate(conn)
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+            project_id = conn.execute("SELECT project_id FROM tasks LIMIT 1").fetchone()[0]
+            conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+            conn.commit()
+            self.assertEqual(conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE project_id = ?", (project_id,)
+            ).fetchone()[0], 0)
+            self.assertEqual(conn.execute(
+                "SELECT COUNT(*) FROM project_stats WHERE project_id = ?", (project_id,)
+            ).fetchone()[0], 0)
+        finally:
+            pool.close_all()
+
+    def test_newer_database(self):
+        """
+        Тест базы от более новой версии приложения
+        """
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        with self.assertRaises(DatabaseException):
+            migrate(self.conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,8 @@ class TestModels(unittest.TestCase):
         # Инициализируем базу данных
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
+        stats_sql_path = os.path.join(script_dir, 'database', 'stats.sql')
+        search_sql_path = os.path.join(script_dir, 'database', 'search.sql')
         
         with open(sql_path, 'r', encoding='utf-8') as sql_file:
             sql_script = sql_file.read()
@@ -31,6 +33,10 @@ class TestModels(unittest.TestCase):
         cls.db_manager.connect()
         cls.db_manager.conn.executescript(sql_script)
         cls.db_manager.commit()
+        
+        # Загружаем сводные таблицы статистики и полнотекстовый поиск
+        cls.db_manager.run_script(stats_sql_path)
+        cls.db_manager.run_script(search_sql_path)
     
     def setUp(self):
         """
@@ -315,5 +321,113 @@ class TestModels(unittest.TestCase):
         developer.delete()
         project.delete()
 
+    def test_connection_per_thread(self):
+        """
+        Тест выдачи отдельного соединения рабочему потоку
+        """
+        import threading
+
+        main_conn = self.db_manager.connect()
+        result = {}
+
+        def worker():
+            with self.db_manager.connection() as conn:
+                result['same'] = conn is main_conn
+                result['count'] = conn.execute("SELECT COUNT(*) FROM developers").fetchone()[0]
+            self.db_manager.release_connection()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertFalse(result['same'])
+        self.assertEqual(
+            result['count'],
+            self.db_manager.conn.execute("SELECT COUNT(*) FROM developers").fetchone()[0]
+        )
+        self.assertIs(self.db_manager.connect(), main_conn)
+
+    def test_query_profiler(self):
+        """
+        Тест профилирования запросов и журнала медленных запросов
+        """
+        import tempfile
+        from services.developer_service import DeveloperService
+
+        log_path = os.path.join(tempfile.mkdtemp(), 'slow_query_log.txt')
+        profiler = self.db_manager.enable_profiling(slow_ms=0, log_path=log_path)
+        try:
+            developers = DeveloperService(self.db_manager).get_all_developers()
+            self.db_manager.entity_cache.clear()
+            Developer.get_by_id(developers[0].id)
+
+            statements = {s['sql']: s for s in profiler.statements()}
+            listing = next(s for s in statements.values() if 'DeveloperService.get_all_developers' in s['call_sites'])
+            self.assertEqual(listing['count'], 1)
+            self.assertEqual(listing['rows'], len(developers))
+            self.assertEqual(sum(listing['histogram']), 1)
+            self.assertTrue(listing['plan'])
+            self.assertTrue(any(s['call_sites'].get('Developer.get_by_id') for s in statements.values()))
+
+            profiler.reset()
+            self.assertEqual(profiler.statements(), [])
+        finally:
+            self.db_manager.disable_profiling()
+
+        self.assertIsNone(self.db_manager.profiler)
+        with open(log_path, encoding='utf-8') as log_file:
+            self.assertIn('DeveloperService.get_all_developers', log_file.read())
+    def test_statement_registry(self):
+        """
+        Тест реестра запросов: все запросы подготавливаются на схеме
+        """
+        from models.statements import STATEMENTS
+
+        self.assertEqual(STATEMENTS.validate(self.db_manager.conn), {})
+
+        first = STATEMENTS.compose('developers.all', ["position = ?"])
+        second = STATEMENTS.compose('developers.all', ["position = ?"])
+        self.assertIs(first, second)
+        self.assertTrue(first.endswith("FROM developers WHERE position = ?"))
+        self.assertIn("MATCH ? AND t.status = ?", STATEMENTS.compose('tasks.ranked', ["t.status = ?"]))
+
+        with self.assertRaises(ValueError):
+            STATEMENTS.register('developers.all', "SELECT 1")
+    def test_entity_cache(self):
+        """
+        Тест кэша сущностей: повторные чтения и сброс после записи
+        """
+        import threading
+
+        developer = Developer(full_name="Кэшируемый Разработчик", position="QA", hourly_rate=900)
+        developer.save()
+        cache = self.db_manager.entity_cache
+
+        Developer.get_by_id(developer.id)
+        hits = cache.stats()['hits']
+        self.assertEqual(Developer.get_by_id(developer.id).hourly_rate, 900)
+        self.assertEqual(cache.stats()['hits'], hits + 1)
+
+        # Запись тем же соединением в обход моделей
+        self.db_manager.execute("UPDATE developers SET hourly_rate = 950 WHERE id = ?", (developer.id,))
+        self.db_manager.commit()
+        self.assertEqual(Developer.get_by_id(developer.id).hourly_rate, 950)
+
+        # Запись другим соединением
+        def worker():
+            with self.db_manager.connection() as conn:
+                conn.execute("UPDATE developers SET hourly_rate = 1000 WHERE id = ?", (developer.id,))
+                conn.commit()
+            self.db_manager.release_connection()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(Developer.get_by_id(developer.id).hourly_rate, 1000)
+
+        developer_id = developer.id
+        developer.delete()
+        self.assertIsNone(Developer.get_by_id(developer_id))
+
 if __name__ == '__main__':
     unittest.main()
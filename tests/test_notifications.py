@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 import unittest
 from datetime import datetime, timedelta
 
@@ -10,6 +11,7 @@ from models import DBManager
 from models.notification import Notification
 from services.notification_service import NotificationService
 from controllers.notification_controller import NotificationController
+from notification_scheduler import NotificationScheduler
 
 class TestNotifications(unittest.TestCase):
     """
@@ -250,5 +252,73 @@ class TestNotifications(unittest.TestCase):
         self.assertEqual(result['overdue_projects'], 1)
         self.assertEqual(result['upcoming_deadlines'], 1)
 
+    def test_checks_do_not_duplicate(self):
+        """
+        Тест повторного запуска проверок без дублирования уведомлений
+        """
+        future_far = (datetime.now() + timedelta(days=365)).strftime('%Y-%m-%d')
+        cursor = self.db_manager.conn.execute(
+            "INSERT INTO projects (name, client, deadline, budget) VALUES (?, ?, ?, ?)",
+            ("Бюджетный проект", "Тестовый клиент", future_far, 100000)
+        )
+        project_id = cursor.lastrowid
+        self.db_manager.conn.execute(
+            "INSERT INTO tasks (project_id, developer_id, description, hours_worked) VALUES (?, 1, ?, ?)",
+            (project_id, "Дорогая задача", 10)
+        )
+        self.db_manager.conn.execute("UPDATE projects SET budget = 16000 WHERE id = ?", (project_id,))
+        self.db_manager.commit()
+
+        first = self.notification_service.run_all_checks()
+        self.assertGreaterEqual(first['budget_warnings'], 1)
+
+        second = self.notification_service.run_all_checks()
+        self.assertEqual(second['total'], 0)
+
+        notification = self.db_manager.conn.execute(
+            "SELECT message, type FROM notifications WHERE related_type = 'budget_warning' AND related_id = ?",
+            (project_id,)
+        ).fetchone()
+        self.assertEqual(notification['type'], 'warning')
+        self.assertIn("93.8% бюджета (15000.00 из 16000.00)", notification['message'])
+
+    def test_scheduler_runs_checks_in_background(self):
+        """
+        Тест фонового планировщика уведомлений
+        """
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        self.db_manager.conn.execute(
+            "INSERT INTO projects (name, client, deadline, budget) VALUES (?, ?, ?, ?)",
+            ("Фоновый проект", "Тестовый клиент", yesterday, 100000)
+        )
+        self.db_manager.commit()
+
+        scheduler = NotificationScheduler(intervals={'overdue_projects': 60}, jitter=0)
+        received = []
+        done = threading.Event()
+        scheduler.add_listener(lambda results: (received.append(results), done.set()))
+
+        scheduler.start()
+        try:
+            self.assertTrue(done.wait(5))
+        finally:
+            scheduler.stop()
+        self.assertFalse(scheduler.is_running())
+
+        self.assertGreaterEqual(received[0]['overdue_projects'], 1)
+        self.assertGreaterEqual(received[0]['total'], received[0]['overdue_projects'])
+        last_run = scheduler.last_run()
+        self.assertEqual(set(last_run), set(NotificationScheduler.DEFAULT_INTERVALS))
+        self.assertIsNone(last_run['overdue_projects']['error'])
+        self.assertGreaterEqual(last_run['overdue_projects']['duration'], 0)
+
+        # Пока идет запуск, следующий пропускается
+        with scheduler._run_lock:
+            self.assertIsNone(scheduler.run_checks())
+        self.assertEqual(scheduler.skipped_runs, 1)
+
+        # Повторный запуск не создает дубликатов
+        self.assertEqual(scheduler.run_checks(['overdue_projects'])['total'], 0)
+
 if __name__ == '__main__':
     unittest.main()
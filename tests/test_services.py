@@ -1,14 +1,16 @@
 import sys
 import os
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta
 
 # Добавляем родительскую директорию в путь для импорта
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import DBManager, Developer, Project, Task
+from database.migrations import migrate
 from services import DeveloperService, ProjectService, TaskService, ReportService
-from exceptions import ValidationException, BusinessException
+from exceptions import ValidationException, BusinessException, DatabaseException
 
 class TestServices(unittest.TestCase):
     """
@@ -22,16 +24,9 @@ class TestServices(unittest.TestCase):
         # Используем временную базу данных для тестов
         cls.db_manager = DBManager(':memory:')
         
-        # Инициализируем базу данных
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sql_path = os.path.join(script_dir, 'database', 'kaban.sql')
-        
-        with open(sql_path, 'r', encoding='utf-8') as sql_file:
-            sql_script = sql_file.read()
-        
+        # Инициализируем базу данных всеми шагами миграции схемы
         cls.db_manager.connect()
-        cls.db_manager.conn.executescript(sql_script)
-        cls.db_manager.commit()
+        migrate(cls.db_manager.conn)
         
         # Создаем сервисы
         cls.developer_service = DeveloperService(cls.db_manager)
@@ -203,3 +198,469 @@ class TestServices(unittest.TestCase):
         
         # Обновление часов зад
 
+
+    def test_batch_loader(self):
+        """
+        Тест пакетной загрузки задач с проектами и разработчиками
+        """
+        from services import BatchLoader
+
+        tasks = self.task_service.get_all_tasks()
+        task_ids = [task.id for task in tasks]
+        self.assertGreater(len(task_ids), 1)
+
+        loader = BatchLoader(self.db_manager)
+        loaded = self.task_service.get_tasks_by_ids(task_ids, loader)
+        self.assertEqual([task.id for task in loaded], task_ids)
+        self.assertLessEqual(loader.query_count, 3)
+
+        names = {task.id: task.project_name for task in tasks}
+        for task in loaded:
+            self.assertEqual(task.project_name, names[task.id])
+
+        # Проверки существования в validate() обслуживаются из карты
+        queries_before = loader.query_count
+        for task in loaded:
+            is_valid, error = task.validate()
+            self.assertTrue(is_valid, error)
+        self.assertEqual(loader.query_count, queries_before)
+
+        self.assertFalse(loader.exists('projects', 999999))
+        self.assertIsNone(self.task_service.get_task_by_id(999999))
+
+    def test_bulk_task_operations(self):
+        """
+        Тест пакетных операций над задачами
+        """
+        developer = self.developer_service.create_developer({
+            'full_name': 'Пакетный Разработчик',
+            'position': 'backend',
+            'hourly_rate': 1000
+        })
+        deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        project = self.project_service.create_project({
+            'name': 'Пакетный Проект',
+            'client': 'Тестовый Клиент',
+            'deadline': deadline,
+            'budget': 20000
+        })
+
+        items = [
+            {'project_id': project.id, 'developer_id': developer.id, 'description': f'Пакетная задача {i}',
+             'status': 'новая', 'hours_worked': 5}
+            for i in range(3)
+        ]
+        # Четвертая задача превышает бюджет проекта, пятая ссылается на несуществующий проект
+        items.append({'project_id': project.id, 'developer_id': developer.id,
+                      'description': 'Дорогая задача', 'hours_worked': 10})
+        items.append({'project_id': 999999, 'description': 'Без проекта'})
+
+        results = self.task_service.bulk_create_tasks(items)
+        self.assertEqual([r['success'] for r in results], [True, True, True, False, False])
+        task_ids = [r['task_id'] for r in results[:3]]
+        tasks = self.task_service.get_tasks_by_ids(task_ids)
+        self.assertEqual([t.description for t in tasks], [f'Пакетная задача {i}' for i in range(3)])
+
+        # Повторное создание обновляет существующую задачу
+        repeat = self.task_service.bulk_create_tasks([dict(items[0], hours_worked=6)])
+        self.assertEqual(repeat[0]['task_id'], task_ids[0])
+
+        results = self.task_service.bulk_assign(task_ids + [999999], developer.id)
+        self.assertEqual([r['success'] for r in results], [True, True, True, False])
+        self.assertTrue(all(t.status == 'в работе' for t in self.task_service.get_tasks_by_ids(task_ids)))
+
+        results = self.task_service.bulk_update_hours({task_ids[0]: 1, task_ids[1]: -1})
+        self.assertEqual([r['success'] for r in results], [True, False])
+
+        results = self.task_service.bulk_update_status(task_ids, 'на проверке')
+        self.assertTrue(all(r['success'] for r in results))
+        tasks = self.task_service.get_tasks_by_ids(task_ids)
+        self.assertTrue(all(t.status == 'на проверке' for t in tasks))
+        self.assertEqual(tasks[0].hours_worked, 1)
+
+        with self.assertRaises(ValidationException):
+            self.task_service.bulk_update_status(task_ids, 'неизвестно')
+
+        self.project_service.delete_project(project.id)
+        self.developer_service.delete_developer(developer.id)
+
+    def test_bulk_create_duplicates(self):
+        """
+        Тест повторов задач в пакетном создании
+        """
+        developer = self.developer_service.create_developer({
+            'full_name': 'Разработчик Повторов',
+            'position': 'backend',
+            'hourly_rate': 1000
+        })
+        deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        project = self.project_service.create_project({
+            'name': 'Проект Повторов',
+            'client': 'Тестовый Клиент',
+            'deadline': deadline,
+            'budget': 20000
+        })
+        task = {'project_id': project.id, 'developer_id': developer.id, 'description': 'Повтор в пачке'}
+
+        # Повтор заменяет часы строки, а не добавляет их стоимость к бюджету
+        results = self.task_service.bulk_create_tasks([
+            dict(task, hours_worked=15),
+            dict(task, hours_worked=15),
+            dict(task, description='Остаток бюджета', hours_worked=5),
+            {'project_id': project.id, 'description': 'Без разработчика', 'hours_worked': 2},
+            {'project_id': project.id, 'description': 'Без разработчика', 'hours_worked': 3},
+        ])
+        self.assertTrue(all(r['success'] for r in results))
+        self.assertEqual(results[0]['task_id'], results[1]['task_id'])
+        self.assertEqual(results[3]['task_id'], results[4]['task_id'])
+        tasks = {t.id: t for t in self.task_service.get_tasks_by_ids([r['task_id'] for r in results])}
+        self.assertEqual(tasks[results[0]['task_id']].hours_worked, 15)
+        self.assertEqual(tasks[results[2]['task_id']].description, 'Остаток бюджета')
+        self.assertEqual(tasks[results[3]['task_id']].hours_worked, 3)
+
+        # Задачи без разработчика совпадают так же, как в триггере upsert_task
+        no_developer = {'project_id': project.id, 'description': 'Без разработчика', 'hours_worked': 4}
+        repeat = self.task_service.bulk_create_tasks([no_developer])
+        self.assertEqual(repeat[0]['task_id'], results[3]['task_id'])
+        self.db_manager.execute(
+            "INSERT INTO tasks (project_id, developer_id, description, hours_worked) VALUES (?, NULL, ?, 1)",
+            (project.id, 'Без разработчика')
+        )
+        self.db_manager.commit()
+        self.assertEqual(self.db_manager.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE project_id = ? AND description = 'Без разработчика'", (project.id,)
+        ).fetchone()[0], 1)
+
+        self.project_service.delete_project(project.id)
+        self.developer_service.delete_developer(developer.id)
+
+    def test_bulk_write_requires_lock(self):
+        """
+        Тест: без блокировки записи пакетные операции не выполняются
+        """
+        tasks_before = self.db_manager.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        item = {'project_id': 1, 'developer_id': 1, 'description': 'Без блокировки', 'hours_worked': 0}
+        with mock.patch.object(self.db_manager, 'begin_transaction', return_value=False):
+            with self.assertRaises(DatabaseException):
+                self.task_service.bulk_create_tasks([item])
+            with self.assertRaises(BusinessException):
+                self.task_service.bulk_update_status([1], 'в работе')
+        self.assertEqual(self.db_manager.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], tasks_before)
+
+    def _assert_project_stats_match(self):
+        """
+        Сравнивает project_stats с прямой агрегацией задач
+
+        Returns:
+            list: Строки прямой агрегации по проектам
+        """
+        conn = self.db_manager.conn
+        live = conn.execute("""
+            SELECT p.id, COUNT(t.id), COALESCE(SUM(CASE WHEN t.status = 'завершено' THEN 1 ELSE 0 END), 0),
+                   COALESCE(SUM(t.hours_worked), 0), COALESCE(SUM(t.hours_worked * d.hourly_rate), 0)
+            FROM projects p
+            LEFT JOIN tasks t ON p.id = t.project_id
+            LEFT JOIN developers d ON t.developer_id = d.id
+            GROUP BY p.id ORDER BY p.id
+        """).fetchall()
+        stored = conn.execute("""
+            SELECT project_id, total_tasks, completed_tasks, total_hours, labor_cost
+            FROM project_stats ORDER BY project_id
+        """).fetchall()
+        self.assertEqual([tuple(row) for row in live], [tuple(row) for row in stored])
+        return live
+
+    def test_summary_stats_match_live_aggregates(self):
+        """
+        Тест соответствия сводной статистики прямой агрегации задач
+        """
+        developer = self.developer_service.create_developer({
+            'full_name': 'Статистический Разработчик',
+            'position': 'backend',
+            'hourly_rate': 1000
+        })
+        deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        project = self.project_service.create_project({
+            'name': 'Статистический Проект',
+            'client': 'Тестовый Клиент',
+            'deadline': deadline,
+            'budget': 1000000
+        })
+        task = self.task_service.create_task({
+            'project_id': project.id, 'developer_id': developer.id,
+            'description': 'Статистическая задача', 'status': 'в работе', 'hours_worked': 4
+        })
+        self.task_service.update_task_hours(task.id, 7)
+        self.task_service.update_task_status(task.id, 'завершено')
+        self.task_service.update_task(task.id, {'project_id': 1})
+        self.developer_service.update_developer(developer.id, {
+            'full_name': 'Статистический Разработчик', 'position': 'backend', 'hourly_rate': 1500
+        })
+
+        live = self._assert_project_stats_match()
+
+        report = self.report_service.get_project_status_report()
+        by_id = {p['id']: p for p in report['projects']}
+        self.assertEqual(by_id[1]['total_cost'], live[0][4])
+
+        self.task_service.delete_task(task.id)
+        self.project_service.delete_project(project.id)
+        self.developer_service.delete_developer(developer.id)
+
+    def test_summary_stats_after_developer_delete(self):
+        """
+        Тест сводной статистики после удаления разработчика с задачами
+        """
+        conn = self.db_manager.conn
+        deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        project = self.project_service.create_project({
+            'name': 'Проект удаляемых разработчиков',
+            'client': 'Тестовый Клиент',
+            'deadline': deadline,
+            'budget': 1000000
+        })
+        # С внешними ключами (ON DELETE SET NULL) и без них (висячая ссылка)
+        for foreign_keys in ('ON', 'OFF'):
+            conn.execute(f"PRAGMA foreign_keys = {foreign_keys}")
+            developer = self.developer_service.create_developer({
+                'full_name': f'Удаляемый Разработчик {foreign_keys}',
+                'position': 'frontend',
+                'hourly_rate': 1200
+            })
+            for number, hours in enumerate((3, 9)):
+                self.task_service.create_task({
+                    'project_id': project.id, 'developer_id': developer.id,
+                    'description': f'Задача удаляемого {foreign_keys} {number}',
+                    'status': 'в работе', 'hours_worked': hours
+                })
+
+            self.assertTrue(self.developer_service.delete_developer(developer.id))
+            self._assert_project_stats_match()
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        self.project_service.delete_project(project.id)
+
+    def test_search_tasks_page(self):
+        """
+        Тест постраничного поиска задач по курсору (updated_at, id)
+        """
+        expected = [(t.updated_at, t.id) for t in self.task_service.search_tasks()]
+        expected.sort(reverse=True)
+
+        pages = []
+        cursor = None
+        while True:
+            page = self.task_service.search_tasks_page(limit=3, cursor=cursor)
+            self.assertLessEqual(len(page['tasks']), 3)
+            pages.extend((t.updated_at, t.id) for t in page['tasks'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(pages, expected)
+
+        # Фильтры применяются вместе с курсором
+        filtered = self.task_service.search_tasks_page(status='новая', limit=1000)
+        self.assertTrue(all(t.status == 'новая' for t in filtered['tasks']))
+        self.assertIsNone(filtered['next_cursor'])
+
+        # Страницы читаются по индексу, без сортировки всей таблицы
+        plan = self.db_manager.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM tasks t WHERE (t.updated_at, t.id) < (?, ?) "
+            "ORDER BY t.updated_at DESC, t.id DESC LIMIT 4",
+            ['9999-12-31', 0]
+        ).fetchall()
+        self.assertIn('idx_tasks_updated_at', ' '.join(row[-1] for row in plan))
+
+        with self.assertRaises(ValidationException):
+            self.task_service.search_tasks_page(limit=0)
+
+    def test_full_text_search(self):
+        """
+        Тест полнотекстового поиска с ранжированием
+        """
+        developer = self.developer_service.create_developer({
+            'full_name': 'Ёжиков Пётр',
+            'position': 'backend',
+            'hourly_rate': 100
+        })
+        deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        project = self.project_service.create_project({
+            'name': 'Авторизация клиентов',
+            'client': 'Полнотекстовый Клиент',
+            'deadline': deadline,
+            'budget': 100000
+        })
+        in_description = self.task_service.create_task({
+            'project_id': project.id, 'developer_id': developer.id,
+            'description': 'Переделать авторизацию через токены', 'hours_worked': 1
+        })
+        in_project_only = self.task_service.create_task({
+            'project_id': project.id, 'developer_id': 1,
+            'description': 'Настроить почтовые рассылки', 'hours_worked': 1
+        })
+
+        # Поиск по префиксу; совпадение в описании весит больше, чем в названии проекта
+        found = self.task_service.search_tasks_ranked('авториз')
+        ids = [t.id for t in found]
+        self.assertIn(in_description.id, ids)
+        self.assertIn(in_project_only.id, ids)
+        self.assertLess(ids.index(in_description.id), ids.index(in_project_only.id))
+
+        # Ё и Е не различаются, фильтры применяются вместе с поиском
+        by_developer = self.task_service.search_tasks_ranked('ежиков петр', developer_id=developer.id)
+        self.assertEqual([t.id for t in by_developer], [in_description.id])
+        self.assertEqual([d.id for d in self.developer_service.search_developers_ranked('ежик')], [developer.id])
+        self.assertEqual(self.project_service.search_projects_ranked('полнотекст')[0].id, project.id)
+
+        # Индексы следуют за изменениями
+        self.project_service.update_project(project.id, {
+            'name': 'Платежный шлюз', 'client': 'Полнотекстовый Клиент',
+            'deadline': deadline, 'budget': 100000
+        })
+        self.assertIn(in_project_only.id, [t.id for t in self.task_service.search_tasks_ranked('шлюз')])
+        self.assertEqual(self.project_service.search_projects_ranked('авторизация'), [])
+
+        page = self.task_service.search_tasks_page(search_term='токен')
+        self.assertEqual([t.id for t in page['tasks']], [in_description.id])
+
+        self.task_service.delete_task(in_description.id)
+        self.assertEqual(self.task_service.search_tasks_ranked('токены'), [])
+
+        # Операторы FTS5 и кавычки во вводе не ломают запрос
+        self.assertEqual(self.task_service.search_tasks_ranked('"OR* ('), [])
+        self.assertEqual(self.task_service.search_tasks_ranked('   '), [])
+
+        self.task_service.delete_task(in_project_only.id)
+        self.project_service.delete_project(project.id)
+        self.developer_service.delete_developer(developer.id)
+
+    def test_task_rows(self):
+        """
+        Тест компактных строк списка задач
+        """
+        from models import TaskRow
+
+        rows = self.task_service.get_all_tasks()
+        self.assertTrue(rows)
+        self.assertTrue(all(isinstance(row, TaskRow) for row in rows))
+        self.assertFalse(hasattr(rows[0], '__dict__'))
+
+        # Для редактирования строка превращается в полную модель
+        task = rows[0].to_task(self.db_manager)
+        self.assertIsInstance(task, Task)
+        self.assertEqual((task.id, task.project_name), (rows[0].id, rows[0].project_name))
+        self.assertEqual(self.task_service.get_task_by_id(task.id).description, task.description)
+
+        # Столбцовое хранилище возвращает те же строки
+        store = self.task_service.get_task_rows()
+        self.assertEqual(len(store), len(rows))
+        self.assertEqual(sorted(store, key=lambda r: r.id), sorted(rows, key=lambda r: r.id))
+        self.assertEqual(store[-1], max(rows, key=lambda r: r.id))
+        self.assertEqual(list(self.task_service.iter_tasks(batch_size=2)), list(store))
+
+        filtered = self.task_service.get_task_rows(status='новая')
+        self.assertTrue(all(filtered.status(i) == 'новая' for i in range(len(filtered))))
+
+    def test_report_cache(self):
+        """
+        Тест кэша отчетов по версиям таблиц
+        """
+        cache = self.db_manager.report_cache
+        cache.clear()
+        start_date, end_date = '2000-01-01', '2999-12-31'
+
+        first = self.report_service.get_developer_workload_report(start_date, end_date)
+        hits = cache.stats()['hits']
+        second = self.report_service.get_developer_workload_report(start_date, end_date)
+        self.assertEqual(cache.stats()['hits'], hits + 1)
+        self.assertEqual(second, first)
+
+        # Вызывающий получает копию: изменения не попадают в кэш
+        second['developers'].clear()
+        self.assertEqual(self.report_service.get_developer_workload_report(start_date, end_date), first)
+
+        # Любая запись в tasks меняет версию, отчет пересчитывается
+        task = self.task_service.get_all_tasks()[0]
+        self.task_service.update_task_hours(task.id, task.hours_worked + 10)
+        try:
+            updated = self.report_service.get_developer_workload_report(start_date, end_date)
+            self.assertAlmostEqual(updated['total_hours'], first['total_hours'] + 10)
+        finally:
+            self.task_service.update_task_hours(task.id, task.hours_worked)
+
+        # Прошедший месяц сохраняется в таблице и переживает очистку кэша в памяти
+        month = self.report_service.get_monthly_revenue_report(2020, 1)
+        saved = self.db_manager.query_one(
+            "SELECT payload FROM report_cache WHERE report_type = 'monthly_revenue' AND params = '[2020, 1]'"
+        )
+        self.assertIsNotNone(saved)
+        cache.clear()
+        self.assertEqual(self.report_service.get_monthly_revenue_report(2020, 1), month)
+        self.assertIsNone(self.db_manager.query_one(
+            "SELECT 1 AS found FROM report_cache WHERE report_type = 'developer_workload'"
+        ))
+
+        # Размер кэша ограничен: старые записи вытесняются
+        from models.report_cache import ReportCache
+        small = ReportCache(max_entries=2, max_bytes=100)
+        small.put('a', (1,), {'x': 1})
+        small.put('b', (1,), {'x': 2})
+        small.get('a', (1,))
+        small.put('c', (1,), {'x': 3})
+        self.assertIsNone(small.get('b', (1,)))
+        self.assertEqual(small.get('a', (1,)), {'x': 1})
+        small.put('big', (1,), {'x': 'y' * 200})
+        self.assertIsNone(small.get('big', (1,)))
+        self.assertIsNone(small.get('a', (2,)))
+
+    def test_period_reports(self):
+        """
+        Тест границ периода и индексов отчетов за период
+        """
+        self.assertEqual(self.report_service.day_range('2030-01-01', '2030-01-31'), ('2030-01-01', '2030-02-01'))
+        self.assertEqual(self.report_service.day_range(None, '2030-12-31 10:00'), (None, '2031-01-01'))
+        with self.assertRaises(ValidationException):
+            self.report_service.day_range('31.01.2030')
+
+        conn = self.db_manager.conn
+        project_id = conn.execute(
+            "INSERT INTO projects (name, client, deadline, budget) VALUES ('Период', 'Клиент', '2030-12-31', 1000000)"
+        ).lastrowid
+        developer_id = conn.execute(
+            "INSERT INTO developers (full_name, position, hourly_rate) VALUES ('Периодов Петр', 'QA', 100)"
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO tasks (project_id, developer_id, description, hours_worked, created_at) VALUES (?, ?, ?, ?, ?)",
+            [(project_id, developer_id, 'до периода', 1, '2029-12-31 23:59:59'),
+             (project_id, developer_id, 'начало', 2, '2030-01-01 00:00:00'),
+             (project_id, developer_id, 'конец', 4, '2030-01-31 23:59:59'),
+             (project_id, developer_id, 'после периода', 8, '2030-02-01 00:00:00')]
+        )
+        self.db_manager.commit()
+        try:
+            salary = self.developer_service.calculate_developer_salary(developer_id, '2030-01-01', '2030-01-31')
+            self.assertEqual(salary['total_hours'], 6)
+
+            workload = self.report_service.get_developer_workload_report('2030-01-01', '2030-01-31')
+            row = next(d for d in workload['developers'] if d['id'] == developer_id)
+            self.assertEqual((row['task_count'], row['total_hours']), (2, 6))
+
+            revenue = self.report_service.get_monthly_revenue_report(2030, 1)
+            self.assertEqual([(p['id'], p['total_hours']) for p in revenue['projects']], [(project_id, 6)])
+        finally:
+            conn.execute("DELETE FROM tasks WHERE project_id = ?", (project_id,))
+            conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+            conn.execute("DELETE FROM developers WHERE id = ?", (developer_id,))
+            self.db_manager.commit()
+
+        # Период выбирается диапазоном по составным индексам
+        plans = {
+            'idx_tasks_developer_period': "SELECT SUM(hours_worked) FROM tasks "
+                                          "WHERE developer_id = ? AND created_at >= ? AND created_at < ?",
+            'idx_tasks_period': "SELECT project_id, SUM(hours_worked) FROM tasks "
+                                "WHERE created_at >= ? AND created_at < ? GROUP BY project_id",
+        }
+        for index, query in plans.items():
+            params = [1, '2030-01-01', '2030-02-01'][-query.count('?'):]
+            plan = ' '.join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params))
+            self.assertIn(f'COVERING INDEX {index}', plan)
@@ -0,0 +1,59 @@
+import sys
+import os
+import tempfile
+import threading
+import unittest
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from startup_trace import StartupTrace
+
+
+class TestStartupTrace(unittest.TestCase):
+    """
+    Тесты трассировки запуска
+    """
+    def test_disabled(self):
+        """
+        Тест выключенной трассировки
+        """
+        trace = StartupTrace(enabled=False, log_path=None)
+        with trace.span('этап'):
+            trace.mark('момент')
+        self.assertEqual(trace.report()[1:], [])
+
+    def test_spans(self):
+        """
+        Тест разбивки запуска по этапам
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_path = os.path.join(tmp_dir, 'startup_trace.txt')
+            trace = StartupTrace(enabled=True, log_path=log_path)
+            with trace.span('Схема'):
+                with trace.span('Миграции'):
+                    pass
+            worker = threading.Thread(target=lambda: trace.mark('Кэш'), name='Worker')
+            worker.start()
+            worker.join()
+
+            lines = trace.report()
+            self.assertTrue(lines[0].startswith('Запуск:'))
+            names = [line.split('мс')[-1].strip() for line in lines[1:]]
+            self.assertEqual(names, ['Схема', 'Миграции', 'Кэш  [Worker]'])
+            # Вложенный этап отображается с отступом
+            self.assertIn('    Миграции', lines[2])
+
+            trace.finish()
+            with open(log_path, 'r', encoding='utf-8') as trace_file:
+                saved = trace_file.read()
+            self.assertIn('Запуск завершен', saved)
+
+            # После завершения новые этапы не записываются
+            with trace.span('Позже'):
+                pass
+            self.assertNotIn('Позже', '\n'.join(trace.report()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Добавляем родительскую директорию в путь для импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.resources.theme_cache import ThemeCache, source_signature
+
+
+class TestThemeCache(unittest.TestCase):
+    """
+    Тесты кэша скомпилированных тем
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'theme_cache.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_put(self):
+        """
+        Тест попадания и промаха
+        """
+        cache = ThemeCache()
+        key = ('light', '#2fc6f6', '')
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {'primary': '#2fc6f6'}, 'QWidget {}')
+        self.assertEqual(cache.get(key), ({'primary': '#2fc6f6'}, 'QWidget {}'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        """
+        Тест вытеснения давно не использованных тем
+        """
+        cache = ThemeCache(max_entries=2)
+        cache.put(('light', '#000000', ''), {}, 'a')
+        cache.put(('dark', '#000000', ''), {}, 'b')
+        cache.get(('light', '#000000', ''))
+        cache.put(('dark', '#ffffff', ''), {}, 'c')
+        self.assertIsNotNone(cache.get(('light', '#000000', '')))
+        self.assertIsNone(cache.get(('dark', '#000000', '')))
+
+    def test_persistence(self):
+        """
+        Тест сохранения тем между запусками
+        """
+        key = ('dark', '#ff5752', '#151c28')
+        ThemeCache(self.path, signature='v1').put(key, {'primary': '#ff5752'}, 'QWidget {}')
+
+        restored = ThemeCache(self.path, signature='v1')
+        self.assertEqual(restored.get(key), ({'primary': '#ff5752'}, 'QWidget {}'))
+
+        # Изменились исходники сборки — сохраненные темы не используются
+        self.assertIsNone(ThemeCache(self.path, signature='v2').get(key))
+        # Без подписи кэш работает только в памяти
+        self.assertIsNone(ThemeCache(self.path).get(key))
+
+    def test_corrupted_file(self):
+        """
+        Тест поврежденного файла кэша
+        """
+        with open(self.path, 'w', encoding='utf-8') as cache_file:
+            cache_file.write('{not json')
+        cache = ThemeCache(self.path, signature='v1')
+        self.assertIsNone(cache.get(('light', '#2fc6f6', '')))
+        cache.put(('light', '#2fc6f6', ''), {}, 'QWidget {}')
+        self.assertIsNotNone(ThemeCache(self.path, signature='v1').get(('light', '#2fc6f6', '')))
+
+    def test_source_signature(self):
+        """
+        Тест подписи исходников
+        """
+        source = os.path.join(self.tmp_dir.name, 'builder.py')
+        with open(source, 'w', encoding='utf-8') as source_file:
+            source_file.write('A = 1\n')
+        before = source_signature(source)
+        with open(source, 'w', encoding='utf-8') as source_file:
+            source_file.write('A = 2\n')
+        self.assertNotEqual(before, source_signature(source))
+        self.assertIsNone(source_signature(os.path.join(self.tmp_dir.name, 'missing.py')))
+
+
+if __name__ == '__main__':
+    unittest.main()
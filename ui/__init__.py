@@ -1,5 +1,20 @@
-from ui.main_window import MainWindow
-from ui.login_window import LoginWindow
-from ui.splash_screen import SplashScreen
+import importlib
+
+# Окна импортируются при первом обращении: заставке при запуске не нужны
+# модули всех вкладок, которые тянет за собой главное окно
+_EXPORTS = {
+    'MainWindow': 'ui.main_window',
+    'LoginWindow': 'ui.login_window',
+    'SplashScreen': 'ui.splash_screen',
+}
 
 __all__ = ['MainWindow', 'LoginWindow', 'SplashScreen']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'ui' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
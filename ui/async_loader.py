@@ -0,0 +1,148 @@
+import itertools
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from models import DBManager
+
+
+class _JobSignals(QObject):
+    finished = pyqtSignal(str, int, object, object)
+
+
+class _Job(QRunnable):
+    """
+    Задача пула: выполняет функцию загрузки в рабочем потоке
+    """
+    def __init__(self, loader, key, generation, fn, args, kwargs):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.generation = generation
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _JobSignals()
+
+    def run(self):
+        # Запрос, устаревший еще в очереди, не выполняется
+        if not self.loader.is_current(self.key, self.generation):
+            self.signals.finished.emit(self.key, self.generation, None, None)
+            return
+        result, error = None, None
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            error = e
+        finally:
+            DBManager().release_connection()
+        self.signals.finished.emit(self.key, self.generation, result, error)
+
+
+class AsyncLoader(QObject):
+    """
+    Загрузка данных для вкладок в пуле рабочих потоков
+
+    Запросы различаются ключом. Повторные запросы с тем же ключом в течение
+    coalesce_ms объединяются в один, а результат запроса, который успел
+    устареть (появился более новый запрос или отмена), отбрасывается.
+    Обработчики вызываются в потоке интерфейса.
+    """
+
+    started = pyqtSignal(str)
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+    DEFAULT_COALESCE_MS = 150
+
+    _shared_pool = None
+
+    def __init__(self, parent=None, coalesce_ms=None, pool=None):
+        super().__init__(parent)
+        self.coalesce_ms = self.DEFAULT_COALESCE_MS if coalesce_ms is None else coalesce_ms
+        self.pool = pool or self.shared_pool()
+        self._counter = itertools.count(1)
+        self._generations = {}
+        self._pending = {}
+        self._timers = {}
+        self._callbacks = {}
+        self._jobs = {}
+
+    @classmethod
+    def shared_pool(cls):
+        if cls._shared_pool is None:
+            cls._shared_pool = QThreadPool()
+            cls._shared_pool.setMaxThreadCount(max(2, min(4, QThreadPool.globalInstance().maxThreadCount())))
+        return cls._shared_pool
+
+    def request(self, key, fn, *args, on_result=None, on_error=None, **kwargs):
+        """
+        Ставит загрузку в очередь
+
+        Args:
+            key: Ключ запроса (например, 'tasks' или 'report:overdue')
+            fn: Функция загрузки, выполняемая в рабочем потоке
+            on_result: Обработчик результата
+            on_error: Обработчик ошибки (получает текст ошибки)
+        """
+        # Любой новый запрос делает устаревшими уже запущенные
+        self._generations[key] = next(self._counter)
+        self._pending[key] = (fn, args, kwargs, on_result, on_error)
+
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda k=key: self._submit(k))
+            self._timers[key] = timer
+        if not timer.isActive():
+            timer.start(self.coalesce_ms)
+
+    def _submit(self, key):
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        fn, args, kwargs, on_result, on_error = pending
+        generation = self._generations[key]
+        self._callbacks[key] = (generation, on_result, on_error)
+
+        job = _Job(self, key, generation, fn, args, kwargs)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self._on_finished)
+        self._jobs[(key, generation)] = job
+        self.started.emit(key)
+        self.pool.start(job)
+
+    def _on_finished(self, key, generation, result, error):
+        self._jobs.pop((key, generation), None)
+        if not self.is_current(key, generation):
+            return
+        _, on_result, on_error = self._callbacks.pop(key, (None, None, None))
+        if error is not None:
+            self.failed.emit(key, str(error))
+            if on_error:
+                on_error(str(error))
+        else:
+            self.loaded.emit(key, result)
+            if on_result:
+                on_result(result)
+
+    def is_current(self, key, generation):
+        return self._generations.get(key) == generation
+
+    def is_loading(self, key):
+        return key in self._pending or key in self._callbacks
+
+    def cancel(self, key):
+        """
+        Отменяет запрос: ожидающий не запускается, результат запущенного отбрасывается
+        """
+        self._generations[key] = next(self._counter)
+        self._pending.pop(key, None)
+        self._callbacks.pop(key, None)
+        timer = self._timers.get(key)
+        if timer is not None:
+            timer.stop()
+
+    def cancel_all(self):
+        for key in list(self._generations):
+            self.cancel(key)
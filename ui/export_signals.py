@@ -0,0 +1,21 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class ExportSignals(QObject):
+    """
+    Передает изменения фоновых экспортов в поток интерфейса
+    """
+
+    job_changed = pyqtSignal(object)
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        manager.add_listener(self._on_job)
+
+    def _on_job(self, job):
+        # Вызывается в рабочем потоке очереди; сигнал доставляется в поток объекта
+        self.job_changed.emit(job)
+
+    def detach(self):
+        self.manager.remove_listener(self._on_job)
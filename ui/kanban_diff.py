@@ -0,0 +1,62 @@
+"""Сравнение снимков Kanban-доски: какие карточки добавить, обновить, убрать."""
+
+from collections import namedtuple
+
+# Поля задачи, которые видны на карточке
+CARD_FIELDS = ('project_name', 'description', 'developer_name', 'hours_worked', 'updated_at', 'created_at')
+
+ColumnDiff = namedtuple('ColumnDiff', ['added', 'changed', 'removed'])
+
+
+def group_by_status(tasks, statuses):
+    """
+    Раскладывает задачи по колонкам за один проход
+
+    Args:
+        tasks: Задачи (Task или TaskRow)
+        statuses: Ключи колонок в нижнем регистре
+
+    Returns:
+        dict: Статус -> список задач в исходном порядке; задачи с другими
+        статусами не попадают ни в одну колонку
+    """
+    groups = {status: [] for status in statuses}
+    for task in tasks:
+        group = groups.get((getattr(task, 'status', '') or '').lower())
+        if group is not None:
+            group.append(task)
+    return groups
+
+
+def card_signature(task):
+    """
+    Снимок отображаемых полей задачи: карточка перерисовывается, только
+    если он изменился
+    """
+    return tuple(getattr(task, field, None) for field in CARD_FIELDS)
+
+
+def diff_column(previous, tasks):
+    """
+    Сравнивает колонку с прошлым снимком
+
+    Args:
+        previous: dict ID задачи -> card_signature на момент прошлой отрисовки
+        tasks: Новые задачи колонки в порядке показа
+
+    Returns:
+        ColumnDiff: ID новых, измененных и пропавших задач (новые и
+        измененные — в порядке tasks)
+    """
+    added = []
+    changed = []
+    current = set()
+    for task in tasks:
+        current.add(task.id)
+        signature = previous.get(task.id)
+        if signature is None:
+            added.append(task.id)
+        elif signature != card_signature(task):
+            changed.append(task.id)
+    removed = [task_id for task_id in previous if task_id not in current]
+    return ColumnDiff(added, changed, removed)
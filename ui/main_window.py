@@ -1,39 +1,72 @@
+import importlib
 import sys
 from PyQt5.QtWidgets import (
     QMainWindow, QAction, QStatusBar, QLabel, QMessageBox, QWidget,
-    QVBoxLayout, QHBoxLayout, QStackedWidget, QToolBar,
+    QVBoxLayout, QHBoxLayout, QStackedWidget, QToolBar, QTableView,
 )
 from PyQt5.QtGui import QIcon, QFont
 from PyQt5.QtCore import Qt, QSize
 
-from ui.resources.theme_manager import apply_theme
+from export_jobs import ExportJobManager
+from ui.resources.theme_manager import apply_theme, restyle_when_visible
+from ui.resources.table_helper import refresh_all_tables
 from ui.resources.icon_helper import get_icon, app_icon
 from ui.widgets.sidebar import Sidebar
-from ui.tabs.admin_tab import AdminTab
-from ui.tabs.dashboard_tab import DashboardTab
-from ui.tabs.developers_tab import DevelopersTab
-from ui.tabs.projects_tab import ProjectsTab
-from ui.tabs.tasks_tab import TasksTab
-from ui.tabs.reports_tab import ReportsTab
-from ui.tabs.settings_tab import SettingsTab
-from ui.dialogs.about_dialog import AboutDialog
+from ui.widgets.export_status import ExportStatus
+from ui.notification_signals import NotificationSignals
+from startup_trace import trace
 
 
 class MainWindow(QMainWindow):
 
-    def __init__(self, user):
+    # Страницы создаются при первом переходе на них:
+    # ключ пункта меню -> (атрибут окна, модуль, класс)
+    PAGES = {
+        'dashboard': ('dashboard_tab', 'ui.tabs.dashboard_tab', 'DashboardTab'),
+        'developers': ('developers_tab', 'ui.tabs.developers_tab', 'DevelopersTab'),
+        'projects': ('projects_tab', 'ui.tabs.projects_tab', 'ProjectsTab'),
+        'tasks': ('tasks_tab', 'ui.tabs.tasks_tab', 'TasksTab'),
+        'reports': ('reports_tab', 'ui.tabs.reports_tab', 'ReportsTab'),
+        'settings': ('settings_tab', 'ui.tabs.settings_tab', 'SettingsTab'),
+        'admin': ('admin_tab', 'ui.tabs.admin_tab', 'AdminTab'),
+    }
+
+    def __init__(self, user, notification_scheduler=None):
         super().__init__()
         self.user = user
         self._pages = {}
+        self.notification_signals = None
         self.init_ui()
+        if notification_scheduler is not None:
+            self._connect_notifications(notification_scheduler)
+
+    def _connect_notifications(self, scheduler):
+        self.notification_signals = NotificationSignals(scheduler, self)
+        self.notification_signals.checks_finished.connect(self._on_notification_checks)
+
+    def _on_notification_checks(self, results):
+        if results.get('total'):
+            self.dashboard_tab.refresh_notifications()
+            self.statusbar.showMessage(f"Новых уведомлений: {results['total']}", 5000)
 
     def apply_theme(self):
+        """
+        Обновляет цвета окна после смены темы
+
+        Сразу перекрашиваются боковая панель и открытая страница, остальные
+        созданные страницы — при переходе на них.
+        """
         if hasattr(self, 'sidebar'):
             self.sidebar.refresh_theme()
-        if hasattr(self, 'dashboard_tab') and hasattr(self.dashboard_tab, 'refresh_theme'):
-            self.dashboard_tab.refresh_theme()
-        from ui.resources.table_helper import refresh_all_tables
-        refresh_all_tables(self)
+        for page in self._pages.values():
+            if hasattr(page, 'refresh_theme') or page.findChild(QTableView) is not None:
+                restyle_when_visible(page, lambda page=page: self._refresh_page_theme(page))
+
+    @staticmethod
+    def _refresh_page_theme(page):
+        if hasattr(page, 'refresh_theme'):
+            page.refresh_theme()
+        refresh_all_tables(page)
 
     def init_ui(self):
         self.setWindowTitle('KABAN:manager')
@@ -61,41 +94,43 @@ class MainWindow(QMainWindow):
         self.showMaximized()
 
     def _build_pages(self):
-        self.dashboard_tab = DashboardTab(self.user)
-        self._add_page('dashboard', self.dashboard_tab)
-
-        if self.user.role == 'developer':
-            self.projects_tab = ProjectsTab(self.user)
-            self.tasks_tab = TasksTab(self.user)
-            self._add_page('projects', self.projects_tab)
-            self._add_page('tasks', self.tasks_tab)
-        else:
-            self.developers_tab = DevelopersTab(self.user)
-            self.projects_tab = ProjectsTab(self.user)
-            self.tasks_tab = TasksTab(self.user)
-            self.reports_tab = ReportsTab(self.user)
-            self.settings_tab = SettingsTab(self.user)
-            self._add_page('developers', self.developers_tab)
-            self._add_page('projects', self.projects_tab)
-            self._add_page('tasks', self.tasks_tab)
-            self._add_page('reports', self.reports_tab)
-            self._add_page('settings', self.settings_tab)
-
-        if self.user.role == 'admin':
-            self.admin_tab = AdminTab(self.user)
-            self._add_page('admin', self.admin_tab)
-
-        keys = self.sidebar.item_keys()
-        for i, key in enumerate(keys):
-            if key in self._pages:
-                self.stack.addWidget(self._pages[key])
+        # Пока страница не открыта, ее место в стеке занимает пустая заглушка
+        for key in self.sidebar.item_keys():
+            if key in self.PAGES:
+                placeholder = QWidget()
+                self._pages[key] = placeholder
+                self.stack.addWidget(placeholder)
+
+        self._ensure_page('dashboard')
         self.stack.setCurrentIndex(0)
 
-    def _add_page(self, key, widget):
-        self._pages[key] = widget
+    def _ensure_page(self, key):
+        """
+        Создает страницу при первом обращении и ставит ее на место заглушки
+        """
+        attr, module_name, class_name = self.PAGES[key]
+        page = getattr(self, attr, None)
+        if page is not None:
+            return page
+
+        with trace.span(f'Страница {key}'):
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            page = page_class(self.user)
+
+        placeholder = self._pages[key]
+        index = self.stack.indexOf(placeholder)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._pages[key] = page
+        setattr(self, attr, page)
+        return page
 
     def _switch_page(self, index):
         if 0 <= index < self.stack.count():
+            keys = self.sidebar.item_keys()
+            if index < len(keys) and keys[index] in self.PAGES:
+                self._ensure_page(keys[index])
             self.stack.setCurrentIndex(index)
             self.sidebar.set_active_index(index)
 
@@ -213,6 +248,11 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusbar)
         self.statusbar.showMessage(f'Добро пожаловать, {self.user.full_name}', 5000)
 
+        # Фоновые экспорты вкладок идут через общую очередь
+        self.export_status = ExportStatus(ExportJobManager.shared(), self)
+        self.export_status.finished.connect(lambda message: self.statusbar.showMessage(message, 10000))
+        self.statusbar.addPermanentWidget(self.export_status)
+
     def add_item(self):
         current_tab = self._current_tab()
         if hasattr(current_tab, 'add_item'):
@@ -263,6 +303,7 @@ class MainWindow(QMainWindow):
             self.showMaximized()
 
     def show_about(self):
+        from ui.dialogs.about_dialog import AboutDialog
         about_dialog = AboutDialog(self)
         about_dialog.exec_()
 
@@ -270,11 +311,19 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, 'Справка', 'Справочная информация о программе KABAN:manager')
 
     def closeEvent(self, event):
+        question = 'Вы уверены, что хотите выйти?'
+        export_jobs = ExportJobManager.shared()
+        if export_jobs.jobs(active_only=True):
+            question += '\nНезавершенные экспорты будут отменены.'
         reply = QMessageBox.question(
-            self, 'Выход', 'Вы уверены, что хотите выйти?',
+            self, 'Выход', question,
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
+            if self.notification_signals is not None:
+                self.notification_signals.detach()
+            self.export_status.detach()
+            export_jobs.shutdown()
             event.accept()
         else:
             event.ignore()
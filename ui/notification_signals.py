@@ -0,0 +1,25 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class NotificationSignals(QObject):
+    """
+    Передает результаты фонового планировщика уведомлений в поток интерфейса
+    """
+
+    checks_finished = pyqtSignal(dict)
+    checks_failed = pyqtSignal(str)
+
+    def __init__(self, scheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        scheduler.add_listener(self._on_results)
+
+    def _on_results(self, results):
+        # Вызывается в потоке планировщика; сигналы доставляются в поток объекта
+        if results.get('error'):
+            self.checks_failed.emit(results['error'])
+        else:
+            self.checks_finished.emit(dict(results))
+
+    def detach(self):
+        self.scheduler.remove_listener(self._on_results)
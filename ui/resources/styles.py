@@ -67,8 +67,8 @@ COLORS = {
 }
 
 try:
-    from ui.resources.theme_manager import get_stylesheet, build_palette, sync_styles_module
-    GLOBAL_STYLE = get_stylesheet()
-    sync_styles_module(build_palette())
+    from ui.resources.theme_manager import compile_theme, sync_styles_module
+    _palette, GLOBAL_STYLE = compile_theme()
+    sync_styles_module(_palette, GLOBAL_STYLE)
 except Exception:
     pass
@@ -1,13 +1,13 @@
 """Настройка и обновление таблиц при смене темы."""
 
-from PyQt5.QtWidgets import QTableWidget, QHeaderView, QAbstractItemView
+from PyQt5.QtWidgets import QTableWidget, QTableView, QHeaderView, QAbstractItemView
 from PyQt5.QtGui import QColor, QBrush
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSortFilterProxyModel
 
 from ui.resources.theme_manager import current_palette
 
 
-def configure_table(table: QTableWidget):
+def configure_table(table: QTableView):
     """Единый современный вид таблиц."""
     table.setObjectName('data_table')
     table.setShowGrid(False)
@@ -23,7 +23,7 @@ def configure_table(table: QTableWidget):
     table.setWordWrap(False)
 
 
-def _text_color():
+def text_color():
     return QColor(current_palette()['text_primary'])
 
 
@@ -31,7 +31,7 @@ def style_item(item, bg=None):
     """Задаёт цвет текста и опционально фон ячейки."""
     if item is None:
         return
-    item.setForeground(QBrush(_text_color()))
+    item.setForeground(QBrush(text_color()))
     if bg is not None:
         item.setBackground(QColor(bg))
 
@@ -46,48 +46,30 @@ def task_status_backgrounds():
     }
 
 
-def apply_task_row_colors(table: QTableWidget, status_col=4, num_cols=7):
-    """Подсветка строк задач по статусу (тема-зависимые цвета)."""
-    colors = task_status_backgrounds()
-    fg = _text_color()
-    for row in range(table.rowCount()):
-        status_item = table.item(row, status_col)
-        status = status_item.text() if status_item else ''
-        bg = colors.get(status)
-        for col in range(num_cols):
-            item = table.item(row, col)
-            if item:
-                item.setForeground(QBrush(fg))
-                if bg:
-                    item.setBackground(QColor(bg))
-
-
-def refresh_table_theme(table: QTableWidget, status_col=None, num_cols=None):
+def refresh_table_theme(table: QTableWidget):
     """Сбрасывает цвет текста ячеек после смены темы."""
     if table is None:
         return
-    fg = _text_color()
-    cols = num_cols or table.columnCount()
+    fg = text_color()
     for row in range(table.rowCount()):
-        for col in range(cols):
+        for col in range(table.columnCount()):
             item = table.item(row, col)
             if item:
                 item.setForeground(QBrush(fg))
-    if status_col is not None and num_cols is not None:
-        apply_task_row_colors(table, status_col, num_cols)
 
 
 def refresh_all_tables(root):
     """Обновляет все таблицы в дереве виджетов."""
-    for table in root.findChildren(QTableWidget):
-        if table.property('task_status_col') is not None:
-            refresh_table_theme(
-                table,
-                status_col=table.property('task_status_col'),
-                num_cols=table.property('task_num_cols'),
-            )
-        else:
+    for table in root.findChildren(QTableView):
+        if isinstance(table, QTableWidget):
             refresh_table_theme(table)
+            continue
+        # Модели с ленивыми цветами пересчитывают только кисти
+        model = table.model()
+        if isinstance(model, QSortFilterProxyModel):
+            model = model.sourceModel()
+        if hasattr(model, 'refresh_theme'):
+            model.refresh_theme()
 
 
 def unhide_all_rows(table: QTableWidget):
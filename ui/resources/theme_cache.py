@@ -0,0 +1,128 @@
+"""Кэш скомпилированных тем: палитра и таблица стилей по параметрам темы."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def source_signature(*paths):
+    """
+    Подпись исходников сборки темы
+
+    Сохраненные темы действительны, только пока не менялись модули, которые
+    их строят. Если файлы недоступны (собранное приложение), возвращает None.
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            with open(path, 'rb') as source:
+                digest.update(source.read())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+class ThemeCache:
+    """
+    Скомпилированные темы с сохранением на диск
+
+    Ключ — кортеж параметров, от которых зависит результат сборки,
+    значение — (палитра, таблица стилей). Число тем ограничено (LRU).
+    Файл читается при первом обращении и переписывается целиком после
+    добавления темы; файл с другой подписью исходников не используется.
+    """
+    DEFAULT_MAX_ENTRIES = 16
+    FORMAT = 1
+
+    def __init__(self, path=None, signature=None, max_entries=None):
+        """
+        Args:
+            path: Файл кэша (None — только в памяти)
+            signature: Подпись исходников сборки (см. source_signature)
+            max_entries: Предел числа тем
+        """
+        self.path = path if signature is not None else None
+        self.signature = signature
+        self.max_entries = self.DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        self._loaded = True
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if data.get('format') != self.FORMAT or data.get('signature') != self.signature:
+            return
+        for entry in data.get('themes', [])[-self.max_entries:]:
+            try:
+                self._entries[tuple(entry['key'])] = (entry['palette'], entry['stylesheet'])
+            except (KeyError, TypeError):
+                continue
+
+    def _save(self):
+        if not self.path:
+            return
+        data = {
+            'format': self.FORMAT,
+            'signature': self.signature,
+            'themes': [
+                {'key': list(key), 'palette': palette, 'stylesheet': stylesheet}
+                for key, (palette, stylesheet) in self._entries.items()
+            ],
+        }
+        temp_path = self.path + '.part'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(data, cache_file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def get(self, key):
+        """
+        Returns:
+            tuple: (палитра, таблица стилей) или None
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, palette, stylesheet):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._entries[key] = (palette, stylesheet)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            if self.path:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
@@ -1,14 +1,28 @@
 """Управление темой: светлая/тёмная, акцент, фон."""
 
-from PyQt5.QtCore import QSettings
+import os
+
+from PyQt5.QtCore import Qt, QSettings, QObject, QEvent
 from PyQt5.QtGui import QFont, QColor
 
+from paths import THEME_CACHE_PATH
 from ui.resources.style_builder import build_stylesheet
+from ui.resources.theme_cache import ThemeCache, source_signature
 
 ORG = 'KABAN'
 APP = 'KABAN:manager'
 
 _current_palette = None
+_current_stylesheet = None
+
+# Сборка темы зависит только от этих модулей: их правка сбрасывает кэш на диске
+_theme_cache = ThemeCache(
+    THEME_CACHE_PATH,
+    signature=source_signature(
+        os.path.abspath(__file__),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style_builder.py'),
+    ),
+)
 
 LIGHT_DEFAULTS = {
     'bg_main': '#F4F6FA',
@@ -171,12 +185,41 @@ def build_palette(config=None):
     return p
 
 
+def theme_key(config):
+    """
+    Ключ скомпилированной темы
+
+    Размер шрифта в ключ не входит: таблица стилей задает размеры в px,
+    а шрифт приложения выставляется отдельно через setFont.
+    """
+    accent = config['accent'] if QColor(config['accent']).isValid() else '#2FC6F6'
+    return (config['theme'], accent.lower(), (config['bg_main'] or '').lower())
+
+
+def compile_theme(config=None):
+    """
+    Палитра и таблица стилей темы (из кэша, если тема уже собиралась)
+
+    Returns:
+        tuple: (палитра, таблица стилей)
+    """
+    config = config or get_config()
+    key = theme_key(config)
+    cached = _theme_cache.get(key)
+    if cached is not None:
+        return cached
+    palette = build_palette(config)
+    stylesheet = build_stylesheet(palette)
+    _theme_cache.put(key, palette, stylesheet)
+    return palette, stylesheet
+
+
 def get_stylesheet(config=None):
-    return build_stylesheet(build_palette(config))
+    return compile_theme(config)[1]
 
 
 def get_login_styles(config=None):
-    p = build_palette(config)
+    p = compile_theme(config)[0]
     return {
         'gradient': (
             f'qlineargradient(x1:0, y1:0, x2:0, y2:1, '
@@ -194,15 +237,53 @@ def get_login_styles(config=None):
 
 
 def apply_theme(app, config=None):
-    global _current_palette
+    global _current_palette, _current_stylesheet
     config = config or get_config()
-    _current_palette = build_palette(config)
-    app.setFont(QFont('Segoe UI', config['font_size']))
-    stylesheet = build_stylesheet(_current_palette)
+    palette, stylesheet = compile_theme(config)
+    font = QFont('Segoe UI', config['font_size'])
+    if app.font() != font:
+        app.setFont(font)
+    # Повторная установка той же таблицы стилей заново полирует все виджеты
+    if stylesheet == _current_stylesheet:
+        return palette
+    _current_palette = palette
+    _current_stylesheet = stylesheet
     app.setStyleSheet(stylesheet)
-    sync_styles_module(_current_palette)
+    sync_styles_module(palette, stylesheet)
     refresh_ui_widgets(app)
-    return _current_palette
+    return palette
+
+
+class _RestyleOnShow(QObject):
+    """
+    Откладывает обновление цветов виджета до его показа
+    """
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.refresh = None
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Show and self.refresh is not None:
+            refresh, self.refresh = self.refresh, None
+            refresh()
+        return False
+
+
+def restyle_when_visible(widget, refresh):
+    """
+    Вызывает refresh сейчас, если виджет виден, иначе — при его показе
+
+    Повторные вызовы до показа заменяют отложенное обновление, так что
+    при нескольких сменах темы скрытый виджет обновится один раз.
+    """
+    if widget.isVisible():
+        refresh()
+        return
+    restyler = widget.findChild(_RestyleOnShow, '', Qt.FindDirectChildrenOnly)
+    if restyler is None:
+        restyler = _RestyleOnShow(widget)
+    restyler.refresh = refresh
 
 
 def refresh_ui_widgets(app=None):
@@ -213,19 +294,21 @@ def refresh_ui_widgets(app=None):
         return
     from ui.resources.table_helper import refresh_all_tables
     for widget in app.topLevelWidgets():
-        refresh_all_tables(widget)
         if type(widget).__name__ == 'MainWindow' and hasattr(widget, 'apply_theme'):
-            widget.apply_theme()
+            refresh = widget.apply_theme
+        else:
+            refresh = lambda widget=widget: refresh_all_tables(widget)
+        restyle_when_visible(widget, refresh)
 
 
 def current_palette():
     global _current_palette
     if _current_palette is None:
-        _current_palette = build_palette()
+        _current_palette = compile_theme()[0]
     return _current_palette
 
 
-def sync_styles_module(palette):
+def sync_styles_module(palette, stylesheet=None):
     """Синхронизирует ui.resources.styles для кода, импортирующего константы."""
     import ui.resources.styles as styles
     mapping = {
@@ -260,7 +343,7 @@ def sync_styles_module(palette):
     for attr, key in mapping.items():
         if key in palette:
             setattr(styles, attr, palette[key])
-    styles.GLOBAL_STYLE = build_stylesheet(palette)
+    styles.GLOBAL_STYLE = stylesheet if stylesheet is not None else build_stylesheet(palette)
     styles.COLORS = {k: palette.get(k, v) for k, v in styles.COLORS.items() if k in palette or True}
     styles.COLORS = {
         'primary': palette['primary'],
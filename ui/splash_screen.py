@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QFrame
 from PyQt5.QtGui import QFont, QPixmap, QColor
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 
 from ui.resources.theme_manager import current_palette, get_login_styles, get_config
 
@@ -14,18 +14,7 @@ class SplashScreen(QWidget):
         self._build()
         self._center()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress)
         self.progress_value = 0
-        self.loading_messages = [
-            'Инициализация приложения...',
-            'Подключение к базе данных...',
-            'Загрузка компонентов интерфейса...',
-            'Проверка уведомлений...',
-            'Загрузка настроек...',
-            'Подготовка рабочего пространства...',
-            'Почти готово...',
-        ]
 
     def _center(self):
         from PyQt5.QtWidgets import QApplication
@@ -98,16 +87,20 @@ class SplashScreen(QWidget):
         self.version_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.version_label)
 
-    def start_progress(self):
-        self.timer.start(100)
+    def set_step(self, number, total, message):
+        """
+        Показывает начало шага подготовки number из total
+        """
+        self.status_label.setText(message)
+        self.set_progress(number * 100 // max(total, 1))
 
-    def update_progress(self):
-        self.progress_value += 1
+    def set_progress(self, value):
+        self.progress_value = max(0, min(100, value))
         self.progress_bar.setValue(self.progress_value)
-        message_index = min(len(self.loading_messages) - 1, self.progress_value // 15)
-        self.status_label.setText(self.loading_messages[message_index])
-        if self.progress_value >= 100:
-            self.timer.stop()
+
+    def set_ready(self):
+        self.status_label.setText('Готово')
+        self.set_progress(100)
 
     def show(self):
         super().show()
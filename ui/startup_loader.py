@@ -0,0 +1,62 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from models import DBManager
+from startup_trace import trace
+
+
+class _StartupSignals(QObject):
+    step_started = pyqtSignal(int, int, str)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class _StartupJob(QRunnable):
+    """
+    Выполняет шаги подготовки в рабочем потоке
+    """
+    def __init__(self, steps, signals):
+        super().__init__()
+        self.steps = steps
+        self.signals = signals
+
+    def run(self):
+        try:
+            for number, (message, fn) in enumerate(self.steps):
+                self.signals.step_started.emit(number, len(self.steps), message)
+                with trace.span(message.rstrip('.')):
+                    fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            DBManager().release_connection()
+        self.signals.finished.emit()
+
+
+class StartupLoader(QObject):
+    """
+    Подготовка к запуску в фоне
+
+    Шаги (проверка схемы, прогрев кэша) выполняются по очереди в рабочем
+    потоке, пока заставка продолжает отрисовываться; о ходе работы
+    сообщает step_started, о готовности — finished.
+    """
+
+    step_started = pyqtSignal(int, int, str)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, steps, parent=None):
+        """
+        Args:
+            steps: Список (сообщение для заставки, функция без аргументов)
+        """
+        super().__init__(parent)
+        self.steps = list(steps)
+        self._signals = _StartupSignals(self)
+        self._signals.step_started.connect(self.step_started)
+        self._signals.finished.connect(self.finished)
+        self._signals.failed.connect(self.failed)
+
+    def start(self):
+        QThreadPool.globalInstance().start(_StartupJob(self.steps, self._signals))
@@ -2,10 +2,11 @@ from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                              QTableWidgetItem, QPushButton, QMessageBox,
                              QFormLayout, QLineEdit, QComboBox, QCheckBox,
-                             QInputDialog, QShortcut)
+                             QInputDialog, QShortcut, QLabel)
 
 from PyQt5.QtCore import Qt
 from controllers.auth_controller import AuthController
+from models import DBManager
 from ui.widgets.tab_page import TabPage
 from ui.resources.icon_helper import get_icon
 from ui.resources.table_helper import configure_table, refresh_table_theme
@@ -173,6 +174,89 @@ class AdminTab(QWidget):
         self.reset_password_shortcut = QShortcut(QKeySequence("Ctrl+P"), self)
         self.reset_password_shortcut.activated.connect(self.reset_password)
 
+        self._init_profiler_ui(layout)
+
+    def _init_profiler_ui(self, layout):
+        """
+        Раздел профилирования SQL: самые затратные запросы
+        """
+        layout.addWidget(QLabel("Профилирование SQL-запросов"))
+
+        self.queries_table = QTableWidget()
+        configure_table(self.queries_table)
+        self.queries_table.setColumnCount(9)
+        self.queries_table.setHorizontalHeaderLabels([
+            "Запрос", "Место вызова", "Вызовов", "Всего, мс", "Среднее, мс",
+            "p95, мс", "Макс., мс", "Строк", "Медленных"
+        ])
+        self.queries_table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.queries_table)
+
+        profiler_layout = QHBoxLayout()
+        self.profiling_checkbox = QCheckBox("Включить профилирование")
+        self.profiling_checkbox.setChecked(DBManager().profiler is not None)
+        self.profiling_checkbox.toggled.connect(self.toggle_profiling)
+        self.refresh_queries_button = QPushButton("Обновить статистику")
+        self.refresh_queries_button.setIcon(get_icon('refresh'))
+        self.refresh_queries_button.clicked.connect(self.load_query_stats)
+        self.reset_queries_button = QPushButton("Сбросить")
+        self.reset_queries_button.clicked.connect(self.reset_query_stats)
+
+        profiler_layout.addWidget(self.profiling_checkbox)
+        profiler_layout.addStretch()
+        profiler_layout.addWidget(self.refresh_queries_button)
+        profiler_layout.addWidget(self.reset_queries_button)
+        layout.addLayout(profiler_layout)
+
+        self.load_query_stats()
+
+    def toggle_profiling(self, enabled):
+        """
+        Включение и выключение профилирования запросов
+        """
+        db_manager = DBManager()
+        if enabled:
+            db_manager.enable_profiling()
+        else:
+            db_manager.disable_profiling()
+        self.load_query_stats()
+
+    def load_query_stats(self):
+        """
+        Загрузка статистики запросов (по убыванию суммарного времени)
+        """
+        profiler = DBManager().profiler
+        statements = profiler.top_offenders(50) if profiler else []
+
+        self.queries_table.setRowCount(0)
+        for row, stats in enumerate(statements):
+            self.queries_table.insertRow(row)
+            call_site = next(iter(stats['call_sites']), '')
+            if len(stats['call_sites']) > 1:
+                call_site += f" (+{len(stats['call_sites']) - 1})"
+            values = [
+                stats['sql'], call_site, str(stats['count']),
+                f"{stats['total_ms']:.1f}", f"{stats['mean_ms']:.2f}", f"{stats['p95_ms']:.1f}",
+                f"{stats['max_ms']:.1f}", str(stats['rows']), str(stats['slow'])
+            ]
+            for col, value in enumerate(values):
+                self.queries_table.setItem(row, col, QTableWidgetItem(value))
+
+            # План запроса и все места вызова — во всплывающей подсказке
+            tooltip = stats['sql']
+            if stats['plan']:
+                tooltip += "\n\n" + "\n".join(stats['plan'])
+            tooltip += "\n\n" + "\n".join(f"{site}: {count}" for site, count in stats['call_sites'].items())
+            self.queries_table.item(row, 0).setToolTip(tooltip)
+
+        refresh_table_theme(self.queries_table)
+
+    def reset_query_stats(self):
+        profiler = DBManager().profiler
+        if profiler:
+            profiler.reset()
+        self.load_query_stats()
+
     def load_users(self):
         """
         Загрузка списка пользователей
@@ -295,4 +379,5 @@ class AdminTab(QWidget):
         """
         Обновление данных
         """
-        self.load_users()
\ No newline at end of file
+        self.load_users()
+        self.load_query_stats()
\ No newline at end of file
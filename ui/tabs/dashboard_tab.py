@@ -7,6 +7,9 @@ from PyQt5.QtCore import Qt, QSize
 from controllers import ProjectController, TaskController, DeveloperController, NotificationController
 from ui.dialogs.task_dialog import TaskDialog
 from ui.resources.icon_helper import get_icon
+from ui.async_loader import AsyncLoader
+from ui.widgets.loading_overlay import LoadingOverlay
+from ui.kanban_diff import group_by_status, card_signature, diff_column
 from ui.resources.styles import (
     STATUS_NEW, STATUS_NEW_BG, STATUS_PROGRESS, STATUS_PROGRESS_BG,
     STATUS_REVIEW, STATUS_REVIEW_BG, STATUS_DONE, STATUS_DONE_BG,
@@ -17,7 +20,6 @@ from ui.resources.styles import (
 class KanbanCard(QFrame):
     def __init__(self, task, status_color, parent=None):
         super().__init__(parent)
-        self.task = task
         self.setObjectName("kanban_card")
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(90)
@@ -33,47 +35,78 @@ class KanbanCard(QFrame):
         layout.setContentsMargins(14, 12, 14, 12)
         layout.setSpacing(6)
 
-        project_name = getattr(task, 'project_name', 'Проект')
-        project_lbl = QLabel(project_name)
-        project_lbl.setObjectName("card_project")
-        layout.addWidget(project_lbl)
+        self.project_lbl = QLabel()
+        self.project_lbl.setObjectName("card_project")
+        layout.addWidget(self.project_lbl)
 
-        desc = task.description if len(task.description) <= 80 else task.description[:77] + '...'
-        title_lbl = QLabel(desc)
-        title_lbl.setObjectName("card_title")
-        title_lbl.setWordWrap(True)
-        layout.addWidget(title_lbl)
+        self.title_lbl = QLabel()
+        self.title_lbl.setObjectName("card_title")
+        self.title_lbl.setWordWrap(True)
+        layout.addWidget(self.title_lbl)
 
         bottom = QHBoxLayout()
         bottom.setSpacing(8)
 
-        dev_name = getattr(task, 'developer_name', 'Не назначен')
-        dev_lbl = QLabel(dev_name)
-        dev_lbl.setObjectName("card_developer")
-        bottom.addWidget(dev_lbl)
+        self.dev_lbl = QLabel()
+        self.dev_lbl.setObjectName("card_developer")
+        bottom.addWidget(self.dev_lbl)
 
         bottom.addStretch()
 
-        hours = getattr(task, 'hours_worked', 0) or 0
-        hours_lbl = QLabel(f"{hours} ч")
-        hours_lbl.setObjectName("card_hours")
-        bottom.addWidget(hours_lbl)
+        self.hours_lbl = QLabel()
+        self.hours_lbl.setObjectName("card_hours")
+        bottom.addWidget(self.hours_lbl)
 
         layout.addLayout(bottom)
 
+        self.date_lbl = QLabel()
+        self.date_lbl.setObjectName("card_date")
+        layout.addWidget(self.date_lbl)
+
+        self.set_task(task)
+
+    def set_task(self, task):
+        """
+        Обновляет надписи карточки без пересоздания виджетов
+        """
+        self.task = task
+        self.project_lbl.setText(getattr(task, 'project_name', None) or 'Проект')
+
+        desc = task.description if len(task.description) <= 80 else task.description[:77] + '...'
+        self.title_lbl.setText(desc)
+
+        self.dev_lbl.setText(getattr(task, 'developer_name', None) or 'Не назначен')
+
+        hours = getattr(task, 'hours_worked', 0) or 0
+        self.hours_lbl.setText(f"{hours} ч")
+
         date_val = getattr(task, 'updated_at', '') or getattr(task, 'created_at', '')
-        if date_val:
-            date_short = str(date_val)[:10]
-            date_lbl = QLabel(date_short)
-            date_lbl.setObjectName("card_date")
-            layout.addWidget(date_lbl)
+        self.date_lbl.setText(str(date_val)[:10] if date_val else '')
+        self.date_lbl.setVisible(bool(date_val))
 
 
 class KanbanColumn(QFrame):
+    """
+    Колонка Kanban-доски
+
+    Карточки привязаны к ID задач: при новом снимке (set_tasks) создаются
+    карточки только новых задач, измененные обновляются на месте, пропавшие
+    удаляются. Карточки создаются порциями — следующая порция появляется
+    при прокрутке колонки к концу.
+    """
+    RENDER_BATCH = 30
+    # Запас до конца прокрутки (px), при котором подгружается следующая порция
+    RENDER_MARGIN = 200
+
     def __init__(self, title, tasks_list, color, bg_color, object_suffix,
                  on_add_task=None, parent=None):
         super().__init__(parent)
         self._on_add_task = on_add_task
+        self.color = color
+        self._tasks = []
+        self._cards = {}
+        self._signatures = {}
+        self._rendered = 0
         self.setObjectName(f"kanban_column_{object_suffix}")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumWidth(260)
@@ -97,11 +130,11 @@ class KanbanColumn(QFrame):
 
         header.addStretch()
 
-        count_lbl = QLabel(str(len(tasks_list)))
-        count_lbl.setObjectName(f"kanban_col_count_{object_suffix}")
-        count_lbl.setAlignment(Qt.AlignCenter)
-        count_lbl.setFixedHeight(22)
-        header.addWidget(count_lbl)
+        self.count_lbl = QLabel("0")
+        self.count_lbl.setObjectName(f"kanban_col_count_{object_suffix}")
+        self.count_lbl.setAlignment(Qt.AlignCenter)
+        self.count_lbl.setFixedHeight(22)
+        header.addWidget(self.count_lbl)
 
         layout.addLayout(header)
 
@@ -116,29 +149,102 @@ class KanbanColumn(QFrame):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        scroll_bar = scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._render_more_if_needed)
+        scroll_bar.rangeChanged.connect(self._render_more_if_needed)
+        self._scroll = scroll
 
         cards_widget = QWidget()
         cards_widget.setStyleSheet("background: transparent;")
-        cards_layout = QVBoxLayout(cards_widget)
-        cards_layout.setContentsMargins(0, 4, 0, 4)
-        cards_layout.setSpacing(10)
-
-        for task in tasks_list:
-            card = KanbanCard(task, color)
-            cards_layout.addWidget(card)
+        self._cards_layout = QVBoxLayout(cards_widget)
+        self._cards_layout.setContentsMargins(0, 4, 0, 4)
+        self._cards_layout.setSpacing(10)
 
+        # Карточки вставляются перед кнопкой добавления
         add_btn = QPushButton("+ Добавить задачу")
         add_btn.setObjectName("kanban_add")
         add_btn.setFixedHeight(42)
         add_btn.setCursor(Qt.PointingHandCursor)
         if self._on_add_task:
             add_btn.clicked.connect(self._on_add_task)
-        cards_layout.addWidget(add_btn)
+        self._cards_layout.addWidget(add_btn)
 
-        cards_layout.addStretch()
+        self._cards_layout.addStretch()
         scroll.setWidget(cards_widget)
         layout.addWidget(scroll, stretch=1)
 
+        self.set_tasks(tasks_list)
+
+    def release_missing(self, tasks_list):
+        """
+        Снимает с колонки карточки задач, которых нет в новом снимке
+
+        Returns:
+            dict: ID задачи -> карточка; карточку может забрать другая колонка
+        """
+        task_ids = {task.id for task in tasks_list}
+        released = {}
+        for task_id in [task_id for task_id in self._cards if task_id not in task_ids]:
+            card = self._cards.pop(task_id)
+            del self._signatures[task_id]
+            self._cards_layout.removeWidget(card)
+            card.hide()
+            released[task_id] = card
+        return released
+
+    def set_tasks(self, tasks_list, spare_cards=None):
+        """
+        Показывает новый снимок задач колонки
+
+        Args:
+            tasks_list: Задачи колонки в порядке показа
+            spare_cards: dict ID задачи -> карточка, снятая с другой колонки
+                (см. release_missing); использованные карточки из него удаляются
+        """
+        self._tasks = list(tasks_list)
+        self.count_lbl.setText(str(len(self._tasks)))
+        limit = min(len(self._tasks), max(self._rendered, self.RENDER_BATCH))
+        self._render(limit, spare_cards)
+
+    def _render(self, limit, spare_cards=None):
+        visible = self._tasks[:limit]
+        diff = diff_column(self._signatures, visible)
+
+        for task_id in diff.removed:
+            card = self._cards.pop(task_id)
+            del self._signatures[task_id]
+            self._cards_layout.removeWidget(card)
+            card.deleteLater()
+
+        changed = set(diff.changed)
+        for index, task in enumerate(visible):
+            card = self._cards.get(task.id)
+            if card is None:
+                card = spare_cards.pop(task.id, None) if spare_cards else None
+                if card is None:
+                    card = KanbanCard(task, self.color)
+                else:
+                    card.set_task(task)
+                self._cards[task.id] = card
+                self._signatures[task.id] = card_signature(task)
+                self._cards_layout.insertWidget(index, card)
+                card.show()
+                continue
+            if task.id in changed:
+                card.set_task(task)
+                self._signatures[task.id] = card_signature(task)
+            if self._cards_layout.itemAt(index).widget() is not card:
+                self._cards_layout.removeWidget(card)
+                self._cards_layout.insertWidget(index, card)
+        self._rendered = limit
+
+    def _render_more_if_needed(self, *args):
+        if self._rendered >= len(self._tasks):
+            return
+        scroll_bar = self._scroll.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - self.RENDER_MARGIN:
+            self._render(min(len(self._tasks), self._rendered + self.RENDER_BATCH))
+
 
 class StatCard(QFrame):
 
@@ -177,23 +283,28 @@ class StatCard(QFrame):
         text_layout = QVBoxLayout()
         text_layout.setSpacing(2)
 
-        val_lbl = QLabel(str(value))
-        val_lbl.setObjectName("stat_value")
-        val_lbl.setStyleSheet(f"color: {color};")
-        text_layout.addWidget(val_lbl)
+        self.val_lbl = QLabel(str(value))
+        self.val_lbl.setObjectName("stat_value")
+        self.val_lbl.setStyleSheet(f"color: {color};")
+        text_layout.addWidget(self.val_lbl)
 
         title_lbl = QLabel(title)
         title_lbl.setObjectName("stat_title")
         text_layout.addWidget(title_lbl)
 
-        if subtitle:
-            sub_lbl = QLabel(subtitle)
-            sub_lbl.setObjectName("stat_subtitle")
-            text_layout.addWidget(sub_lbl)
+        self.sub_lbl = QLabel(subtitle)
+        self.sub_lbl.setObjectName("stat_subtitle")
+        self.sub_lbl.setVisible(bool(subtitle))
+        text_layout.addWidget(self.sub_lbl)
 
         layout.addLayout(text_layout)
         layout.addStretch()
 
+    def set_value(self, value, subtitle=""):
+        self.val_lbl.setText(str(value))
+        self.sub_lbl.setText(subtitle)
+        self.sub_lbl.setVisible(bool(subtitle))
+
 
 class DashboardTab(QWidget):
 
@@ -211,6 +322,9 @@ class DashboardTab(QWidget):
         self.task_controller = TaskController()
         self.developer_controller = DeveloperController()
         self.notification_controller = NotificationController()
+        self.loader = AsyncLoader(self)
+        self._stat_cards = []
+        self._columns = {}
         self.init_ui()
 
     def _load_tasks(self):
@@ -342,6 +456,7 @@ class DashboardTab(QWidget):
 
         scroll_area.setWidget(content)
         main_layout.addWidget(scroll_area, stretch=1)
+        self.loading_overlay = LoadingOverlay(self._kanban_host)
 
         self._reload_dashboard()
 
@@ -357,49 +472,96 @@ class DashboardTab(QWidget):
             if sub:
                 self._clear_layout(sub)
 
-    def _reload_dashboard(self):
-        self._clear_layout(self._stats_layout)
-        for card in self._build_stat_cards():
-            self._stats_layout.addWidget(card)
-
-        self._clear_layout(self._kanban_layout)
-        all_tasks = self._load_tasks()
-        for status_info in self.KANBAN_STATUSES:
-            filtered = [
-                t for t in all_tasks
-                if getattr(t, 'status', '').lower() == status_info['key']
-            ]
-            status_key = status_info['key']
-            column = KanbanColumn(
-                title=status_info['title'],
-                tasks_list=filtered,
-                color=status_info['color'],
-                bg_color=status_info['bg'],
-                object_suffix=status_info['suffix'],
-                on_add_task=lambda checked=False, s=status_key: self.add_task(s),
-            )
-            self._kanban_layout.addWidget(column)
-
-        if self._notifications_layout is not None:
-            self._clear_layout(self._notifications_layout)
-            self._populate_notifications(self._notifications_layout)
-
-    def _build_stat_cards(self):
-        all_tasks = self._load_tasks()
+    def _fetch_dashboard(self, run_checks=False):
+        # Выполняется в рабочем потоке
+        if run_checks:
+            self.notification_controller.run_all_checks()
         projects_result = self._load_projects()
-        projects = projects_result.get('data', []) if projects_result.get('success') else []
+        return {
+            'tasks': self._load_tasks(),
+            'projects': projects_result.get('data', []) if projects_result.get('success') else []
+        }
+
+    def _reload_dashboard(self, run_checks=False):
+        self.loading_overlay.set_loading(True)
+        self.loader.request(
+            'dashboard', self._fetch_dashboard, run_checks,
+            on_result=self._show_dashboard,
+            on_error=lambda error: self.loading_overlay.set_loading(False),
+        )
 
-        new_count = len([t for t in all_tasks if getattr(t, 'status', '') == 'новая'])
-        progress_count = len([t for t in all_tasks if getattr(t, 'status', '') == 'в работе'])
-        done_count = len([t for t in all_tasks if getattr(t, 'status', '') == 'завершено'])
+    def _show_dashboard(self, data):
+        all_tasks = data['tasks']
+        # Задачи раскладываются по статусам один раз — для карточек статистики и доски
+        groups = group_by_status(all_tasks, [status_info['key'] for status_info in self.KANBAN_STATUSES])
+        self._show_stat_cards(all_tasks, data['projects'], groups)
+        self._show_board(groups)
+
+        self.refresh_notifications()
+        self.loading_overlay.set_loading(False)
+
+    def _show_board(self, groups):
+        """
+        Обновляет доску по новому снимку задач
+
+        Колонки создаются один раз. Карточки задач, сменивших статус,
+        переносятся в новую колонку, а не создаются заново.
+        """
+        if not self._columns:
+            for status_info in self.KANBAN_STATUSES:
+                status_key = status_info['key']
+                column = KanbanColumn(
+                    title=status_info['title'],
+                    tasks_list=groups[status_key],
+                    color=status_info['color'],
+                    bg_color=status_info['bg'],
+                    object_suffix=status_info['suffix'],
+                    on_add_task=lambda checked=False, s=status_key: self.add_task(s),
+                )
+                self._columns[status_key] = column
+                self._kanban_layout.addWidget(column)
+            return
 
+        released = {}
+        for status_key, column in self._columns.items():
+            released.update(column.release_missing(groups[status_key]))
+        for status_key, column in self._columns.items():
+            column.set_tasks(groups[status_key], released)
+        for card in released.values():
+            card.deleteLater()
+
+    def _show_stat_cards(self, all_tasks, projects, groups):
+        values = [
+            (len(projects), "Всего активных"),
+            (len(all_tasks), f"Новых: {len(groups['новая'])}"),
+            (len(groups['в работе']), "Активные задачи"),
+            (len(groups['завершено']), "Выполненных"),
+        ]
+        if not self._stat_cards:
+            self._stat_cards = self._build_stat_cards(values)
+            for card in self._stat_cards:
+                self._stats_layout.addWidget(card)
+            return
+        for card, (value, subtitle) in zip(self._stat_cards, values):
+            card.set_value(value, subtitle)
+
+    def _build_stat_cards(self, values):
+        specs = [
+            ("Проекты", PRIMARY_COLOR, "П"),
+            ("Всего задач", "#6366F1", "З"),
+            ("В работе", STATUS_PROGRESS, "Р"),
+            ("Завершено", STATUS_DONE, "✓"),
+        ]
         return [
-            StatCard("Проекты", len(projects), PRIMARY_COLOR, "П", "Всего активных"),
-            StatCard("Всего задач", len(all_tasks), "#6366F1", "З", f"Новых: {new_count}"),
-            StatCard("В работе", progress_count, STATUS_PROGRESS, "Р", "Активные задачи"),
-            StatCard("Завершено", done_count, STATUS_DONE, "✓", "Выполненных"),
+            StatCard(title, value, color, icon_text, subtitle)
+            for (title, color, icon_text), (value, subtitle) in zip(specs, values)
         ]
 
+    def refresh_notifications(self):
+        if self._notifications_layout is not None:
+            self._clear_layout(self._notifications_layout)
+            self._populate_notifications(self._notifications_layout)
+
     def _populate_notifications(self, layout):
         header_layout = QHBoxLayout()
         title_label = QLabel("Уведомления")
@@ -510,15 +672,8 @@ class DashboardTab(QWidget):
             self._apply_add_task_btn_style()
 
     def refresh_data(self):
-        try:
-            self.notification_controller.run_all_checks()
-            self.project_controller = ProjectController()
-            self.task_controller = TaskController()
-            self.developer_controller = DeveloperController()
-            self.notification_controller = NotificationController()
-            self._reload_dashboard()
-        except Exception:
-            pass
+        # Проверки уведомлений выполняются в рабочем потоке вместе с загрузкой
+        self._reload_dashboard(run_checks=True)
 
     def create_notifications_widget(self):
         frame = QFrame()
@@ -9,6 +9,8 @@ from ui.widgets.tab_page import TabPage
 from ui.widgets.page_header import FilterPanel
 from ui.resources.icon_helper import get_icon
 from ui.resources.table_helper import configure_table, refresh_table_theme, unhide_all_rows
+from ui.async_loader import AsyncLoader
+from ui.widgets.loading_overlay import LoadingOverlay
 
 
 class DevelopersTab(QWidget):
@@ -17,6 +19,7 @@ class DevelopersTab(QWidget):
         self.user = user
         self.developer_controller = DeveloperController()
         self.export_controller = ExportController()
+        self.loader = AsyncLoader(self)
         self.init_ui()
 
     def init_ui(self):
@@ -60,6 +63,7 @@ class DevelopersTab(QWidget):
             self.developers_table.doubleClicked.connect(self.edit_item)
 
             main_layout.addWidget(self.developers_table)
+            self.loading_overlay = LoadingOverlay(self.developers_table)
 
             buttons_layout = QHBoxLayout()
 
@@ -98,10 +102,19 @@ class DevelopersTab(QWidget):
             QMessageBox.critical(self, "Ошибка", f"Не удалось инициализировать диалог: {str(e)}")
 
     def load_developers(self):
-        self.developers_table.setRowCount(0)
-        result = self.developer_controller.get_all_developers()
+        self.loading_overlay.set_loading(True)
+        self.loader.request(
+            'developers', self.developer_controller.get_all_developers,
+            on_result=self._show_developers,
+            on_error=lambda error: self.loading_overlay.set_loading(False),
+        )
 
-        if result['success']:
+    def _show_developers(self, result):
+        try:
+            if not result['success']:
+                return
+
+            self.developers_table.setRowCount(0)
             for row, developer in enumerate(result['data']):
                 self.developers_table.insertRow(row)
 
@@ -117,6 +130,10 @@ class DevelopersTab(QWidget):
 
             refresh_table_theme(self.developers_table)
             unhide_all_rows(self.developers_table)
+            # Строки пришли позже, чем были заданы фильтры
+            self.apply_filters()
+        finally:
+            self.loading_overlay.set_loading(False)
 
     def apply_filters(self):
         search_text = self.search_input.text().lower()
@@ -212,26 +229,26 @@ class DevelopersTab(QWidget):
                 QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def refresh_data(self):
+        # Фильтры применяются после загрузки строк (см. _show_developers)
         self.load_developers()
-        self.apply_filters()
+
+    def _export_filters(self):
+        return dict(
+            search_term=self.search_input.text().strip(),
+            position=self.position_combo.currentData(),
+        )
 
     def export_to_csv(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Сохранить CSV", "", "CSV Files (*.csv);;All Files (*)"
+            self, "Сохранить CSV", "", "CSV Files (*.csv);;CSV gzip (*.csv.gz);;All Files (*)"
         )
         if not file_path:
             return
 
-        headers = ["ID", "ФИО", "Должность", "Ставка в час"]
-        data = []
-        for row in range(self.developers_table.rowCount()):
-            if not self.developers_table.isRowHidden(row):
-                data.append([self.developers_table.item(row, col).text() for col in range(self.developers_table.columnCount())])
-
-        result = self.export_controller.export_data_to_csv(data, headers, file_path)
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        # Выгружаются все строки по текущим фильтрам; экспорт идет в фоне,
+        # ход выполнения показывается в строке состояния главного окна
+        result = self.export_controller.start_query_export('developers', self._export_filters(), 'csv', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def export_to_excel(self):
@@ -241,14 +258,6 @@ class DevelopersTab(QWidget):
         if not file_path:
             return
 
-        headers = ["ID", "ФИО", "Должность", "Ставка в час"]
-        data = []
-        for row in range(self.developers_table.rowCount()):
-            if not self.developers_table.isRowHidden(row):
-                data.append([self.developers_table.item(row, col).text() for col in range(self.developers_table.columnCount())])
-
-        result = self.export_controller.export_data_to_excel(data, headers, file_path, "Разработчики")
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        result = self.export_controller.start_query_export('developers', self._export_filters(), 'excel', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
@@ -10,6 +10,8 @@ from ui.widgets.page_header import FilterPanel
 from ui.resources.icon_helper import get_icon
 from ui.resources.table_helper import configure_table, refresh_table_theme, unhide_all_rows
 from ui.resources.combo_helper import reload_combo
+from ui.async_loader import AsyncLoader
+from ui.widgets.loading_overlay import LoadingOverlay
 
 
 class ProjectsTab(QWidget):
@@ -18,6 +20,7 @@ class ProjectsTab(QWidget):
         self.user = user
         self.project_controller = ProjectController()
         self.export_controller = ExportController()
+        self.loader = AsyncLoader(self)
         self.init_ui()
 
     def init_ui(self):
@@ -69,6 +72,7 @@ class ProjectsTab(QWidget):
         self.projects_table.doubleClicked.connect(self.edit_item)
 
         main_layout.addWidget(self.projects_table)
+        self.loading_overlay = LoadingOverlay(self.projects_table)
 
         buttons_layout = QHBoxLayout()
 
@@ -104,9 +108,8 @@ class ProjectsTab(QWidget):
 
         self.load_projects()
 
-    def load_projects(self):
-        self.projects_table.setRowCount(0)
-
+    def _fetch_projects(self):
+        # Выполняется в рабочем потоке
         if self.user.role == 'developer':
             from controllers import DeveloperController
             developer_controller = DeveloperController()
@@ -115,15 +118,25 @@ class ProjectsTab(QWidget):
 
             if developer_result['success'] and developer_result['data']:
                 developer = developer_result['data']
-                result = self.project_controller.get_projects_by_developer(developer.id)
-            else:
-                result = {'success': True, 'data': []}
-        else:
-            result = self.project_controller.get_all_projects()
+                return self.project_controller.get_projects_by_developer(developer.id)
+            return {'success': True, 'data': []}
+        return self.project_controller.get_all_projects()
+
+    def load_projects(self):
+        self.loading_overlay.set_loading(True)
+        self.loader.request(
+            'projects', self._fetch_projects,
+            on_result=self._show_projects,
+            on_error=lambda error: self.loading_overlay.set_loading(False),
+        )
 
-        if result['success']:
+    def _show_projects(self, result):
+        try:
+            if not result['success']:
+                return
             projects = result['data']
 
+            self.projects_table.setRowCount(0)
             for row, project in enumerate(projects):
                 self.projects_table.insertRow(row)
 
@@ -145,6 +158,10 @@ class ProjectsTab(QWidget):
             unhide_all_rows(self.projects_table)
 
             self.update_client_filter(projects)
+            # Строки пришли позже, чем были заданы фильтры
+            self.apply_filters()
+        finally:
+            self.loading_overlay.set_loading(False)
 
     def update_client_filter(self, projects):
         clients = sorted({p.client for p in projects if p.client})
@@ -256,26 +273,35 @@ class ProjectsTab(QWidget):
                 QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def refresh_data(self):
+        # Фильтры применяются после загрузки строк (см. _show_projects)
         self.load_projects()
-        self.apply_filters()
+
+    def _export_filters(self):
+        developer_id = None
+        if self.user.role == 'developer':
+            from controllers import DeveloperController
+            developer_result = DeveloperController().get_developer_by_user_id(self.user.id)
+            developer = developer_result['data'] if developer_result['success'] else None
+            developer_id = developer.id if developer else -1
+        return dict(
+            search_term=self.search_input.text().strip(),
+            client=self.client_combo.currentData(),
+            start_date=self.date_from.date().toString("yyyy-MM-dd"),
+            end_date=self.date_to.date().toString("yyyy-MM-dd"),
+            developer_id=developer_id,
+        )
 
     def export_to_csv(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Сохранить CSV", "", "CSV Files (*.csv);;All Files (*)"
+            self, "Сохранить CSV", "", "CSV Files (*.csv);;CSV gzip (*.csv.gz);;All Files (*)"
         )
         if not file_path:
             return
 
-        headers = ["ID", "Название", "Клиент", "Дедлайн", "Бюджет", "Статус"]
-        data = []
-        for row in range(self.projects_table.rowCount()):
-            if not self.projects_table.isRowHidden(row):
-                data.append([self.projects_table.item(row, col).text() for col in range(self.projects_table.columnCount())])
-
-        result = self.export_controller.export_data_to_csv(data, headers, file_path)
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        # Выгружаются все строки по текущим фильтрам; экспорт идет в фоне,
+        # ход выполнения показывается в строке состояния главного окна
+        result = self.export_controller.start_query_export('projects', self._export_filters(), 'csv', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def export_to_excel(self):
@@ -285,14 +311,6 @@ class ProjectsTab(QWidget):
         if not file_path:
             return
 
-        headers = ["ID", "Название", "Клиент", "Дедлайн", "Бюджет", "Статус"]
-        data = []
-        for row in range(self.projects_table.rowCount()):
-            if not self.projects_table.isRowHidden(row):
-                data.append([self.projects_table.item(row, col).text() for col in range(self.projects_table.columnCount())])
-
-        result = self.export_controller.export_data_to_excel(data, headers, file_path, "Проекты")
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        result = self.export_controller.start_query_export('projects', self._export_filters(), 'excel', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
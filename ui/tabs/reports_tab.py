@@ -6,6 +6,7 @@ from PyQt5.QtCore import Qt, QDate
 from controllers import ReportController, ExportController
 from ui.widgets.tab_page import TabPage
 from ui.resources.icon_helper import get_icon
+from ui.async_loader import AsyncLoader
 
 class ReportsTab(QWidget):
     """
@@ -17,6 +18,7 @@ class ReportsTab(QWidget):
         self.report_controller = ReportController()
         self.export_controller = ExportController()
         self.current_report_data = None
+        self.loader = AsyncLoader(self)
         self.init_ui()
     
     def init_ui(self):
@@ -184,9 +186,14 @@ class ReportsTab(QWidget):
         """
         Генерация отчета по просроченным задачам
         """
-        # Получение отчета
-        result = self.report_controller.get_overdue_tasks_report()
-        
+        # Отчет формируется в рабочем потоке
+        self.overdue_report_browser.setHtml("<p>Формирование отчета...</p>")
+        self.loader.request(
+            'report:overdue', self.report_controller.get_overdue_tasks_report,
+            on_result=self._show_overdue_tasks_report,
+        )
+
+    def _show_overdue_tasks_report(self, result):
         if result['success']:
             report_data = result['data']
             self.current_report_data = report_data
@@ -237,9 +244,14 @@ class ReportsTab(QWidget):
         start_date = self.workload_date_from.date().toString("yyyy-MM-dd")
         end_date = self.workload_date_to.date().toString("yyyy-MM-dd")
         
-        # Получение отчета
-        result = self.report_controller.get_developer_workload_report(start_date, end_date)
-        
+        # Отчет формируется в рабочем потоке
+        self.workload_report_browser.setHtml("<p>Формирование отчета...</p>")
+        self.loader.request(
+            'report:workload', self.report_controller.get_developer_workload_report, start_date, end_date,
+            on_result=self._show_developer_workload_report,
+        )
+
+    def _show_developer_workload_report(self, result):
         if result['success']:
             report_data = result['data']
             self.current_report_data = report_data
@@ -289,9 +301,14 @@ class ReportsTab(QWidget):
         """
         Генерация отчета по статусу проектов
         """
-        # Получение отчета
-        result = self.report_controller.get_project_status_report()
-        
+        # Отчет формируется в рабочем потоке
+        self.project_status_report_browser.setHtml("<p>Формирование отчета...</p>")
+        self.loader.request(
+            'report:project_status', self.report_controller.get_project_status_report,
+            on_result=self._show_project_status_report,
+        )
+
+    def _show_project_status_report(self, result):
         if result['success']:
             report_data = result['data']
             self.current_report_data = report_data
@@ -359,9 +376,14 @@ class ReportsTab(QWidget):
         year = self.revenue_year_combo.currentData()
         month = self.revenue_month_combo.currentData()
         
-        # Получение отчета
-        result = self.report_controller.get_monthly_revenue_report(year, month)
-        
+        # Отчет формируется в рабочем потоке
+        self.revenue_report_browser.setHtml("<p>Формирование отчета...</p>")
+        self.loader.request(
+            'report:revenue', self.report_controller.get_monthly_revenue_report, year, month,
+            on_result=self._show_monthly_revenue_report,
+        )
+
+    def _show_monthly_revenue_report(self, result):
         if result['success']:
             report_data = result['data']
             self.current_report_data = report_data
@@ -464,12 +486,10 @@ class ReportsTab(QWidget):
                 )
                 
                 if file_path:
-                    # Экспорт в CSV
-                    result = self.export_controller.export_report_to_csv(self.current_report_data, file_path)
+                    # Экспорт в CSV идет в фоне, ход выполнения — в строке состояния
+                    result = self.export_controller.start_report_export(self.current_report_data, 'csv', file_path)
                     
-                    if result['success']:
-                        QMessageBox.information(self, "Успех", f"Отчет успешно экспортирован в {file_path}")
-                    else:
+                    if not result['success']:
                         QMessageBox.critical(self, "Ошибка", result['error_message'])
             
             elif export_format == "excel":
@@ -478,10 +498,8 @@ class ReportsTab(QWidget):
                 )
                 
                 if file_path:
-                    # Экспорт в Excel
-                    result = self.export_controller.export_report_to_excel(self.current_report_data, file_path)
+                    # Экспорт в Excel идет в фоне, ход выполнения — в строке состояния
+                    result = self.export_controller.start_report_export(self.current_report_data, 'excel', file_path)
                     
-                    if result['success']:
-                        QMessageBox.information(self, "Успех", f"Отчет успешно экспортирован в {file_path}")
-                    else:
+                    if not result['success']:
                         QMessageBox.critical(self, "Ошибка", result['error_message'])
@@ -358,17 +358,12 @@ class SettingsTab(QWidget):
             'font_size': self.font_size_spin.value(),
         }
 
-    def _refresh_main_window(self):
-        win = self.window()
-        if win and hasattr(win, 'apply_theme'):
-            win.apply_theme()
-
     def _preview_theme(self):
+        # apply_theme сам обновляет главное окно; собранные темы берутся из кэша
         from PyQt5.QtWidgets import QApplication
         app = QApplication.instance()
         if app:
             apply_theme(app, self._build_theme_config())
-            self._refresh_main_window()
 
     def choose_accent_color(self):
         """
@@ -409,7 +404,6 @@ class SettingsTab(QWidget):
         app = QApplication.instance()
         if app:
             apply_theme(app, config)
-            self._refresh_main_window()
 
         QMessageBox.information(self, "Успех", "Настройки интерфейса применены.")
 
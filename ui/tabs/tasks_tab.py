@@ -1,15 +1,18 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-                            QTableWidget, QTableWidgetItem, QHeaderView,
+                            QTableView, QHeaderView,
                             QLineEdit, QComboBox, QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QSettings
 
 from controllers import TaskController, ProjectController, DeveloperController, ExportController
 from ui.dialogs.task_dialog import TaskDialog
 from ui.widgets.tab_page import TabPage
 from ui.widgets.page_header import FilterPanel
 from ui.resources.icon_helper import get_icon
-from ui.resources.table_helper import configure_table, apply_task_row_colors, unhide_all_rows
+from ui.resources.table_helper import configure_table
 from ui.resources.combo_helper import reload_combo
+from ui.async_loader import AsyncLoader
+from ui.task_table_model import TaskTableModel, TaskSortProxyModel
+from ui.widgets.loading_overlay import LoadingOverlay
 
 
 class TasksTab(QWidget):
@@ -20,6 +23,10 @@ class TasksTab(QWidget):
         self.project_controller = ProjectController()
         self.developer_controller = DeveloperController()
         self.export_controller = ExportController()
+        self.loader = AsyncLoader(self)
+        self.page_size = 20
+        self.next_cursor = None
+        self._developer_id = None
         self.init_ui()
 
         if self.user.role == 'developer':
@@ -45,6 +52,12 @@ class TasksTab(QWidget):
         self.search_input.setMinimumWidth(200)
         self.search_input.textChanged.connect(self.apply_filters)
 
+        # Запрос к базе уходит, когда пользователь перестал печатать
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.load_tasks)
+
         project_label = QLabel("Проект:")
         self.project_combo = QComboBox()
         self.project_combo.setMinimumWidth(180)
@@ -71,17 +84,23 @@ class TasksTab(QWidget):
         fl.addStretch()
         main_layout.addWidget(filter_panel)
 
-        self.tasks_table = QTableWidget()
+        self.tasks_model = TaskTableModel(self)
+        self.tasks_proxy = TaskSortProxyModel(self)
+        self.tasks_proxy.setSourceModel(self.tasks_model)
+
+        self.tasks_table = QTableView()
         configure_table(self.tasks_table)
-        self.tasks_table.setProperty('task_status_col', 4)
-        self.tasks_table.setProperty('task_num_cols', 7)
-        self.tasks_table.setColumnCount(7)
-        self.tasks_table.setHorizontalHeaderLabels(["ID", "Проект", "Разработчик", "Описание", "Статус", "Часы", "Дата создания"])
+        self.tasks_table.setModel(self.tasks_proxy)
+        # Без индикатора сортировки строки идут в порядке страниц (недавно измененные сверху)
+        self.tasks_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.tasks_table.setSortingEnabled(True)
+        self.tasks_table.verticalScrollBar().valueChanged.connect(self._on_scroll)
         self.tasks_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.tasks_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tasks_table.doubleClicked.connect(self.edit_item)
         
         main_layout.addWidget(self.tasks_table)
+        self.loading_overlay = LoadingOverlay(self.tasks_table)
 
         buttons_layout = QHBoxLayout()
         self.add_button = QPushButton("Добавить")
@@ -101,6 +120,10 @@ class TasksTab(QWidget):
         self.refresh_button.setIcon(get_icon('refresh'))
         self.refresh_button.clicked.connect(self.refresh_data)
 
+        self.more_button = QPushButton("Показать ещё")
+        self.more_button.setEnabled(False)
+        self.more_button.clicked.connect(self.load_more_tasks)
+
         self.export_button = QPushButton("Экспорт")
         self.export_button.setIcon(get_icon('export'))
         self.export_button.clicked.connect(self.export_to_csv)
@@ -110,6 +133,7 @@ class TasksTab(QWidget):
         buttons_layout.addWidget(self.delete_button)
         buttons_layout.addWidget(self.refresh_button)
         buttons_layout.addStretch()
+        buttons_layout.addWidget(self.more_button)
         buttons_layout.addWidget(self.export_button)
         
         main_layout.addLayout(buttons_layout)
@@ -117,106 +141,125 @@ class TasksTab(QWidget):
         self.load_projects_and_developers()
         self.load_tasks()
 
-    def load_projects_and_developers(self):
+    def _fetch_projects_and_developers(self):
+        # Выполняется в рабочем потоке
+        projects, developers = [], None
         if self.user and self.user.role == 'developer':
             developer_result = self.developer_controller.get_developer_by_user_id(self.user.id)
             if developer_result['success'] and developer_result['data']:
                 developer = developer_result['data']
                 result = self.project_controller.get_projects_by_developer(developer.id)
                 projects = result['data'] if result.get('success') else []
-            else:
-                projects = []
-            reload_combo(
-                self.project_combo,
-                [(p.name, p.id) for p in projects],
-                first_label='Все',
-                first_data='',
-            )
         else:
             projects_result = self.project_controller.get_all_projects()
-            if projects_result['success']:
+            if not projects_result['success']:
+                projects = None
+            else:
                 projects = projects_result['data']
-                reload_combo(
-                    self.project_combo,
-                    [(p.name, p.id) for p in projects],
-                    first_label='Все',
-                    first_data='',
-                )
 
         if self.user.role != 'developer':
             developers_result = self.developer_controller.get_all_developers()
             if developers_result['success']:
                 developers = developers_result['data']
-                reload_combo(
-                    self.developer_combo,
-                    [(d.full_name, d.id) for d in developers],
-                    first_label='Все',
-                    first_data='',
-                )
+        return projects, developers
+
+    def load_projects_and_developers(self):
+        self.loader.request(
+            'filters', self._fetch_projects_and_developers,
+            on_result=self._show_projects_and_developers,
+        )
+
+    def _show_projects_and_developers(self, data):
+        projects, developers = data
+        if projects is not None:
+            reload_combo(
+                self.project_combo,
+                [(p.name, p.id) for p in projects],
+                first_label='Все',
+                first_data='',
+            )
+        if developers is not None:
+            reload_combo(
+                self.developer_combo,
+                [(d.full_name, d.id) for d in developers],
+                first_label='Все',
+                first_data='',
+            )
+
+    def _current_filters(self):
+        return {
+            'search_term': self.search_input.text().strip() or None,
+            'project_id': self.project_combo.currentData() or None,
+            'developer_id': self.developer_combo.currentData() or None,
+            'status': self.status_combo.currentData() or None,
+        }
+
+    def _fetch_task_page(self, filters, cursor):
+        # Выполняется в рабочем потоке
+        if self.user.role == 'developer':
+            if self._developer_id is None:
+                developer_result = self.developer_controller.get_developer_by_user_id(self.user.id)
+                if not (developer_result['success'] and developer_result['data']):
+                    return {'success': True, 'data': {'tasks': [], 'next_cursor': None}}
+                self._developer_id = developer_result['data'].id
+            filters = dict(filters, developer_id=self._developer_id)
+        return self.task_controller.search_tasks_page(limit=self.page_size, cursor=cursor, **filters)
 
     def load_tasks(self):
-        self.tasks_table.setRowCount(0)
+        """
+        Загружает первую страницу задач с текущими фильтрами
+        """
+        self.search_timer.stop()
+        self.loader.cancel('tasks:more')
+        # Настройка «Строк на странице» из вкладки настроек
+        self.page_size = int(QSettings("KABAN", "KABAN:manager").value("rows_per_page", 20))
+        self.loading_overlay.set_loading(True)
+        self.loader.request(
+            'tasks', self._fetch_task_page, self._current_filters(), None,
+            on_result=self._show_tasks,
+            on_error=lambda error: self.loading_overlay.set_loading(False),
+        )
 
+    def load_more_tasks(self):
+        """
+        Дописывает следующую страницу задач
+        """
+        if self.next_cursor is None or self.loader.is_loading('tasks') or self.loader.is_loading('tasks:more'):
+            return
+        self.loader.request(
+            'tasks:more', self._fetch_task_page, self._current_filters(), self.next_cursor,
+            on_result=self._append_tasks,
+        )
+
+    def _on_scroll(self, value):
+        if value >= self.tasks_table.verticalScrollBar().maximum() - 2:
+            self.load_more_tasks()
+
+    def _show_tasks(self, result):
         try:
-            if self.user.role == 'developer':
-                developer_result = self.developer_controller.get_developer_by_user_id(self.user.id)
-                if developer_result['success'] and developer_result['data']:
-                    result = self.task_controller.get_tasks_by_developer(developer_result['data'].id)
-                else:
-                    result = {'success': True, 'data': []}
-            else:
-                result = self.task_controller.get_all_tasks()
+            page = result['data'] if result['success'] else {'tasks': [], 'next_cursor': None}
+            self.tasks_model.set_tasks(page['tasks'])
+            self._set_next_cursor(page['next_cursor'])
+        finally:
+            self.loading_overlay.set_loading(False)
 
-            if result['success']:
-                for i, task in enumerate(result['data']):
-                    self.tasks_table.insertRow(i)
-
-                    id_item = QTableWidgetItem(str(task.id))
-                    project_item = QTableWidgetItem(getattr(task, 'project_name', None) or 'Неизвестный проект')
-                    developer_item = QTableWidgetItem(getattr(task, 'developer_name', None) or 'Не назначен')
-                    description_item = QTableWidgetItem(task.description or '')
-                    status_item = QTableWidgetItem(task.status or '')
-                    hours_item = QTableWidgetItem(str(task.hours_worked or 0))
-                    created_item = QTableWidgetItem(str(getattr(task, 'created_at', None) or ''))
-
-                    id_item.setData(Qt.UserRole, task.id)
-                    project_item.setData(Qt.UserRole, task.project_id)
-                    developer_item.setData(Qt.UserRole, task.developer_id)
-
-                    self.tasks_table.setItem(i, 0, id_item)
-                    self.tasks_table.setItem(i, 1, project_item)
-                    self.tasks_table.setItem(i, 2, developer_item)
-                    self.tasks_table.setItem(i, 3, description_item)
-                    self.tasks_table.setItem(i, 4, status_item)
-                    self.tasks_table.setItem(i, 5, hours_item)
-                    self.tasks_table.setItem(i, 6, created_item)
-
-            apply_task_row_colors(self.tasks_table, status_col=4, num_cols=7)
-            unhide_all_rows(self.tasks_table)
-        except Exception:
-            pass
+    def _append_tasks(self, result):
+        if result['success']:
+            self.tasks_model.append_tasks(result['data']['tasks'])
+            self._set_next_cursor(result['data']['next_cursor'])
+
+    def _set_next_cursor(self, cursor):
+        self.next_cursor = cursor
+        self.more_button.setEnabled(cursor is not None)
 
     def apply_filters(self):
-        search_text = self.search_input.text().lower()
-        project_id = self.project_combo.currentData()
-        developer_id = self.developer_combo.currentData()
-        status = self.status_combo.currentData()
-
-        for row in range(self.tasks_table.rowCount()):
-            project_item = self.tasks_table.item(row, 1)
-            developer_item = self.tasks_table.item(row, 2)
-            description = self.tasks_table.item(row, 3).text().lower()
-            task_status = self.tasks_table.item(row, 4).text()
-            task_project_id = project_item.data(Qt.UserRole)
-            task_developer_id = developer_item.data(Qt.UserRole)
-
-            should_show = (
-                search_text in description
-                and (not project_id or task_project_id == project_id)
-                and (not developer_id or task_developer_id == developer_id)
-                and (not status or task_status == status)
-            )
-            self.tasks_table.setRowHidden(row, not should_show)
+        self.search_timer.start()
+
+    def _selected_row(self):
+        rows = self.tasks_table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.tasks_proxy.mapToSource(rows[0]).row()
 
     def add_item(self):
         dialog = TaskDialog(self)
@@ -236,13 +279,12 @@ class TasksTab(QWidget):
                 QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def edit_item(self):
-        selected_rows = self.tasks_table.selectedItems()
-        if not selected_rows:
+        row = self._selected_row()
+        if row is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите задачу для редактирования")
             return
 
-        row = selected_rows[0].row()
-        task_id = int(self.tasks_table.item(row, 0).text())
+        task_id = self.tasks_model.task_id(row)
         result = self.task_controller.get_task_by_id(task_id)
 
         if result['success']:
@@ -265,14 +307,13 @@ class TasksTab(QWidget):
             QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def delete_item(self):
-        selected_rows = self.tasks_table.selectedItems()
-        if not selected_rows:
+        row = self._selected_row()
+        if row is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите задачу для удаления")
             return
 
-        row = selected_rows[0].row()
-        task_id = int(self.tasks_table.item(row, 0).text())
-        task_description = self.tasks_table.item(row, 3).text()
+        task_id = self.tasks_model.task_id(row)
+        task_description = self.tasks_model.store.descriptions[row]
 
         reply = QMessageBox.question(
             self, "Подтверждение",
@@ -289,27 +330,27 @@ class TasksTab(QWidget):
                 QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def refresh_data(self):
+        # Повторные вызовы подряд объединяются загрузчиком в один запрос
         self.load_tasks()
         self.load_projects_and_developers()
-        self.apply_filters()
+
+    def _export_filters(self):
+        filters = self._current_filters()
+        if self.user.role == 'developer':
+            filters['developer_id'] = self._developer_id or -1
+        return filters
 
     def export_to_csv(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Сохранить CSV", "", "CSV Files (*.csv);;All Files (*)"
+            self, "Сохранить CSV", "", "CSV Files (*.csv);;CSV gzip (*.csv.gz);;All Files (*)"
         )
         if not file_path:
             return
 
-        headers = ["ID", "Проект", "Разработчик", "Описание", "Статус", "Часы", "Дата создания"]
-        data = []
-        for row in range(self.tasks_table.rowCount()):
-            if not self.tasks_table.isRowHidden(row):
-                data.append([self.tasks_table.item(row, col).text() for col in range(self.tasks_table.columnCount())])
-
-        result = self.export_controller.export_data_to_csv(data, headers, file_path)
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        # Выгружаются все строки по текущим фильтрам; экспорт идет в фоне,
+        # ход выполнения показывается в строке состояния главного окна
+        result = self.export_controller.start_query_export('tasks', self._export_filters(), 'csv', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
 
     def export_to_excel(self):
@@ -319,14 +360,6 @@ class TasksTab(QWidget):
         if not file_path:
             return
 
-        headers = ["ID", "Проект", "Разработчик", "Описание", "Статус", "Часы", "Дата создания"]
-        data = []
-        for row in range(self.tasks_table.rowCount()):
-            if not self.tasks_table.isRowHidden(row):
-                data.append([self.tasks_table.item(row, col).text() for col in range(self.tasks_table.columnCount())])
-
-        result = self.export_controller.export_data_to_excel(data, headers, file_path, "Задачи")
-        if result['success']:
-            QMessageBox.information(self, "Успех", f"Данные успешно экспортированы в {file_path}")
-        else:
+        result = self.export_controller.start_query_export('tasks', self._export_filters(), 'excel', file_path)
+        if not result['success']:
             QMessageBox.critical(self, "Ошибка", result['error_message'])
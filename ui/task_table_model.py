@@ -0,0 +1,153 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QBrush, QColor
+
+from models.task_row import TaskRows
+from ui.resources.table_helper import task_status_backgrounds, text_color
+
+
+class TaskStore(TaskRows):
+    """
+    Компактное хранилище списка задач по столбцам (TaskRows) с подписями для таблицы
+
+    На строку не создается ни одного объекта: числа лежат в массивах array,
+    тексты — в буферах UTF-8, названия проектов и имена разработчиков —
+    в справочниках по ID.
+    """
+
+    def project_name(self, row):
+        return self.project_names.get(self.project_ids[row]) or 'Неизвестный проект'
+
+    def developer_name(self, row):
+        return self.developer_names.get(self.developer_ids[row]) or 'Не назначен'
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Модель таблицы задач поверх TaskStore
+
+    Цвета строк не хранятся в ячейках: data() отдает их по статусу строки,
+    поэтому смена темы сводится к пересчету нескольких кистей.
+    """
+    HEADERS = ["ID", "Проект", "Разработчик", "Описание", "Статус", "Часы", "Дата создания"]
+    STATUS_COLUMN = 4
+
+    # Значение для сортировки (числа сортируются как числа)
+    SORT_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = TaskStore()
+        self._foreground = None
+        self._backgrounds = {}
+        self.refresh_theme(notify=False)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        store = self.store
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(store.ids[row])
+            if col == 1:
+                return store.project_name(row)
+            if col == 2:
+                return store.developer_name(row)
+            if col == 3:
+                return store.descriptions[row]
+            if col == 4:
+                return store.status(row)
+            if col == 5:
+                return str(store.hours[row])
+            return store.created[row]
+        if role == Qt.BackgroundRole:
+            return self._backgrounds.get(store.status_codes[row])
+        if role == Qt.ForegroundRole:
+            return self._foreground
+        if role == Qt.UserRole:
+            if col == 1:
+                return store.project_ids[row] or None
+            if col == 2:
+                return store.developer_ids[row] or None
+            return store.ids[row]
+        if role == self.SORT_ROLE:
+            if col == 0:
+                return store.ids[row]
+            if col == 5:
+                return store.hours[row]
+            return self.data(index, Qt.DisplayRole)
+        return None
+
+    def set_tasks(self, tasks):
+        """
+        Заменяет содержимое модели списком задач
+        """
+        self.beginResetModel()
+        self.store.clear()
+        self.store.extend(tasks)
+        self._update_backgrounds()
+        self.endResetModel()
+
+    def append_tasks(self, tasks):
+        """
+        Дописывает задачи в конец модели
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+        start = len(self.store)
+        self.beginInsertRows(QModelIndex(), start, start + len(tasks) - 1)
+        self.store.extend(tasks)
+        self._update_backgrounds()
+        self.endInsertRows()
+
+    def _update_backgrounds(self):
+        colors = task_status_backgrounds()
+        self._backgrounds = {
+            code: QBrush(QColor(colors[status]))
+            for code, status in enumerate(self.store._statuses)
+            if status in colors
+        }
+
+    def refresh_theme(self, notify=True):
+        """
+        Пересчитывает цвета после смены темы
+
+        Перерисовываются только видимые ячейки.
+        """
+        self._foreground = QBrush(text_color())
+        self._update_backgrounds()
+        if notify and len(self.store):
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.store) - 1, len(self.HEADERS) - 1),
+                [Qt.BackgroundRole, Qt.ForegroundRole]
+            )
+
+    def task_id(self, row):
+        return self.store.ids[row]
+
+
+class TaskSortProxyModel(QSortFilterProxyModel):
+    """
+    Сортировка таблицы задач
+
+    Фильтры применяются в запросе (TaskService.search_tasks_page), прокси
+    только сортирует загруженные строки по SORT_ROLE.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(TaskTableModel.SORT_ROLE)
@@ -1,5 +1,7 @@
 from ui.widgets.sidebar import Sidebar
 from ui.widgets.page_header import PageHeader, FilterPanel
 from ui.widgets.tab_page import TabPage
+from ui.widgets.loading_overlay import LoadingOverlay
+from ui.widgets.export_status import ExportStatus
 
-__all__ = ['Sidebar', 'PageHeader', 'FilterPanel', 'TabPage']
+__all__ = ['Sidebar', 'PageHeader', 'FilterPanel', 'TabPage', 'LoadingOverlay', 'ExportStatus']
@@ -0,0 +1,78 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QToolButton
+from PyQt5.QtCore import pyqtSignal
+
+from export_jobs import ExportJob
+from ui.export_signals import ExportSignals
+
+
+class ExportStatus(QWidget):
+    """
+    Ход фоновых экспортов в строке состояния
+
+    Показывает текущую выгрузку (число записанных строк и длину очереди)
+    и кнопку отмены; скрывается, когда очередь пуста.
+    """
+
+    # Сообщение о завершении выгрузки для строки состояния
+    finished = pyqtSignal(str)
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self._current_id = None
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self.label = QLabel()
+        layout.addWidget(self.label)
+
+        # Число строк заранее неизвестно, поэтому индикатор без шкалы
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 0)
+        self.progress.setMaximumWidth(120)
+        self.progress.setMaximumHeight(14)
+        self.progress.setTextVisible(False)
+        layout.addWidget(self.progress)
+
+        self.cancel_button = QToolButton()
+        self.cancel_button.setText('Отменить')
+        self.cancel_button.clicked.connect(self.cancel_current)
+        layout.addWidget(self.cancel_button)
+
+        self.signals = ExportSignals(manager, self)
+        self.signals.job_changed.connect(self._on_job_changed)
+        self.hide()
+
+    def _on_job_changed(self, job):
+        self._refresh()
+        if job.status == ExportJob.DONE:
+            self.finished.emit(f"Экспорт «{job.title}» завершен: {job.rows} строк, {job.filename}")
+        elif job.status == ExportJob.FAILED:
+            self.finished.emit(f"Ошибка экспорта «{job.title}»: {job.error}")
+        elif job.status == ExportJob.CANCELLED:
+            self.finished.emit(f"Экспорт «{job.title}» отменен")
+
+    def _refresh(self):
+        active = self.manager.jobs(active_only=True)
+        if not active:
+            self._current_id = None
+            self.hide()
+            return
+
+        running = [job for job in active if job.status == ExportJob.RUNNING]
+        job = running[-1] if running else active[-1]
+        self._current_id = job.id
+        text = f"Экспорт «{job.title}»: {job.rows} строк"
+        if len(active) > 1:
+            text += f" (в очереди еще {len(active) - 1})"
+        self.label.setText(text)
+        self.show()
+
+    def cancel_current(self):
+        if self._current_id is not None:
+            self.manager.cancel(self._current_id)
+
+    def detach(self):
+        self.signals.detach()
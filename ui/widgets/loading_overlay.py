@@ -0,0 +1,36 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QEvent
+
+from ui.resources.styles import TEXT_SECONDARY
+
+
+class LoadingOverlay(QLabel):
+    """
+    Надпись «Загрузка...» поверх виджета, пока данные грузятся в фоне
+    """
+
+    def __init__(self, target, text='Загрузка...'):
+        super().__init__(text, target)
+        self.setObjectName('loading_overlay')
+        self.setAlignment(Qt.AlignCenter)
+        self.setFont(QFont('Segoe UI', 12))
+        self.setStyleSheet(
+            f"QLabel#loading_overlay {{ color: {TEXT_SECONDARY}; background: rgba(255, 255, 255, 150); border: none; }}"
+        )
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+        target.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+        return super().eventFilter(obj, event)
+
+    def set_loading(self, loading):
+        if loading:
+            self.setGeometry(self.parent().rect())
+            self.raise_()
+            self.show()
+        else:
+            self.hide()